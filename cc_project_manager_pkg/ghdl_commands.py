@@ -6,10 +6,57 @@ elaborating, and running simulations for VHDL files.
 import os
 import yaml
 import logging
+import shutil
 import subprocess
+import time
+from functools import cached_property
 from .toolchain_manager import ToolChainManager
 from typing import List, Optional, Dict, Union, Tuple
 import re
+from string import Template
+from types import MappingProxyType
+
+# Matches a line starting with "entity <name>" (same rule as the old line-by-line scan)
+_ENTITY_LINE_RE = re.compile(r'^[^\S\n]*entity [^\S\n]*(\S+)', re.IGNORECASE | re.MULTILINE)
+# Entity declarations normally sit near the top of a file; scan this many characters first
+_ENTITY_SCAN_CHARS = 16384
+
+# Post-synthesis Verilog testbench skeleton. Optional sections (signals, clock,
+# initial values, reset release) are pre-rendered as whole lines ending in "\n"
+_VERILOG_TB_TEMPLATE = Template("""\
+`timescale 1ns/1ps
+
+module ${entity}_post_synth_tb;
+
+    // Testbench signals
+${signals}
+    // Instantiate the synthesized ${entity}
+    ${entity} uut (
+${connections}
+    );
+
+${clock}    // VCD dump for waveform viewing
+    initial begin
+        $$dumpfile("${entity}_post_synth_tb.vcd");
+        $$dumpvars(0, ${entity}_post_synth_tb);
+    end
+
+    // Test stimulus
+    initial begin
+        $$display("=== Post-Synthesis Simulation of ${entity} ===");
+
+${inits}
+        // Release reset if present
+        #100;
+${reset}
+        // Run simulation for multiple cycles
+        #2000;
+
+        $$display("=== Post-Synthesis Simulation of ${entity} Complete ===");
+        $$finish;
+    end
+
+endmodule""")
 
 class GHDLCommands(ToolChainManager):
     """Provides methods to work with GHDL 5.0.1 for VHDL simulation.
@@ -30,6 +77,30 @@ class GHDLCommands(ToolChainManager):
         "mentor": "--ieee=mentor",     # Alternative implementation
         "none": "--ieee=none"          # No IEEE libraries (minimal)
     }
+    # Upper bound in seconds for a single GHDL/simulator invocation, so a hung
+    # simulation can't wedge a batch flow
+    GHDL_TIMEOUT = 600
+    # Seconds the existing-file map of _hierarchy_abs_paths is reused before the
+    # files are checked again
+    HIERARCHY_STAT_TTL = 5.0
+
+    # Fallback interfaces used when no testbench interface can be extracted.
+    # Read-only; callers that need to modify one should copy.deepcopy() it
+    _STATE_MACHINE_INTERFACE = MappingProxyType({
+        'ports': (
+            MappingProxyType({'name': 'clk', 'direction': 'input', 'width': 1}),
+            MappingProxyType({'name': 'rst', 'direction': 'input', 'width': 1}),
+            MappingProxyType({'name': 'red', 'direction': 'output', 'width': 1}),
+            MappingProxyType({'name': 'yellow', 'direction': 'output', 'width': 1}),
+            MappingProxyType({'name': 'green', 'direction': 'output', 'width': 1}),
+        )
+    })
+    _MINIMAL_INTERFACE = MappingProxyType({
+        'ports': (
+            MappingProxyType({'name': 'clk', 'direction': 'input', 'width': 1}),
+            MappingProxyType({'name': 'rst', 'direction': 'input', 'width': 1}),
+        )
+    })
 
     def __init__(self, vhdl_std: str = "VHDL-2008", ieee_lib : str = "synopsys", work_lib_name: Optional[str] = "work"):
         """
@@ -124,6 +195,86 @@ class GHDLCommands(ToolChainManager):
 
         return ghdl_access
 
+    def _run(self, cmd: List[str], check: bool = False, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        Run a GHDL/simulator command and capture its output as raw bytes.
+
+        Output is only decoded when it is logged (see _decode), so large simulator
+        output isn't run through the locale codec on every call.
+
+        Args:
+            cmd: Command and arguments to execute
+            check: Raise CalledProcessError on a non-zero exit code
+            timeout: Seconds before the process is killed. Defaults to GHDL_TIMEOUT
+
+        Returns:
+            subprocess.CompletedProcess: Result with bytes stdout/stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        if timeout is None:
+            timeout = self.GHDL_TIMEOUT
+        return subprocess.run(cmd, check=check, capture_output=True, timeout=timeout)
+
+    @staticmethod
+    def _decode(output: Optional[bytes]) -> str:
+        """Decode captured process output for logging, replacing undecodable bytes."""
+        return output.decode("utf-8", "replace") if output else ""
+
+    @cached_property
+    def _src_files(self) -> Dict[str, str]:
+        """Source files registered in the HDL project hierarchy."""
+        return self.config.get("hdl_project_hierarchy", {}).get("src", {})
+
+    @cached_property
+    def _tb_files(self) -> Dict[str, str]:
+        """Testbench files registered in the HDL project hierarchy."""
+        return self.config.get("hdl_project_hierarchy", {}).get("testbench", {})
+
+    def _hierarchy_abs_paths(self, section: str) -> Dict[str, str]:
+        """
+        Map file name to absolute path for the existing files of a hierarchy section.
+
+        The map is built per section from the in-memory config, dropping files that
+        don't exist, and reused so lookups are plain dict hits. It is rebuilt once
+        it is older than HIERARCHY_STAT_TTL, so files created or deleted since are
+        picked up, and whenever the hierarchy cache is invalidated (see update_config).
+
+        Args:
+            section: Hierarchy section, "src" or "testbench"
+
+        Returns:
+            dict: {file_name: absolute_path} for files that exist
+        """
+        cache = self.__dict__.setdefault("_abs_path_cache", {})
+        now = time.monotonic()
+        cached = cache.get(section)
+        if cached is not None and now - cached[0] < self.HIERARCHY_STAT_TTL:
+            return cached[1]
+
+        files = self._src_files if section == "src" else self._tb_files
+        # Relative paths resolve against the working directory at build time
+        project_root = self.config.get("project_path") or os.getcwd()
+        abs_paths = {}
+        for file_name, file_path in files.items():
+            # Handle relative paths
+            if not os.path.isabs(file_path):
+                file_path = os.path.join(project_root, file_path)
+            if os.path.exists(file_path):
+                abs_paths[file_name] = file_path
+        cache[section] = (now, abs_paths)
+        return abs_paths
+
+    def _invalidate_hierarchy_cache(self):
+        """Drop cached hierarchy lookups so they are rebuilt from the current config."""
+        for attr in ("_src_files", "_tb_files", "_abs_path_cache"):
+            self.__dict__.pop(attr, None)
+
+    def update_config(self):
+        """Write current configuration to config file and drop cached hierarchy lookups."""
+        self._invalidate_hierarchy_cache()
+        return super().update_config()
 
     def _add_ghdl_log(self):
         """Add GHDL commands log file path to the project configuration.
@@ -214,6 +365,30 @@ class GHDLCommands(ToolChainManager):
             ```
         """
         # Build GHDL analysis command
+        ghdl_cmd = self._build_analyze_cmd(options)
+            
+        # Add the VHDL file to analyze
+        ghdl_cmd.append(vhdl_file)
+        
+        self.ghdl_logger.info(f"Analyzing VHDL file: {vhdl_file}")
+        self.ghdl_logger.debug(f"GHDL Command: {' '.join(ghdl_cmd)}")
+
+        try:
+            result = self._run(ghdl_cmd, check=True)
+            self.ghdl_logger.info(f"Successfully analyzed {vhdl_file}")
+            if result.stdout:
+                self.ghdl_logger.info(f"GHDL CMD: {self._decode(result.stdout)}")
+            return True
+        except subprocess.CalledProcessError as e:
+            self.ghdl_logger.error(f"GHDL analysis failed for {vhdl_file}: {e}")
+            self.ghdl_logger.error(f"STDERR: {self._decode(e.stderr)}")
+            return False
+        except subprocess.TimeoutExpired as e:
+            self.ghdl_logger.error(f"GHDL analysis timed out for {vhdl_file} after {e.timeout} seconds")
+            return False
+
+    def _build_analyze_cmd(self, options: Optional[List[str]] = None) -> List[str]:
+        """Build the GHDL analyze command up to, but not including, the VHDL file(s)."""
         ghdl_cmd = [self.ghdl_access, "analyze"]
         
         # Add standard VHDL version
@@ -232,22 +407,44 @@ class GHDLCommands(ToolChainManager):
         # Add any other specified options
         if options:
             ghdl_cmd.extend(options)
+        
+        return ghdl_cmd
+
+    def _analyze_group(self, vhdl_files: List[str], options: Optional[List[str]] = None) -> bool:
+        """
+        Analyze a group of VHDL files with a single GHDL invocation.
+        
+        GHDL accepts several files per analyze call and updates the work library
+        once, so a group of files only pays the process startup cost once. Files
+        are analyzed in the order given.
+        
+        Args:
+            vhdl_files: Paths to the VHDL files to analyze
+            options: Additional command-line options for GHDL analysis
             
-        # Add the VHDL file to analyze
-        ghdl_cmd.append(vhdl_file)
+        Returns:
+            bool: True if analysis successful, False otherwise
+        """
+        if not vhdl_files:
+            return True
         
-        self.ghdl_logger.info(f"Analyzing VHDL file: {vhdl_file}")
+        ghdl_cmd = self._build_analyze_cmd(options) + list(vhdl_files)
+        
+        self.ghdl_logger.info(f"Analyzing {len(vhdl_files)} VHDL files: {', '.join(vhdl_files)}")
         self.ghdl_logger.debug(f"GHDL Command: {' '.join(ghdl_cmd)}")
-
+        
         try:
-            result = subprocess.run(ghdl_cmd, check=True, capture_output=True, text=True)
-            self.ghdl_logger.info(f"Successfully analyzed {vhdl_file}")
+            result = self._run(ghdl_cmd, check=True)
+            self.ghdl_logger.info(f"Successfully analyzed {len(vhdl_files)} files")
             if result.stdout:
-                self.ghdl_logger.info(f"GHDL CMD: {result.stdout}")
+                self.ghdl_logger.info(f"GHDL CMD: {self._decode(result.stdout)}")
             return True
         except subprocess.CalledProcessError as e:
-            self.ghdl_logger.error(f"GHDL analysis failed for {vhdl_file}: {e}")
-            self.ghdl_logger.error(f"STDERR: {e.stderr}")
+            self.ghdl_logger.error(f"GHDL analysis failed for group {vhdl_files}: {e}")
+            self.ghdl_logger.error(f"STDERR: {self._decode(e.stderr)}")
+            return False
+        except subprocess.TimeoutExpired as e:
+            self.ghdl_logger.error(f"GHDL analysis timed out for group {vhdl_files} after {e.timeout} seconds")
             return False
 
     def elaborate(self, top_entity : str, options : Optional[List[str]] = None)-> bool:
@@ -319,14 +516,17 @@ class GHDLCommands(ToolChainManager):
         self.ghdl_logger.info(f"Running GHDL elaborate on {top_entity}")
         self.ghdl_logger.debug(f"GHDL Command: {' '.join(ghdl_elab_cmd)}")
         try:
-            result = subprocess.run(ghdl_elab_cmd, check=True, capture_output=True, text=True)
+            result = self._run(ghdl_elab_cmd, check=True)
             self.ghdl_logger.info(f"Successfully elaborated {top_entity}")
             if result.stdout:
-                self.ghdl_logger.info(f"GHDL CMD: {result.stdout}")
+                self.ghdl_logger.info(f"GHDL CMD: {self._decode(result.stdout)}")
             return True
         except subprocess.CalledProcessError as e:
             self.ghdl_logger.error(f"GHDL elaborate failed for {top_entity}: {e}")
-            self.ghdl_logger.error(f"STDERR: {e.stderr}")
+            self.ghdl_logger.error(f"STDERR: {self._decode(e.stderr)}")
+            return False
+        except subprocess.TimeoutExpired as e:
+            self.ghdl_logger.error(f"GHDL elaborate timed out for {top_entity} after {e.timeout} seconds")
             return False
 
     def behavioral_simulation(self, top_entity: str, options: Optional[List[str]] = None, 
@@ -437,14 +637,17 @@ class GHDLCommands(ToolChainManager):
         self.ghdl_logger.debug(f"GHDL Command: {' '.join(ghdl_run_cmd)}")
         
         try:
-            result = subprocess.run(ghdl_run_cmd, check=True, capture_output=True, text=True)
+            result = self._run(ghdl_run_cmd, check=True)
             self.ghdl_logger.info(f"Successfully simulated {top_entity}")
             if result.stdout:
-                self.ghdl_logger.info(f"Simulation output: {result.stdout}")
+                self.ghdl_logger.info(f"Simulation output: {self._decode(result.stdout)}")
             return True
         except subprocess.CalledProcessError as e:
             self.ghdl_logger.error(f"GHDL simulation failed for {top_entity}: {e}")
-            self.ghdl_logger.error(f"STDERR: {e.stderr}")
+            self.ghdl_logger.error(f"STDERR: {self._decode(e.stderr)}")
+            return False
+        except subprocess.TimeoutExpired as e:
+            self.ghdl_logger.error(f"GHDL simulation timed out for {top_entity} after {e.timeout} seconds")
             return False
 
     # Alias for backward compatibility
@@ -509,10 +712,10 @@ class GHDLCommands(ToolChainManager):
             # 3. Step 1: Analyze original VHDL source
             self.ghdl_logger.info("Step 1: Analyzing original VHDL source...")
             cmd = [self.ghdl_access, "-a"] + get_standard_options() + [vhdl_file]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self._run(cmd)
             
             if result.returncode != 0:
-                self.ghdl_logger.error(f"Analysis of original VHDL failed: {result.stderr}")
+                self.ghdl_logger.error(f"Analysis of original VHDL failed: {self._decode(result.stderr)}")
                 return False
             
             self.ghdl_logger.info("Original VHDL analysis successful")
@@ -521,14 +724,14 @@ class GHDLCommands(ToolChainManager):
             self.ghdl_logger.info("Step 2: Synthesizing to VHDL netlist...")
             synth_file = os.path.join(synth_dir, f"{entity_name}_synth_vhdl.vhd")
             cmd = [self.ghdl_access, "synth", "--out=vhdl"] + get_standard_options() + [entity_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self._run(cmd)
             
             if result.returncode != 0:
-                self.ghdl_logger.error(f"VHDL synthesis failed: {result.stderr}")
+                self.ghdl_logger.error(f"VHDL synthesis failed: {self._decode(result.stderr)}")
                 return False
             
             # Save synthesized VHDL to file with proper encoding
-            with open(synth_file, "w", encoding="utf-8") as f:
+            with open(synth_file, "wb") as f:
                 f.write(result.stdout)
             
             self.ghdl_logger.info(f"VHDL synthesis successful - saved to: {synth_file}")
@@ -536,10 +739,10 @@ class GHDLCommands(ToolChainManager):
             # 5. Step 3: Analyze synthesized VHDL
             self.ghdl_logger.info("Step 3: Analyzing synthesized VHDL...")
             cmd = [self.ghdl_access, "-a"] + get_standard_options() + [synth_file]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self._run(cmd)
             
             if result.returncode != 0:
-                self.ghdl_logger.error(f"Analysis of synthesized VHDL failed: {result.stderr}")
+                self.ghdl_logger.error(f"Analysis of synthesized VHDL failed: {self._decode(result.stderr)}")
                 return False
             
             self.ghdl_logger.info("Synthesized VHDL analysis successful")
@@ -566,10 +769,10 @@ class GHDLCommands(ToolChainManager):
             
             self.ghdl_logger.info(f"Step 4: Analyzing VHDL testbench: {testbench_file}")
             cmd = [self.ghdl_access, "-a"] + get_standard_options() + [testbench_file]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self._run(cmd)
             
             if result.returncode != 0:
-                self.ghdl_logger.error(f"Analysis of testbench failed: {result.stderr}")
+                self.ghdl_logger.error(f"Analysis of testbench failed: {self._decode(result.stderr)}")
                 return False
             
             self.ghdl_logger.info(f"Testbench analysis successful - entity: {testbench_name}")
@@ -577,10 +780,10 @@ class GHDLCommands(ToolChainManager):
             # 7. Step 5: Elaborate testbench
             self.ghdl_logger.info("Step 5: Elaborating testbench with synthesized entity...")
             cmd = [self.ghdl_access, "-e"] + get_standard_options() + [testbench_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self._run(cmd)
             
             if result.returncode != 0:
-                self.ghdl_logger.error(f"Elaboration failed: {result.stderr}")
+                self.ghdl_logger.error(f"Elaboration failed: {self._decode(result.stderr)}")
                 return False
             
             self.ghdl_logger.info("Elaboration successful")
@@ -629,7 +832,7 @@ class GHDLCommands(ToolChainManager):
                 os.chdir(project_path)
                 self.ghdl_logger.debug(f"Changed working directory to: {project_path}")
                 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = self._run(cmd)
                 
                 # Verify VCD file was created
                 if result.returncode == 0:
@@ -642,9 +845,12 @@ class GHDLCommands(ToolChainManager):
                         local_vcd = f"{entity_name}_vhdl_post_synth.vcd"
                         if os.path.exists(local_vcd):
                             self.ghdl_logger.info(f"Found VCD file in working directory: {local_vcd}")
-                            # Move it to the correct location
-                            import shutil
-                            shutil.move(local_vcd, vcd_file)
+                            # Move it to the correct location. A plain rename is atomic and
+                            # size-independent; only fall back to copy+delete across devices
+                            try:
+                                os.replace(local_vcd, vcd_file)
+                            except OSError:
+                                shutil.move(local_vcd, vcd_file)
                             self.ghdl_logger.info(f"Moved VCD file to correct location: {vcd_file}")
                 
             finally:
@@ -652,16 +858,17 @@ class GHDLCommands(ToolChainManager):
                 self.ghdl_logger.debug(f"Restored working directory to: {original_cwd}")
             
             if result.returncode != 0:
-                self.ghdl_logger.error(f"Post-synthesis simulation failed: {result.stderr}")
+                self.ghdl_logger.error(f"Post-synthesis simulation failed: {self._decode(result.stderr)}")
                 return False
             
             self.ghdl_logger.info("Post-synthesis simulation successful!")
             self.ghdl_logger.info(f"VCD file: {vcd_file}")
             
             # Log simulation output
-            if result.stdout.strip():
+            sim_output = self._decode(result.stdout).strip()
+            if sim_output:
                 self.ghdl_logger.info("Simulation output:")
-                for line in result.stdout.strip().split('\n'):
+                for line in sim_output.split('\n'):
                     self.ghdl_logger.info(f"    {line}")
             
             self.ghdl_logger.info("VHDL POST-SYNTHESIS SIMULATION COMPLETE!")
@@ -702,117 +909,61 @@ class GHDLCommands(ToolChainManager):
     def _generate_verilog_testbench_content(self, entity_name: str, interface: Dict) -> str:
         """Generate Verilog testbench content."""
         
-        lines = [
-            "`timescale 1ns/1ps",
-            "",
-            f"module {entity_name}_post_synth_tb;",
-            "",
-            "    // Testbench signals"
-        ]
+        ports = interface.get('ports', [])
         
         # Declare signals based on interface
-        for port in interface.get('ports', []):
+        signals = []
+        for port in ports:
             port_type = "reg" if port['direction'] == 'input' else "wire"
             if port.get('width', 1) > 1:
-                lines.append(f"    {port_type} [{port['width']-1}:0] {port['name']};")
+                signals.append(f"    {port_type} [{port['width']-1}:0] {port['name']};\n")
             else:
-                lines.append(f"    {port_type} {port['name']};")
-        
-        lines.extend([
-            "",
-            f"    // Instantiate the synthesized {entity_name}",
-            f"    {entity_name} uut ("
-        ])
+                signals.append(f"    {port_type} {port['name']};\n")
         
         # Port connections
-        port_connections = []
-        for port in interface.get('ports', []):
-            port_connections.append(f"        .{port['name']}({port['name']})")
-        
-        lines.append(",\n".join(port_connections))
-        lines.extend([
-            "    );",
-            ""
-        ])
+        connections = ",\n".join(f"        .{port['name']}({port['name']})" for port in ports)
         
         # Add clock generation if there's a clock
-        clock_ports = [p for p in interface.get('ports', []) if 'clk' in p['name'].lower()]
+        clock = ""
+        clock_ports = [p for p in ports if 'clk' in p['name'].lower()]
         if clock_ports:
             clock_name = clock_ports[0]['name']
-            lines.extend([
-                "    // Clock generation",
-                f"    always #10 {clock_name} = ~{clock_name};",
-                ""
-            ])
-        
-        # Add VCD dump and basic stimulus
-        lines.extend([
-            "    // VCD dump for waveform viewing",
-            "    initial begin",
-            f"        $dumpfile(\"{entity_name}_post_synth_tb.vcd\");",
-            f"        $dumpvars(0, {entity_name}_post_synth_tb);",
-            "    end",
-            "",
-            "    // Test stimulus",
-            "    initial begin",
-            f"        $display(\"=== Post-Synthesis Simulation of {entity_name} ===\");",
-            ""
-        ])
+            clock = f"    // Clock generation\n    always #10 {clock_name} = ~{clock_name};\n\n"
         
         # Initialize signals
-        for port in interface.get('ports', []):
+        inits = []
+        for port in ports:
             if port['direction'] == 'input':
                 init_value = "1" if 'rst' in port['name'].lower() else "0"
-                lines.append(f"        {port['name']} = {init_value};")
-        
-        lines.extend([
-            "",
-            "        // Release reset if present",
-            "        #100;"
-        ])
+                inits.append(f"        {port['name']} = {init_value};\n")
         
         # Release reset
-        reset_ports = [p for p in interface.get('ports', []) if 'rst' in p['name'].lower() or 'reset' in p['name'].lower()]
+        reset = ""
+        reset_ports = [p for p in ports if 'rst' in p['name'].lower() or 'reset' in p['name'].lower()]
         if reset_ports:
-            reset_name = reset_ports[0]['name']
-            lines.append(f"        {reset_name} = 0;")
-        
-        lines.extend([
-            "",
-            "        // Run simulation for multiple cycles",
-            "        #2000;",
-            "",
-            f"        $display(\"=== Post-Synthesis Simulation of {entity_name} Complete ===\");",
-            "        $finish;",
-            "    end",
-            "",
-            "endmodule"
-        ])
-        
-        return "\n".join(lines)
+            reset = f"        {reset_ports[0]['name']} = 0;\n"
+        
+        return _VERILOG_TB_TEMPLATE.substitute(
+            entity=entity_name,
+            signals="".join(signals),
+            connections=connections,
+            clock=clock,
+            inits="".join(inits),
+            reset=reset
+        )
 
     def _get_basic_interface(self, entity_name: str) -> Dict:
-        """Get basic interface for common entities."""
+        """Get basic interface for common entities.
+
+        Returns a shared read-only template; copy.deepcopy() it before modifying.
+        """
         
         # Default interface for state machine
         if 'SM' in entity_name or 'state' in entity_name.lower():
-            return {
-                'ports': [
-                    {'name': 'clk', 'direction': 'input', 'width': 1},
-                    {'name': 'rst', 'direction': 'input', 'width': 1},
-                    {'name': 'red', 'direction': 'output', 'width': 1},
-                    {'name': 'yellow', 'direction': 'output', 'width': 1},
-                    {'name': 'green', 'direction': 'output', 'width': 1}
-                ]
-            }
+            return self._STATE_MACHINE_INTERFACE
         
         # Default minimal interface
-        return {
-            'ports': [
-                {'name': 'clk', 'direction': 'input', 'width': 1},
-                {'name': 'rst', 'direction': 'input', 'width': 1}
-            ]
-        }
+        return self._MINIMAL_INTERFACE
 
     def _run_verilog_simulation(self, netlist_path: str, testbench_path: str, sim_dir: str) -> bool:
         """Run Verilog simulation using available simulator."""
@@ -836,24 +987,24 @@ class GHDLCommands(ToolChainManager):
                         
                         # Compile
                         self.ghdl_logger.debug(f"Compile command: {' '.join(sim['compile'])}")
-                        result = subprocess.run(sim['compile'], capture_output=True, text=True)
+                        result = self._run(sim['compile'])
                         
                         if result.returncode == 0:
                             self.ghdl_logger.info(f"✅ Compiled successfully with {sim['name']}")
                             
                             # Run simulation
                             self.ghdl_logger.debug(f"Run command: {' '.join(sim['run'])}")
-                            result = subprocess.run(sim['run'], capture_output=True, text=True)
+                            result = self._run(sim['run'])
                             
                             if result.returncode == 0:
                                 self.ghdl_logger.info(f"✅ Simulation completed with {sim['name']}")
                                 if result.stdout:
-                                    self.ghdl_logger.info(f"Simulation output:\n{result.stdout}")
+                                    self.ghdl_logger.info(f"Simulation output:\n{self._decode(result.stdout)}")
                                 return True
                             else:
-                                self.ghdl_logger.warning(f"Simulation failed with {sim['name']}: {result.stderr}")
+                                self.ghdl_logger.warning(f"Simulation failed with {sim['name']}: {self._decode(result.stderr)}")
                         else:
-                            self.ghdl_logger.warning(f"Compilation failed with {sim['name']}: {result.stderr}")
+                            self.ghdl_logger.warning(f"Compilation failed with {sim['name']}: {self._decode(result.stderr)}")
                             
                     except FileNotFoundError:
                         self.ghdl_logger.debug(f"{sim['name']} not available")
@@ -876,22 +1027,18 @@ class GHDLCommands(ToolChainManager):
         """Find the VHDL file containing the specified entity."""
         
         try:
-            # Get source files from config
-            src_files = self.config["hdl_project_hierarchy"].get("src", {})
-            project_root = self.config.get("project_path", os.getcwd())
-            
-            for file_name, file_path in src_files.items():
-                # Handle relative paths
-                if not os.path.isabs(file_path):
-                    abs_file_path = os.path.join(project_root, file_path)
-                else:
-                    abs_file_path = file_path
-                
+            ename_low = entity_name.casefold()
+            # Files are usually named after their entity, so try those first to
+            # avoid parsing every source file in the common case
+            candidates = sorted(
+                self._hierarchy_abs_paths("src").items(),
+                key=lambda item: os.path.splitext(item[0])[0].casefold() != ename_low
+            )
+            for file_name, abs_file_path in candidates:
                 # Check if this file contains our entity
-                if os.path.exists(abs_file_path):
-                    entity_found = self.parse_entity_name_from_vhdl(abs_file_path)
-                    if entity_found and entity_found.lower() == entity_name.lower():
-                        return abs_file_path
+                entity_found = self.parse_entity_name_from_vhdl(abs_file_path)
+                if entity_found and entity_found.casefold() == ename_low:
+                    return abs_file_path
             
             return None
             
@@ -903,22 +1050,11 @@ class GHDLCommands(ToolChainManager):
         """Find the VHDL testbench file for the specified entity."""
         
         try:
-            # Get testbench files from config
-            tb_files = self.config["hdl_project_hierarchy"].get("testbench", {})
-            project_root = self.config.get("project_path", os.getcwd())
-            
-            for file_name, file_path in tb_files.items():
-                # Handle relative paths
-                if not os.path.isabs(file_path):
-                    abs_file_path = os.path.join(project_root, file_path)
-                else:
-                    abs_file_path = file_path
-                
-                # Check if this file exists and might be related to our entity
-                if os.path.exists(abs_file_path):
-                    # Look for entity name in filename or file content
-                    if entity_name.lower() in file_name.lower():
-                        return abs_file_path
+            ename_low = entity_name.casefold()
+            for file_name, abs_file_path in self._hierarchy_abs_paths("testbench").items():
+                # Look for entity name in filename
+                if ename_low in file_name.casefold():
+                    return abs_file_path
             
             return None
             
@@ -1003,16 +1139,17 @@ class GHDLCommands(ToolChainManager):
         try:
             self.ghdl_logger.debug(f"Opening VHDL file for parsing: {vhdl_file_path}")
             with open(vhdl_file_path, 'r', encoding='utf-8') as f:
-                line_number = 0
-                for line in f:
-                    line_number += 1
-                    line = line.strip()
-                    if line.lower().startswith('entity '):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            entity_name = parts[1]
-                            self.ghdl_logger.info(f"Found entity '{entity_name}' at line {line_number}")
-                            return entity_name
+                content = f.read(_ENTITY_SCAN_CHARS)
+                match = _ENTITY_LINE_RE.search(content)
+                if match is None or match.end() == len(content):
+                    # Not in the bounded prefix (or cut off at its edge), scan the whole file
+                    content += f.read()
+                    match = _ENTITY_LINE_RE.search(content)
+            if match:
+                entity_name = match.group(1)
+                line_number = content.count('\n', 0, match.start()) + 1
+                self.ghdl_logger.info(f"Found entity '{entity_name}' at line {line_number}")
+                return entity_name
             
             self.ghdl_logger.warning(f"No entity declaration found in file: {vhdl_file_path}")
             return None
@@ -1086,7 +1223,8 @@ class GHDLCommands(ToolChainManager):
     def analyze_elaborate_simulate(self, vhdl_files: List[str], top_entity: str, 
                                analyze_options: Optional[List[str]] = None,
                                elaborate_options: Optional[List[str]] = None,
-                               run_options: Optional[List[str]] = None) -> bool:
+                               run_options: Optional[List[str]] = None,
+                               dependency_groups: Optional[List[List[str]]] = None) -> bool:
         """
         Perform the complete VHDL workflow: analyze, elaborate, and simulate in one step.
         
@@ -1099,6 +1237,10 @@ class GHDLCommands(ToolChainManager):
             analyze_options: Options for the analyze stage
             elaborate_options: Options for the elaborate stage
             run_options: Runtime options for the simulation
+            dependency_groups: Optional ordered list of file groups, e.g. packages first,
+                then design units, then testbenches. Each group is analyzed with a single
+                GHDL invocation, after the groups before it. When given, it replaces
+                vhdl_files for the analyze stage. If None, files are analyzed one by one
             
         Returns:
             bool: True if all stages completed successfully, False if any stage failed
@@ -1117,11 +1259,18 @@ class GHDLCommands(ToolChainManager):
         self.ghdl_logger.info(f"Starting complete GHDL workflow for {top_entity}")
         
         # Step 1: Analyze all VHDL files
-        for vhdl_file in vhdl_files:
-            self.ghdl_logger.info(f"Analyzing file: {vhdl_file}")
-            if not self.analyze(vhdl_file, analyze_options):
-                self.ghdl_logger.error(f"Analysis failed for {vhdl_file}, aborting workflow")
-                return False
+        if dependency_groups is not None:
+            for group_index, group in enumerate(dependency_groups, start=1):
+                self.ghdl_logger.info(f"Analyzing dependency group {group_index}/{len(dependency_groups)}")
+                if not self._analyze_group(group, analyze_options):
+                    self.ghdl_logger.error(f"Analysis failed for dependency group {group_index}, aborting workflow")
+                    return False
+        else:
+            for vhdl_file in vhdl_files:
+                self.ghdl_logger.info(f"Analyzing file: {vhdl_file}")
+                if not self.analyze(vhdl_file, analyze_options):
+                    self.ghdl_logger.error(f"Analysis failed for {vhdl_file}, aborting workflow")
+                    return False
         
         # Step 2: Elaborate the design
         self.ghdl_logger.info(f"Elaborating design with top entity: {top_entity}")
@@ -1163,21 +1312,26 @@ class GHDLCommands(ToolChainManager):
         try:
             # Search in common locations
             search_dirs = ["src", "testbench", "tb", "."]
+            entity_decl = f'entity {testbench_name.lower()}'
             
             for search_dir in search_dirs:
-                if not os.path.exists(search_dir):
+                try:
+                    entries = os.scandir(search_dir)
+                except OSError:
                     continue
                     
-                for file in os.listdir(search_dir):
-                    if file.endswith('.vhd') or file.endswith('.vhdl'):
-                        file_path = os.path.join(search_dir, file)
+                with entries:
+                    for entry in entries:
+                        if not entry.name.endswith(('.vhd', '.vhdl')) or not entry.is_file():
+                            continue
+                        file_path = entry.path
                         
                         # Check if this file contains the testbench entity
                         try:
                             with open(file_path, 'r', encoding='utf-8') as f:
                                 content = f.read().lower()
                                 
-                            if f'entity {testbench_name.lower()}' in content:
+                            if entity_decl in content:
                                 self.ghdl_logger.debug(f"Found testbench file: {file_path}")
                                 return file_path
                                 
@@ -7,29 +7,42 @@ including synthesis, simulation, and project setup operations.
 
 import sys
 import os
+import re
 import logging
 import threading
 import time
+import signal
 import subprocess
+import json
 import datetime
+from collections import namedtuple
+from functools import lru_cache, partial
 from typing import Optional, Dict, Any
 from pathlib import Path
+from string import Template
+
+import yaml
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QGridLayout, QPushButton, QLabel, QTextEdit, QScrollArea, QFrame,
+    QGridLayout, QPushButton, QLabel, QTextEdit, QPlainTextEdit, QScrollArea, QFrame,
     QSplitter, QMessageBox, QInputDialog, QFileDialog, QDialog,
     QFormLayout, QLineEdit, QComboBox, QCheckBox, QSpinBox,
     QTabWidget, QGroupBox, QProgressBar, QStatusBar, QMenuBar,
     QAction, QToolBar, QListWidget, QTableWidget, QTableWidgetItem,
     QTreeWidget, QTreeWidgetItem, QStyle, QHeaderView, QSizePolicy,
-    QAbstractItemView
+    QAbstractItemView, QProgressDialog, QToolTip
 )
 from PyQt5.QtCore import (
-    Qt, QThread, pyqtSignal, QTimer, QSize, QRect, pyqtSlot
+    Qt, QThread, pyqtSignal, QTimer, QSize, QRect, pyqtSlot, QSignalBlocker, QEvent
 )
 from PyQt5.QtGui import (
-    QFont, QPixmap, QIcon, QPalette, QColor, QTextCursor, 
+    QFont, QPixmap, QIcon, QPalette, QColor, QTextCursor, QPainter,
     QTextCharFormat, QSyntaxHighlighter, QTextDocument
 )
 
@@ -45,49 +58,205 @@ from cc_project_manager_pkg import (
     __version__,
 )
 
+# No handler here formats thread or process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Log level colors for the output window (dark theme compatible), indexed by
+# levelno // 10 - 1 so a record's color is a tuple lookup
+_COLOR_BY_LEVEL_IDX = (
+    '#888888',    # DEBUG
+    '#E0E0E0',    # INFO - light gray for dark background
+    '#FFA500',    # WARNING - orange
+    '#FF6B6B',    # ERROR - light red
+    '#FF4444',    # CRITICAL - bright red
+)
+# Styles shared by dialog widgets, selected by object name. Appended to the main
+# window's stylesheet so dialogs parented to it get them from one parsed sheet.
+_SHARED_QSS = """
+        QLabel#hint {
+            color: #64b5f6;
+            font-size: 11px;
+            padding: 10px;
+        }
+        
+        QLabel#hint-strong {
+            color: #64b5f6;
+            font-size: 12px;
+        }
+        
+        QPushButton#accent-btn {
+            background-color: #4CAF50;
+            color: white;
+            font-weight: bold;
+        }
+        
+        QPushButton#info-btn {
+            background-color: #2196F3;
+            color: white;
+            font-weight: bold;
+        }
+        
+        QPushButton#analysis-btn {
+            background-color: #2E3440;
+            color: #D8DEE9;
+            border: 1px solid #4C566A;
+        }
+        
+        QLabel#analysis-note {
+            color: #888888;
+            margin: 10px 0px 10px 0px;
+            font-style: italic;
+        }
+        
+        QLabel#design-status {
+            color: #888888;
+            font-size: 11px;
+            margin: 5px 0px 10px 0px;
+        }
+        
+        QLabel#design-status[state="ok"] {
+            color: #4CAF50;
+        }
+        
+        QLabel#design-status[state="warning"] {
+            color: #FF9800;
+        }
+        
+        QLabel[state="ok"] {
+            color: #4CAF50;
+        }
+        
+        QLabel[state="warning"] {
+            color: #FF9800;
+        }
+        
+        QLabel[state="error"] {
+            color: #F44336;
+        }
+        
+        QLabel[state="muted"] {
+            color: #888888;
+        }
+        
+        ToolStatusCard {
+            font-size: 12px;
+        }
+        
+        QComboBox#pref-dropdown {
+            border: 1px solid #555;
+            border-radius: 3px;
+            padding: 1px 4px 1px 3px;
+            background-color: #3a3a3a;
+            color: #ffffff;
+            selection-background-color: #4a4a4a;
+        }
+        
+        QComboBox#pref-dropdown::drop-down {
+            width: 15px;
+            border: none;
+        }
+        
+        QComboBox#pref-dropdown::down-arrow {
+            width: 10px;
+            height: 10px;
+        }
+        
+        QComboBox#pref-dropdown:hover {
+            background-color: #4a4a4a;
+        }
+        """
+# Shared by every LogHandler
+_SHARED_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+# Fonts shared by all widgets; QFont is implicitly shared, so reusing one is cheap
+_FONT_TITLE = QFont("Arial", 16, QFont.Bold)
+_FONT_HEADER = QFont("Arial", 14, QFont.Bold)
+_FONT_SECTION = QFont("Arial", 12, QFont.Bold)
+_FONT_SUBSECTION = QFont("Arial", 10, QFont.Bold)
+_FONT_CAPTION = QFont("Arial", 9, QFont.Bold)
+_FONT_NOTE = QFont("Arial", 9)
+_FONT_SMALL = QFont("Arial", 8)
+_FONT_MONO = QFont("Courier", 10)
+_FONT_CODE = QFont("Consolas", 9)
+_FONT_CODE_LARGE = QFont("Consolas", 10)
+
+
+def _set_label_state(label, state):
+    """Color a status label "ok", "warning", "error" or "muted" through the shared stylesheet.
+    
+    The state is a dynamic property, so changing it needs a repolish instead of
+    parsing a per-label stylesheet.
+    """
+    if label.property("state") != state:
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
 
 class LogHandler(logging.Handler):
-    """Custom logging handler to redirect logs to the GUI output window."""
+    """Custom logging handler to redirect logs to the GUI output window.
+    
+    The handler level (setLevel) decides which records reach the text widget;
+    Handler.handle() checks it before emit() is called.
+    """
     
     def __init__(self, text_widget, progress_callback=None):
         super().__init__()
         self.text_widget = text_widget
         self.progress_callback = progress_callback
-        self.setFormatter(logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        ))
+        self.setFormatter(_SHARED_FORMATTER)
     
     def emit(self, record):
         """Emit a log record to the text widget."""
+        # Bail out before formatting (timestamp) and the cross-thread signal
+        if self.text_widget is None:
+            return
         try:
             msg = self.format(record)
             # Use Qt's thread-safe mechanism to update GUI
-            self.text_widget.append_log.emit(msg, record.levelname)
+            self.text_widget.append_log.emit(msg, record.levelno)
             if self.progress_callback:
                 self.progress_callback(record.getMessage())
         except Exception:
             pass
 
 
-class LogTextWidget(QTextEdit):
+class LogTextWidget(QPlainTextEdit):
     """Enhanced text widget for displaying logs with color coding."""
     
-    append_log = pyqtSignal(str, str)  # message, level
+    append_log = pyqtSignal(str, int)  # message, levelno
     
-    def __init__(self):
+    def __init__(self, max_lines: int = 1000):
         super().__init__()
         self.setReadOnly(True)
-        self.max_lines = 1000  # Limit log history
-        self.current_lines = 0
-        
-        # Set up colors for different log levels (dark theme compatible)
-        self.log_colors = {
-            'DEBUG': '#888888',
-            'INFO': '#E0E0E0',        # Light gray for dark background
-            'WARNING': '#FFA500',     # Orange
-            'ERROR': '#FF6B6B',       # Light red
-            'CRITICAL': '#FF4444'     # Bright red
-        }
+        self.max_lines = max_lines  # Limit log history (0 = unlimited)
+        # Qt drops the oldest blocks itself once the limit is reached
+        self.setMaximumBlockCount(max_lines)
+        
+        # Per-level text formats, so appending a record needs no HTML parsing
+        self._formats = []
+        for color in _COLOR_BY_LEVEL_IDX:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats.append(fmt)
+        # Writing cursor kept for the widget's lifetime instead of a textCursor() copy per flush
+        self._cursor = QTextCursor(self.document())
+        
+        # Messages are queued and written in batches, so a burst of log records
+        # costs one document layout per flush instead of one per record
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
+        # Auto-scroll is coalesced to at most ~30 repaints per second
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(33)
+        self._scroll_timer.timeout.connect(self._do_scroll)
         
         # Connect signal to slot
         self.append_log.connect(self._append_log_message)
@@ -98,38 +267,48 @@ class LogTextWidget(QTextEdit):
         font.setWeight(QFont.Normal)
         self.setFont(font)
     
-    @pyqtSlot(str, str)
-    def _append_log_message(self, message: str, level: str):
-        """Append a log message with appropriate color."""
-        color = self.log_colors.get(level, '#000000')
-        
-        # Check if we need to remove old lines
-        if self.current_lines >= self.max_lines:
-            # Remove the first line
-            cursor = self.textCursor()
-            cursor.movePosition(QTextCursor.Start)
-            cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor)
-            cursor.removeSelectedText()
-            self.current_lines -= 1
-        
-        # Format the message with HTML color
-        html_message = f'<span style="color: {color};">{message}</span>'
-        
-        # Move cursor to end and append
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.setTextCursor(cursor)
-        self.insertHtml(html_message + '<br>')
-        self.current_lines += 1
+    @pyqtSlot(str, int)
+    def _append_log_message(self, message: str, levelno: int):
+        """Queue a log message for the next batched write."""
+        self._pending.append((message, levelno))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    @pyqtSlot()
+    def _flush_pending(self):
+        """Append all queued log messages with their colors in a single insert."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
         
-        # Auto scroll to bottom
+        # One block per message so the maximum block count limits messages
+        cursor = self._cursor
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        formats = self._formats
+        for message, levelno in pending:
+            if not self.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(message, formats[min(max(levelno // 10, 1), 5) - 1])
+        cursor.endEditBlock()
+        
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+    
+    @pyqtSlot()
+    def _do_scroll(self):
+        """Auto scroll to bottom."""
         scrollbar = self.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def append(self, text: str):
+        """Append a plain text line (QTextEdit-compatible helper for the log viewers)."""
+        self.appendPlainText(text)
+    
     def clear(self):
-        """Override clear method to reset line count."""
+        """Override clear method to drop queued messages."""
+        self._pending.clear()
         super().clear()
-        self.current_lines = 0
 
 
 class WorkerThread(QThread):
@@ -153,10 +332,153 @@ class WorkerThread(QThread):
             else:
                 self.finished.emit(False, "Invalid operation")
         except Exception as e:
-            import traceback
-            error_msg = f"Error: {str(e)}"
-            logging.debug(f"WorkerThread traceback: {traceback.format_exc()}")
-            self.finished.emit(False, str(e) if str(e) else error_msg)
+            # exc_info defers rendering the traceback to handlers that emit the record
+            logging.debug("WorkerThread exception: %s", e, exc_info=True)
+            self.finished.emit(False, str(e) or f"Error: {type(e).__name__}")
+
+
+# Configuration tab tool names and the keys the toolchain config uses for them
+_TOOL_KEYS = {"GHDL": "ghdl", "Yosys": "yosys", "P&R": "p_r",
+              "openFPGALoader": "openfpgaloader", "GTKWave": "gtkwave"}
+
+# Overall tool status text and label state, keyed by
+# (preference, path_available, direct_available)
+_TOOL_STATUS = {
+    ("PATH", True, True): ("STATUS: ✅ READY (using PATH)", "ok"),
+    ("PATH", True, False): ("STATUS: ✅ READY (using PATH)", "ok"),
+    ("PATH", False, True): ("STATUS: ⚠️ PATH not available, DIRECT ready", "warning"),
+    ("PATH", False, False): ("STATUS: ❌ PATH not available", "error"),
+    ("DIRECT", True, True): ("STATUS: ✅ READY (using DIRECT)", "ok"),
+    ("DIRECT", False, True): ("STATUS: ✅ READY (using DIRECT)", "ok"),
+    ("DIRECT", True, False): ("STATUS: ⚠️ DIRECT not configured, PATH available", "warning"),
+    ("DIRECT", False, False): ("STATUS: ❌ DIRECT path not configured", "error"),
+}
+_TOOL_STATUS_UNAVAILABLE = ("STATUS: ❌ NOT AVAILABLE", "error")
+
+
+def _probe_tool_availability(tcm, sim_manager):
+    """Check once per tool whether it runs from PATH and from its direct path.
+    
+    Each check starts the tool, so callers share the result instead of
+    probing again.
+    
+    Returns:
+        dict: (path_available, direct_available) per Configuration tab tool
+        name; GTKWave is left out without a simulation manager
+    """
+    availability = {}
+    for tool_name, tool_key in _TOOL_KEYS.items():
+        if tool_name == "GTKWave":
+            continue
+        availability[tool_name] = (tcm.check_tool_version_path(tool_key),
+                                   tcm.check_tool_version_direct(tool_key))
+    
+    # GTKWave availability comes from the simulation config
+    if sim_manager is not None:
+        try:
+            availability["GTKWave"] = (sim_manager.check_gtkwave_path(),
+                                       sim_manager.check_gtkwave_direct())
+        except Exception as e:
+            logging.warning("Error checking GTKWave availability: %s", e)
+    
+    return availability
+
+
+class ToolProbeThread(QThread):
+    """Runs the tool availability checks without blocking the GUI."""
+    
+    probed = pyqtSignal(dict, object)  # availability, GHDL-Yosys plugin result (None if the check failed)
+    
+    def __init__(self, tcm, sim_manager, check_plugin=False):
+        super().__init__()
+        self.tcm = tcm
+        self.sim_manager = sim_manager
+        self.check_plugin = check_plugin
+    
+    def run(self):
+        """Probe the tools and emit the results."""
+        try:
+            availability = _probe_tool_availability(self.tcm, self.sim_manager)
+        except Exception as e:
+            logging.error("Error checking tool availability: %s", e)
+            availability = {}
+        
+        plugin_ok = None
+        if self.check_plugin:
+            try:
+                plugin_ok = self.tcm.check_ghdl_yosys_link()
+            except Exception as e:
+                logging.debug("GHDL-Yosys plugin check failed: %s", e)
+        
+        self.probed.emit(availability, plugin_ok)
+
+
+# ToolStatusCard line colors, matching the QLabel[state=...] rules in _SHARED_QSS
+_STATE_COLORS = {
+    "ok": QColor("#4CAF50"),
+    "warning": QColor("#FF9800"),
+    "error": QColor("#F44336"),
+    "muted": QColor("#888888"),
+}
+
+
+class ToolStatusCard(QWidget):
+    """Paints a tool's PATH, DIRECT and STATUS lines as one widget.
+    
+    Each line is a (text, state, tooltip) tuple; the state picks the color the
+    same way _set_label_state does for labels.
+    """
+    
+    LINES = ("path", "direct", "status")
+    LINE_SPACING = 6
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lines = {
+            "path": ("PATH: Checking...", "", ""),
+            "direct": ("DIRECT: Checking...", "", ""),
+            "status": ("STATUS: Checking...", "", ""),
+        }
+    
+    def setLine(self, key, text, state="", tooltip=""):
+        """Set one line, repainting only if it changed."""
+        line = (text, state, tooltip)
+        if self._lines[key] != line:
+            self._lines[key] = line
+            self.updateGeometry()
+            self.update()
+    
+    def _line_height(self):
+        return self.fontMetrics().height() + self.LINE_SPACING
+    
+    def sizeHint(self):
+        width = max(self.fontMetrics().horizontalAdvance(text) for text, _, _ in self._lines.values())
+        return QSize(width, len(self.LINES) * self._line_height() - self.LINE_SPACING)
+    
+    def minimumSizeHint(self):
+        return self.sizeHint()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        ascent = self.fontMetrics().ascent()
+        default_color = self.palette().color(QPalette.WindowText)
+        for row, key in enumerate(self.LINES):
+            text, state, _ = self._lines[key]
+            painter.setPen(_STATE_COLORS.get(state, default_color))
+            painter.drawText(0, row * self._line_height() + ascent, text)
+    
+    def event(self, event):
+        # Tooltips belong to single lines, so pick the one under the cursor
+        if event.type() == QEvent.ToolTip:
+            row = event.pos().y() // self._line_height()
+            tooltip = self._lines[self.LINES[row]][2] if 0 <= row < len(self.LINES) else ""
+            if tooltip:
+                QToolTip.showText(event.globalPos(), tooltip, self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
 
 
 class ProjectDialog(QDialog):
@@ -198,6 +520,7 @@ class ProjectDialog(QDialog):
         layout.addRow(button_layout)
         self.setLayout(layout)
     
+    @pyqtSlot()
     def browse_path(self):
         """Browse for project directory."""
         path = QFileDialog.getExistingDirectory(self, "Select Project Directory")
@@ -212,26 +535,99 @@ class ProjectDialog(QDialog):
         }
 
 
-class ToolchainPathDialog(QDialog):
+def _run_version(path, version_flag):
+    """Run a tool's version command for the path validation dialogs.
+    
+    Returns the command's output; stderr is used when stdout is empty, since some
+    tools print their version there. Raises RuntimeError with a message suitable
+    for the validation dialog if the tool fails, times out or can't be started.
+    """
+    # Run the tool in its own process group/session so it is isolated from the
+    # GUI and can be killed cleanly if it hangs
+    try:
+        proc = subprocess.Popen(
+            [path, version_flag],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            start_new_session=(os.name != 'nt'),
+            creationflags=(subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0)
+        )
+    except Exception as e:
+        raise RuntimeError(f"could not be run:\n{str(e)}")
+    
+    try:
+        stdout, stderr = proc.communicate(timeout=10)
+    except subprocess.TimeoutExpired:
+        # Kill the whole group and reap the child so a hung tool (or anything it
+        # spawned) doesn't linger after the dialog gave up
+        if os.name != 'nt':
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+        proc.communicate()
+        raise RuntimeError("timed out after 10 seconds")
+    
+    if proc.returncode != 0:
+        raise RuntimeError(f"returned error code {proc.returncode}\n\nError:\n{stderr[:200]}...")
+    # Never return an empty string, WorkerThread would report it as a generic
+    # success message instead of version info
+    return stdout.strip() or stderr.strip() or "(no version output)"
+
+
+class _LazyUIDialog(QDialog):
+    """Dialog that builds its UI with init_ui() on first show.
+    
+    Dialogs that are created but never shown then cost nothing. Subclasses
+    that need to do work once the UI exists override _after_first_show.
+    """
+    
+    _ui_built = False
+    
+    def showEvent(self, event):
+        """Build the UI on first show."""
+        first_show = not self._ui_built
+        if first_show:
+            self._ui_built = True
+            self.init_ui()
+        super().showEvent(event)
+        if first_show:
+            self._after_first_show()
+    
+    def _after_first_show(self):
+        """Hook run after the first showEvent, once the UI is built."""
+
+
+class ToolchainPathDialog(_LazyUIDialog):
     """Dialog for editing toolchain paths."""
     
+    _TOOL_DISPLAY_NAMES = {"ghdl": "GHDL", "yosys": "Yosys", "p_r": "P&R", "openfpgaloader": "openFPGALoader"}
+    _TOOL_EXE_NAMES = {"ghdl": "ghdl.exe", "yosys": "yosys.exe", "p_r": "p_r.exe", "openfpgaloader": "openFPGALoader.exe"}
+    _TOOL_VERSION_FLAGS = {"openfpgaloader": "--Version"}  # openFPGALoader uses capital V
+    
+    # (tool_key, display name, tooltip) for each path input row
+    _TOOL_ROWS = (
+        ("ghdl", "GHDL", "Path to ghdl.exe (VHDL compiler and analyzer)"),
+        ("yosys", "Yosys", "Path to yosys.exe (HDL synthesizer)"),
+        ("p_r", "P&R", "Path to p_r.exe (Place & Route tool)"),
+        ("openfpgaloader", "openFPGALoader", "Path to openFPGALoader.exe (FPGA programmer)"),
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Edit Toolchain Paths")
         self.setModal(True)
         self.resize(700, 500)
         
+        # Set when refresh_status was called before the dialog was shown
+        self._status_dirty = False
+        
         # Initialize ToolChainManager to get current paths
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             self.tcm = ToolChainManager()
             self.current_paths = self.tcm.config.get("cologne_chip_gatemate_toolchain_paths", {})
         except Exception as e:
             self.tcm = None
             self.current_paths = {}
-            logging.error(f"Failed to initialize ToolChainManager: {e}")
-        
-        self.init_ui()
+            logging.error("Failed to initialize ToolChainManager: %s", e)
     
     def init_ui(self):
         """Initialize the dialog UI."""
@@ -239,7 +635,7 @@ class ToolchainPathDialog(QDialog):
         
         # Header
         header_label = QLabel("🔧 Toolchain Path Configuration")
-        header_label.setFont(QFont("Arial", 14, QFont.Bold))
+        header_label.setFont(_FONT_HEADER)
         header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(header_label)
         
@@ -260,14 +656,7 @@ class ToolchainPathDialog(QDialog):
         
         # Tool path inputs
         self.path_inputs = {}
-        tools = [
-            ("ghdl", "GHDL", "Path to ghdl.exe (VHDL compiler and analyzer)"),
-            ("yosys", "Yosys", "Path to yosys.exe (HDL synthesizer)"),
-            ("p_r", "P&R", "Path to p_r.exe (Place & Route tool)"),
-            ("openfpgaloader", "openFPGALoader", "Path to openFPGALoader.exe (FPGA programmer)")
-        ]
-        
-        for tool_key, tool_name, tooltip in tools:
+        for tool_key, tool_name, tooltip in self._TOOL_ROWS:
             # Create horizontal layout for path input and browse button
             path_layout = QHBoxLayout()
             
@@ -283,13 +672,13 @@ class ToolchainPathDialog(QDialog):
             browse_btn = QPushButton("📁 Browse")
             browse_btn.setMinimumWidth(100)
             browse_btn.setMaximumWidth(120)
-            browse_btn.clicked.connect(lambda checked, key=tool_key: self.browse_path(key))
+            browse_btn.clicked.connect(partial(self.browse_path, tool_key))
             
             # Validate button
             validate_btn = QPushButton("✓ Test")
             validate_btn.setMinimumWidth(80)
             validate_btn.setMaximumWidth(100)
-            validate_btn.clicked.connect(lambda checked, key=tool_key: self.validate_path(key))
+            validate_btn.clicked.connect(partial(self.validate_path, tool_key))
             
             path_layout.addWidget(path_input)
             path_layout.addWidget(browse_btn)
@@ -319,7 +708,7 @@ class ToolchainPathDialog(QDialog):
             "• Leave empty to use PATH environment variable"
         )
         instructions.setWordWrap(True)
-        instructions.setStyleSheet("color: #64b5f6; font-size: 11px; padding: 10px;")
+        instructions.setObjectName("hint")
         layout.addWidget(instructions, 0)  # Give instructions minimal space (stretch factor 0)
         
         # Buttons
@@ -333,22 +722,33 @@ class ToolchainPathDialog(QDialog):
         button_layout.addStretch()
         
         # Cancel and Apply buttons
-        cancel_btn = QPushButton("❌ Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
+        self.cancel_btn = QPushButton("❌ Cancel")
+        self.cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_btn)
         
-        apply_btn = QPushButton("✅ Apply Changes")
-        apply_btn.clicked.connect(self.apply_changes)
-        apply_btn.setDefault(True)
-        button_layout.addWidget(apply_btn)
+        self.apply_btn = QPushButton("✅ Apply Changes")
+        self.apply_btn.clicked.connect(self.apply_changes)
+        self.apply_btn.setDefault(True)
+        button_layout.addWidget(self.apply_btn)
         
         layout.addLayout(button_layout)
         
         # Initial status refresh
         self.refresh_status()
     
-    def refresh_status(self):
-        """Refresh the toolchain status display."""
+    @pyqtSlot()
+    def refresh_status(self, force=False):
+        """Refresh the toolchain status display.
+        
+        Args:
+            force: Refresh even if the dialog isn't shown yet. Otherwise the
+                refresh is deferred to the next showEvent.
+        """
+        if not self.isVisible() and not force:
+            self._status_dirty = True
+            return
+        self._status_dirty = False
+        
         if not self.tcm:
             self.status_text.setText("❌ ToolChainManager not available")
             return
@@ -357,45 +757,49 @@ class ToolchainPathDialog(QDialog):
             # Get current preference
             preference = self.tcm.config.get("cologne_chip_gatemate_toolchain_preference", "PATH")
             
-            status_text = f"Current Preference: {preference}\n\n"
+            parts = [f"Current Preference: {preference}", ""]
             
             # Check each tool
-            tools = {"GHDL": "ghdl", "Yosys": "yosys", "P&R": "p_r", "openFPGALoader": "openfpgaloader"}
-            
-            for tool_name, tool_key in tools.items():
-                status_text += f"{tool_name}:\n"
+            for tool_key, tool_name in self._TOOL_DISPLAY_NAMES.items():
+                parts.append(f"{tool_name}:")
                 
                 # Check PATH availability
                 try:
                     path_available = self.tcm.check_tool_version(tool_key)
                     if path_available:
-                        status_text += "  PATH: ✅ Available\n"
+                        parts.append("  PATH: ✅ Available")
                     else:
-                        status_text += "  PATH: ❌ Not available\n"
+                        parts.append("  PATH: ❌ Not available")
                 except:
-                    status_text += "  PATH: ❌ Not available\n"
+                    parts.append("  PATH: ❌ Not available")
                 
                 # Check direct path
                 direct_path = self.current_paths.get(tool_key, "")
                 if direct_path:
                     if os.path.exists(direct_path):
-                        status_text += f"  DIRECT: ✅ Available ({direct_path})\n"
+                        parts.append(f"  DIRECT: ✅ Available ({direct_path})")
                     else:
-                        status_text += f"  DIRECT: ❌ Path not found ({direct_path})\n"
+                        parts.append(f"  DIRECT: ❌ Path not found ({direct_path})")
                 else:
-                    status_text += "  DIRECT: ⚠️ Not configured\n"
+                    parts.append("  DIRECT: ⚠️ Not configured")
                 
-                status_text += "\n"
+                parts.append("")
             
-            self.status_text.setText(status_text)
+            self.status_text.setText("\n".join(parts))
             
         except Exception as e:
             self.status_text.setText(f"❌ Error checking status: {e}")
     
+    def showEvent(self, event):
+        """Run a status refresh that was deferred while the dialog was hidden."""
+        super().showEvent(event)
+        if self._status_dirty:
+            self.refresh_status()
+    
+    @pyqtSlot(str)
     def browse_path(self, tool_key):
         """Browse for a tool path."""
-        tool_names = {"ghdl": "GHDL", "yosys": "Yosys", "p_r": "P&R", "openfpgaloader": "openFPGALoader"}
-        tool_name = tool_names.get(tool_key, tool_key)
+        tool_name = self._TOOL_DISPLAY_NAMES.get(tool_key, tool_key)
         
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -407,11 +811,11 @@ class ToolchainPathDialog(QDialog):
         if file_path:
             self.path_inputs[tool_key].setText(file_path)
     
+    @pyqtSlot(str)
     def validate_path(self, tool_key):
         """Validate a tool path."""
         path = self.path_inputs[tool_key].text().strip()
-        tool_names = {"ghdl": "GHDL", "yosys": "Yosys", "p_r": "P&R", "openfpgaloader": "openFPGALoader"}
-        tool_name = tool_names.get(tool_key, tool_key)
+        tool_name = self._TOOL_DISPLAY_NAMES.get(tool_key, tool_key)
         
         if not path:
             QMessageBox.information(self, "Validation", f"{tool_name} path is empty - will use PATH environment variable")
@@ -426,8 +830,7 @@ class ToolchainPathDialog(QDialog):
             return
         
         # Check if it's the correct executable
-        expected_names = {"ghdl": "ghdl.exe", "yosys": "yosys.exe", "p_r": "p_r.exe", "openfpgaloader": "openFPGALoader.exe"}
-        expected_name = expected_names.get(tool_key, f"{tool_key}.exe")
+        expected_name = self._TOOL_EXE_NAMES.get(tool_key, f"{tool_key}.exe")
         
         if not path.lower().endswith(expected_name.lower()):
             QMessageBox.warning(
@@ -438,35 +841,45 @@ class ToolchainPathDialog(QDialog):
             return
         
         # Try to run version command (use appropriate flag for each tool)
-        version_flag = "--version"
-        if tool_key == "openfpgaloader":
-            version_flag = "--Version"  # openFPGALoader uses capital V
+        version_flag = self._TOOL_VERSION_FLAGS.get(tool_key, "--version")
+        
+        # Run the version check off the GUI thread; a slow or hung binary would
+        # otherwise freeze the dialog for up to the 10 s timeout
+        self._validate_tool_name = tool_name
+        self._validate_progress = QProgressDialog(f"Validating {tool_name}...", None, 0, 0, self)
+        self._validate_progress.setWindowTitle("Validation")
+        self._validate_progress.setCancelButton(None)
+        self._validate_progress.setWindowModality(Qt.WindowModal)
+        self._validate_progress.setMinimumDuration(0)
+        self._validate_progress.show()
+        
+        self._validate_thread = WorkerThread(_run_version, path, version_flag)
+        self._validate_thread.finished.connect(self._on_validate_finished)
+        self._validate_thread.start()
+    
+    @pyqtSlot(bool, str)
+    def _on_validate_finished(self, success, message):
+        """Report the result of the background version check."""
+        self._validate_progress.close()
+        tool_name = self._validate_tool_name
         
-        try:
-            result = subprocess.run([path, version_flag], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                QMessageBox.information(
-                    self, 
-                    "Validation Successful", 
-                    f"✅ {tool_name} is working correctly!\n\nVersion info:\n{result.stdout[:200]}..."
-                )
-            else:
-                QMessageBox.warning(
-                    self, 
-                    "Validation Failed", 
-                    f"❌ {tool_name} returned error code {result.returncode}\n\nError:\n{result.stderr[:200]}..."
-                )
-        except subprocess.TimeoutExpired:
-            QMessageBox.warning(self, "Validation Failed", f"❌ {tool_name} validation timed out")
-        except Exception as e:
-            QMessageBox.warning(self, "Validation Failed", f"❌ Error testing {tool_name}:\n{str(e)}")
+        if success:
+            QMessageBox.information(
+                self, 
+                "Validation Successful", 
+                f"✅ {tool_name} is working correctly!\n\nVersion info:\n{message[:200]}..."
+            )
+        else:
+            QMessageBox.warning(self, "Validation Failed", f"❌ {tool_name} {message}")
     
+    @pyqtSlot()
     def reset_paths(self):
         """Reset paths to current configuration."""
         for tool_key, path_input in self.path_inputs.items():
             current_path = self.current_paths.get(tool_key, "")
             path_input.setText(current_path)
     
+    @pyqtSlot()
     def apply_changes(self):
         """Apply the path changes."""
         if not self.tcm:
@@ -505,7 +918,7 @@ class ToolchainPathDialog(QDialog):
                 success = self.tcm.add_tool_path(tool_key, new_path)
                 if success:
                     success_count += 1
-                    logging.info(f"Updated {tool_key} path to: {new_path}")
+                    logging.info("Updated %s path to: %s", tool_key, new_path)
                 else:
                     errors.append(f"Failed to update {tool_key} path")
             except Exception as e:
@@ -513,273 +926,161 @@ class ToolchainPathDialog(QDialog):
         
         # Show results
         if success_count > 0:
-            # Run toolchain check to update preference
-            try:
-                self.tcm.check_toolchain()
-            except Exception as e:
-                logging.warning(f"Error running toolchain check: {e}")
-            
-            # Update current paths for status refresh
-            self.current_paths = self.tcm.config.get("cologne_chip_gatemate_toolchain_paths", {})
-            self.refresh_status()
-            
-            if errors:
-                QMessageBox.warning(
-                    self,
-                    "Partial Success",
-                    f"✅ Successfully updated {success_count}/{len(new_paths)} paths\n\n❌ Errors:\n" + "\n".join(errors)
-                )
-            else:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"✅ Successfully updated {success_count} tool path(s)!\n\nToolchain preference has been automatically updated."
-                )
-                self.accept()
+            # Run toolchain check to update preference. It probes every tool, so
+            # it runs in the background and the results are shown when it's done
+            self._apply_result = (success_count, len(new_paths), errors)
+            self.apply_btn.setEnabled(False)
+            self.cancel_btn.setEnabled(False)
+            self.status_text.setText("⏳ Checking toolchain...")
+            
+            self._check_thread = WorkerThread(self.tcm.check_toolchain)
+            self._check_thread.finished.connect(self._on_check_done)
+            self._check_thread.start()
         else:
             QMessageBox.critical(
                 self,
                 "Failed",
                 f"❌ Failed to update any paths:\n\n" + "\n".join(errors)
             )
+    
+    def reject(self):
+        """Close the dialog unless a toolchain check is still running."""
+        # Escape and the window close button end up here too. Cancel is disabled
+        # until the check reports back, and the GUI thread never waits on it
+        check_thread = getattr(self, "_check_thread", None)
+        if check_thread is not None and check_thread.isRunning():
+            return
+        super().reject()
+    
+    @pyqtSlot(bool, str)
+    def _on_check_done(self, success, message):
+        """Refresh the status and report the applied changes once the toolchain check finished."""
+        self.apply_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+        if not success:
+            logging.warning("Error running toolchain check: %s", message)
+        
+        # Nothing to report into a dialog that is no longer shown
+        if not self.isVisible():
+            return
+        
+        # Update current paths for status refresh
+        self.current_paths = self.tcm.config.get("cologne_chip_gatemate_toolchain_paths", {})
+        self.refresh_status()
+        
+        success_count, total, errors = self._apply_result
+        if errors:
+            QMessageBox.warning(
+                self,
+                "Partial Success",
+                f"✅ Successfully updated {success_count}/{total} paths\n\n❌ Errors:\n" + "\n".join(errors)
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"✅ Successfully updated {success_count} tool path(s)!\n\nToolchain preference has been automatically updated."
+            )
+            self.accept()
 
 
-#!/usr/bin/env python3
-"""PyQt5 GUI for the Cologne Chip Project Manager.
+# Managers shared by the dialogs, see _cached_manager
+_SIM_MANAGER_CACHE = {'mgr': None, 'mtime': 0, 'cwd': None}
+_TCM_CACHE = {'mgr': None, 'mtime': 0, 'cwd': None}
 
-This module provides a modern graphical interface for managing FPGA projects,
-including synthesis, simulation, and project setup operations.
-"""
 
-import sys
-import os
-import logging
-import threading
-import time
-import subprocess
-import datetime
-from typing import Optional, Dict, Any
-from pathlib import Path
+def _cached_manager(cache, factory):
+    """Return the manager held in cache, rebuilding it with factory when stale.
+    
+    Managers search for and parse the project config on construction, so the
+    instance is reused while the working directory (i.e. the open project) and
+    the config file's modification time are unchanged.
+    """
+    mgr = cache['mgr']
+    cwd = os.getcwd()
+    if mgr is not None and cache['cwd'] == cwd:
+        try:
+            if os.stat(mgr.config_path).st_mtime_ns == cache['mtime']:
+                return mgr
+        except (OSError, TypeError):
+            pass
+    
+    mgr = factory()
+    try:
+        mtime = os.stat(mgr.config_path).st_mtime_ns
+    except (OSError, TypeError):
+        mtime = 0
+    cache.update(mgr=mgr, mtime=mtime, cwd=cwd)
+    return mgr
 
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QGridLayout, QPushButton, QLabel, QTextEdit, QScrollArea, QFrame,
-    QSplitter, QMessageBox, QInputDialog, QFileDialog, QDialog,
-    QFormLayout, QLineEdit, QComboBox, QCheckBox, QSpinBox,
-    QTabWidget, QGroupBox, QProgressBar, QStatusBar, QMenuBar,
-    QAction, QToolBar, QListWidget, QTableWidget, QTableWidgetItem,
-    QTreeWidget, QTreeWidgetItem, QStyle, QHeaderView, QSizePolicy,
-    QAbstractItemView
-)
-from PyQt5.QtCore import (
-    Qt, QThread, pyqtSignal, QTimer, QSize, QRect, pyqtSlot
-)
-from PyQt5.QtGui import (
-    QFont, QPixmap, QIcon, QPalette, QColor, QTextCursor, 
-    QTextCharFormat, QSyntaxHighlighter, QTextDocument
-)
 
-# Import from the cc_project_manager_pkg package
-from cc_project_manager_pkg import (
-    YosysCommands,
-    GHDLCommands, 
-    HierarchyManager,
-    CreateStructure,
-    ToolChainManager,
-    PnRCommands,
-    SimulationManager,
-    __version__,
-)
+def _get_sim_manager():
+    """Return a shared SimulationManager for the current project configuration."""
+    return _cached_manager(_SIM_MANAGER_CACHE, SimulationManager)
 
 
-class LogHandler(logging.Handler):
-    """Custom logging handler to redirect logs to the GUI output window."""
-    
-    def __init__(self, text_widget, progress_callback=None):
-        super().__init__()
-        self.text_widget = text_widget
-        self.progress_callback = progress_callback
-        self.setFormatter(logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        ))
+def _invalidate_sim_manager():
+    """Drop the shared SimulationManager so the next dialog reloads the config."""
+    _SIM_MANAGER_CACHE['mgr'] = None
+
+
+def _get_toolchain_manager():
+    """Return a shared ToolChainManager for the current project configuration."""
+    return _cached_manager(_TCM_CACHE, ToolChainManager)
+
+
+@lru_cache(maxsize=1)
+def _gtkwave_on_path_cached(tag):
+    """Whether 'gtkwave --version' runs through PATH, memoized per time bucket.
     
-    def emit(self, record):
-        """Emit a log record to the text widget."""
-        try:
-            msg = self.format(record)
-            # Use Qt's thread-safe mechanism to update GUI
-            self.text_widget.append_log.emit(msg, record.levelname)
-            if self.progress_callback:
-                self.progress_callback(record.getMessage())
-        except Exception:
-            pass
+    Callers pass tag=int(time.monotonic() // 2), so status refreshes within the
+    same 2 second bucket share one run; only the current bucket is kept.
+    """
+    try:
+        _run_version("gtkwave", "--version")
+        return True
+    except RuntimeError:
+        return False
 
 
-class LogTextWidget(QTextEdit):
-    """Enhanced text widget for displaying logs with color coding."""
+class GTKWaveConfigDialog(_LazyUIDialog):
+    """Dialog for configuring GTKWave settings."""
     
-    append_log = pyqtSignal(str, str)  # message, level
+    _INSTRUCTIONS_TEXT = (
+        "💡 Instructions:\n"
+        "• Use 'Browse' to select the GTKWave executable file\n"
+        "• Use 'Test' to validate that the path works correctly\n"
+        "• Path must point to the actual executable (e.g., gtkwave.exe, gtkwave)\n"
+        "• Leave empty to use PATH environment variable"
+    )
+    _STATUS_TMPL = (
+        "Current Preference: {pref}\n\n"
+        "PATH: {path_state}\n"
+        "DIRECT: {direct_state}\n\n"
+        "Overall Status: {overall}"
+    )
     
-    def __init__(self):
-        super().__init__()
-        self.setReadOnly(True)
-        self.max_lines = 1000  # Limit log history
-        self.current_lines = 0
-        
-        # Set up colors for different log levels (dark theme compatible)
-        self.log_colors = {
-            'DEBUG': '#888888',
-            'INFO': '#E0E0E0',        # Light gray for dark background
-            'WARNING': '#FFA500',     # Orange
-            'ERROR': '#FF6B6B',       # Light red
-            'CRITICAL': '#FF4444'     # Bright red
-        }
-        
-        # Connect signal to slot
-        self.append_log.connect(self._append_log_message)
-        
-        # Set font (optimized for dark theme)
-        font = QFont("Consolas", 10)
-        font.setStyleHint(QFont.Monospace)
-        font.setWeight(QFont.Normal)
-        self.setFont(font)
-    
-    @pyqtSlot(str, str)
-    def _append_log_message(self, message: str, level: str):
-        """Append a log message with appropriate color."""
-        color = self.log_colors.get(level, '#000000')
-        
-        # Check if we need to remove old lines
-        if self.current_lines >= self.max_lines:
-            # Remove the first line
-            cursor = self.textCursor()
-            cursor.movePosition(QTextCursor.Start)
-            cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor)
-            cursor.removeSelectedText()
-            self.current_lines -= 1
-        
-        # Format the message with HTML color
-        html_message = f'<span style="color: {color};">{message}</span>'
-        
-        # Move cursor to end and append
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.setTextCursor(cursor)
-        self.insertHtml(html_message + '<br>')
-        self.current_lines += 1
-        
-        # Auto scroll to bottom
-        scrollbar = self.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-    
-    def clear(self):
-        """Override clear method to reset line count."""
-        super().clear()
-        self.current_lines = 0
-
-
-class WorkerThread(QThread):
-    """Worker thread for running long-running operations without blocking the GUI."""
-    
-    finished = pyqtSignal(bool, str)  # success, message
-    progress = pyqtSignal(str)  # progress message
-    
-    def __init__(self, operation, *args, **kwargs):
-        super().__init__()
-        self.operation = operation
-        self.args = args
-        self.kwargs = kwargs
-    
-    def run(self):
-        """Run the operation in a separate thread."""
-        try:
-            if callable(self.operation):
-                result = self.operation(*self.args, **self.kwargs)
-                self.finished.emit(True, str(result) if result else "Operation completed successfully")
-            else:
-                self.finished.emit(False, "Invalid operation")
-        except Exception as e:
-            import traceback
-            error_msg = f"Error: {str(e)}"
-            logging.debug(f"WorkerThread traceback: {traceback.format_exc()}")
-            self.finished.emit(False, str(e) if str(e) else error_msg)
-
-
-class ProjectDialog(QDialog):
-    """Dialog for creating new projects."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Create New Project")
-        self.setModal(True)
-        self.resize(400, 200)
-        
-        layout = QFormLayout()
-        
-        self.project_name = QLineEdit()
-        self.project_path = QLineEdit()
-        self.project_path.setText(".")
-        
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(self.browse_path)
-        
-        path_layout = QHBoxLayout()
-        path_layout.addWidget(self.project_path)
-        path_layout.addWidget(browse_btn)
-        
-        layout.addRow("Project Name:", self.project_name)
-        layout.addRow("Project Path:", path_layout)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        ok_btn = QPushButton("Create")
-        cancel_btn = QPushButton("Cancel")
-        
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn.clicked.connect(self.reject)
-        
-        button_layout.addWidget(ok_btn)
-        button_layout.addWidget(cancel_btn)
-        
-        layout.addRow(button_layout)
-        self.setLayout(layout)
-    
-    def browse_path(self):
-        """Browse for project directory."""
-        path = QFileDialog.getExistingDirectory(self, "Select Project Directory")
-        if path:
-            self.project_path.setText(path)
-    
-    def get_project_info(self):
-        """Get the project information."""
-        return {
-            'name': self.project_name.text().strip(),
-            'path': self.project_path.text().strip()
-        }
-
-
-class GTKWaveConfigDialog(QDialog):
-    """Dialog for configuring GTKWave settings."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Configure GTKWave")
-        self.setModal(True)
-        self.resize(600, 400)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Configure GTKWave")
+        self.setModal(True)
+        self.resize(600, 400)
         
         # Initialize SimulationManager to get current settings
         try:
-            from cc_project_manager_pkg.simulation_manager import SimulationManager
-            self.sim_manager = SimulationManager()
+            self.sim_manager = _get_sim_manager()
             self.current_path = self.sim_manager.project_config.get("gtkwave_tool_path", {}).get("gtkwave", "")
             self.current_preference = self.sim_manager.project_config.get("gtkwave_preference", "UNDEFINED")
         except Exception as e:
             self.sim_manager = None
             self.current_path = ""
             self.current_preference = "UNDEFINED"
-            logging.error(f"Failed to initialize SimulationManager: {e}")
-        
-        self.init_ui()
+            logging.error("Failed to initialize SimulationManager: %s", e)
+    
+    def _after_first_show(self):
+        """Schedule the initial status refresh."""
+        # Let the dialog paint before probing for GTKWave
+        QTimer.singleShot(0, self.refresh_status)
     
     def init_ui(self):
         """Initialize the dialog UI."""
@@ -787,7 +1088,7 @@ class GTKWaveConfigDialog(QDialog):
         
         # Header
         header_label = QLabel("🌊 GTKWave Configuration")
-        header_label.setFont(QFont("Arial", 14, QFont.Bold))
+        header_label.setFont(_FONT_HEADER)
         header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(header_label)
         
@@ -844,317 +1145,19 @@ class GTKWaveConfigDialog(QDialog):
         refresh_layout.addWidget(refresh_status_btn)
         refresh_layout.addStretch()
         layout.addLayout(refresh_layout)
-        
-        # Instructions
-        instructions = QLabel(
-            "💡 Instructions:\n"
-            "• Use 'Browse' to select the GTKWave executable file\n"
-            "• Use 'Test' to validate that the path works correctly\n"
-            "• Path must point to the actual executable (e.g., gtkwave.exe, gtkwave)\n"
-            "• Leave empty to use PATH environment variable"
-        )
-        instructions.setWordWrap(True)
-        instructions.setStyleSheet("color: #64b5f6; font-size: 11px; padding: 10px;")
-        layout.addWidget(instructions)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        # Reset button
-        reset_btn = QPushButton("🔄 Reset to Current")
-        reset_btn.clicked.connect(self.reset_path)
-        button_layout.addWidget(reset_btn)
-        
-        button_layout.addStretch()
-        
-        # Cancel and Apply buttons
-        cancel_btn = QPushButton("❌ Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
-        
-        apply_btn = QPushButton("✅ Apply Changes")
-        apply_btn.clicked.connect(self.apply_changes)
-        apply_btn.setDefault(True)
-        button_layout.addWidget(apply_btn)
-        
-        layout.addLayout(button_layout)
-        
-        # Initial status refresh
-        self.refresh_status()
-    
-    def refresh_status(self):
-        """Refresh the GTKWave status display."""
-        if not self.sim_manager:
-            self.status_text.setText("❌ SimulationManager not available")
-            return
-        
-        try:
-            # Get current preference and path
-            preference = self.sim_manager.project_config.get("gtkwave_preference", "UNDEFINED")
-            configured_path = self.sim_manager.project_config.get("gtkwave_tool_path", {}).get("gtkwave", "")
-            
-            status_text = f"Current Preference: {preference}\n\n"
-            
-            # Check PATH availability
-            try:
-                path_available = self.sim_manager.check_gtkwave_path()
-                if path_available:
-                    status_text += "PATH: ✅ Available\n"
-                else:
-                    status_text += "PATH: ❌ Not available\n"
-            except:
-                status_text += "PATH: ❌ Not available\n"
-            
-            # Check direct path
-            if configured_path:
-                if os.path.exists(configured_path):
-                    status_text += f"DIRECT: ✅ Available ({configured_path})\n"
-                else:
-                    status_text += f"DIRECT: ❌ Path not found ({configured_path})\n"
-            else:
-                status_text += "DIRECT: ⚠️ Not configured\n"
-            
-            # Overall status
-            status_text += "\nOverall Status: "
-            if self.sim_manager.check_gtkwave():
-                status_text += "✅ GTKWave is available and ready to use"
-            else:
-                status_text += "❌ GTKWave is not available"
-            
-            self.status_text.setText(status_text)
-            
-        except Exception as e:
-            self.status_text.setText(f"❌ Error checking status: {e}")
-    
-    def browse_path(self):
-        """Browse for GTKWave executable path."""
-        if os.name == 'nt':  # Windows
-            file_filter = "Executable Files (*.exe);;All Files (*)"
-            default_name = "gtkwave.exe"
-        else:  # Unix/Linux
-            file_filter = "All Files (*)"
-            default_name = "gtkwave"
-        
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            f"Select {default_name}",
-            "",
-            file_filter
-        )
-        
-        if file_path:
-            self.path_input.setText(file_path)
-    
-    def test_path(self):
-        """Test the GTKWave path."""
-        path = self.path_input.text().strip()
-        
-        if not path:
-            QMessageBox.warning(self, "No Path", "Please enter a path to test.")
-            return
-        
-        if not os.path.exists(path):
-            QMessageBox.critical(self, "Path Not Found", f"The specified path does not exist:\n{path}")
-            return
-        
-        try:
-            # Test the GTKWave executable
-            import subprocess
-            result = subprocess.run([path, "--version"], 
-                                  capture_output=True, text=True, check=True, timeout=10)
-            QMessageBox.information(
-                self, 
-                "Test Successful", 
-                f"✅ GTKWave test successful!\n\nVersion info:\n{result.stdout.strip()}"
-            )
-        except subprocess.TimeoutExpired:
-            QMessageBox.warning(self, "Test Timeout", "GTKWave test timed out after 10 seconds.")
-        except subprocess.CalledProcessError as e:
-            QMessageBox.critical(
-                self, 
-                "Test Failed", 
-                f"❌ GTKWave test failed!\n\nError: {e}\nOutput: {e.stdout}\nError: {e.stderr}"
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "Test Error", f"❌ Error testing GTKWave:\n{e}")
-    
-    def reset_path(self):
-        """Reset path to current configuration."""
-        self.path_input.setText(self.current_path)
-    
-    def apply_changes(self):
-        """Apply the GTKWave configuration changes."""
-        if not self.sim_manager:
-            QMessageBox.critical(self, "Error", "SimulationManager not available")
-            return
-        
-        new_path = self.path_input.text().strip()
-        
-        try:
-            if new_path:
-                # Add the new path
-                if self.sim_manager.add_gtkwave_path(new_path):
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        f"✅ GTKWave path configured successfully!\n\nPath: {new_path}"
-                    )
-                    self.accept()
-                else:
-                    QMessageBox.critical(
-                        self,
-                        "Failed",
-                        f"❌ Failed to configure GTKWave path.\n\nCheck that the path exists and points to a valid GTKWave executable."
-                    )
-            else:
-                # Clear the path (use PATH only)
-                self.sim_manager.project_config.setdefault("gtkwave_tool_path", {})["gtkwave"] = ""
-                
-                # Save configuration
-                import yaml
-                with open(self.sim_manager.config_path, "w") as config_file:
-                    yaml.safe_dump(self.sim_manager.project_config, config_file)
-                
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    "✅ GTKWave path cleared. Will use PATH environment variable."
-                )
-                self.accept()
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"❌ Error applying changes:\n{e}")
-
-
-class SimulationConfigDialog(QDialog):
-    """Dialog for configuring simulation settings."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Configure Simulation Settings")
-        self.setModal(True)
-        self.resize(500, 400)
-        
-        # Initialize SimulationManager to get current settings
-        try:
-            from cc_project_manager_pkg.simulation_manager import SimulationManager
-            self.sim_manager = SimulationManager()
-            self.current_settings = self.sim_manager.get_simulation_length()
-            self.current_profile = self.sim_manager.get_current_simulation_profile()
-            self.supported_prefixes = self.sim_manager.supported_time_prefixes
-        except Exception as e:
-            self.sim_manager = None
-            self.current_settings = (1000, "ns")
-            self.current_profile = "standard"
-            self.supported_prefixes = ["ns", "us", "ms"]
-            logging.error(f"Failed to initialize SimulationManager: {e}")
-        
-        self.init_ui()
-    
-    def init_ui(self):
-        """Initialize the dialog UI."""
-        layout = QVBoxLayout(self)
-        
-        # Header
-        header_label = QLabel("🧪 Simulation Configuration")
-        header_label.setFont(QFont("Arial", 14, QFont.Bold))
-        header_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(header_label)
-        
-        # Current settings section
-        current_group = QGroupBox("Current Settings")
-        current_layout = QVBoxLayout(current_group)
-        
-        if self.current_settings:
-            sim_time, time_prefix = self.current_settings
-            current_text = f"Profile: {self.current_profile}\nDuration: {sim_time}{time_prefix}"
-        else:
-            current_text = "Profile: Unknown\nDuration: Unknown"
-        
-        current_label = QLabel(current_text)
-        current_label.setStyleSheet("color: #64b5f6; font-size: 12px;")
-        current_layout.addWidget(current_label)
-        
-        layout.addWidget(current_group)
-        
-        # Settings configuration section
-        settings_group = QGroupBox("Simulation Settings")
-        settings_layout = QFormLayout(settings_group)
-        
-        # Simulation time input
-        self.time_input = QSpinBox()
-        self.time_input.setRange(1, 1000000)
-        self.time_input.setValue(self.current_settings[0] if self.current_settings else 1000)
-        self.time_input.setToolTip("Simulation duration (numeric value)")
-        
-        # Time prefix selection
-        self.prefix_combo = QComboBox()
-        self.prefix_combo.addItems(self.supported_prefixes)
-        if self.current_settings:
-            current_prefix = self.current_settings[1]
-            if current_prefix in self.supported_prefixes:
-                self.prefix_combo.setCurrentText(current_prefix)
-        self.prefix_combo.setToolTip("Time unit for simulation duration")
-        
-        # Time layout
-        time_layout = QHBoxLayout()
-        time_layout.addWidget(self.time_input)
-        time_layout.addWidget(self.prefix_combo)
-        
-        settings_layout.addRow("Simulation Duration:", time_layout)
-        
-        layout.addWidget(settings_group)
-        
-        # Profile management section
-        profile_group = QGroupBox("Profile Management")
-        profile_layout = QVBoxLayout(profile_group)
-        
-        # Profile selection
-        profile_select_layout = QHBoxLayout()
-        profile_select_layout.addWidget(QLabel("Active Profile:"))
-        
-        self.profile_combo = QComboBox()
-        self._load_available_profiles()
-        profile_select_layout.addWidget(self.profile_combo)
-        
-        apply_profile_btn = QPushButton("Apply Profile")
-        apply_profile_btn.clicked.connect(self.apply_profile)
-        profile_select_layout.addWidget(apply_profile_btn)
-        
-        profile_layout.addLayout(profile_select_layout)
-        
-        # Profile creation
-        create_profile_layout = QHBoxLayout()
-        self.new_profile_input = QLineEdit()
-        self.new_profile_input.setPlaceholderText("Enter new profile name...")
-        create_profile_layout.addWidget(self.new_profile_input)
-        
-        create_profile_btn = QPushButton("Create Profile")
-        create_profile_btn.clicked.connect(self.create_profile)
-        create_profile_layout.addWidget(create_profile_btn)
-        
-        profile_layout.addLayout(create_profile_layout)
-        
-        layout.addWidget(profile_group)
-        
-        # Instructions
-        instructions = QLabel(
-            "💡 Instructions:\n"
-            "• Set simulation duration and time unit\n"
-            "• Create custom profiles for different test scenarios\n"
-            "• Apply existing profiles to quickly switch settings\n"
-            "• Changes are saved to the project configuration"
-        )
+        
+        # Instructions
+        instructions = QLabel(self._INSTRUCTIONS_TEXT)
         instructions.setWordWrap(True)
-        instructions.setStyleSheet("color: #64b5f6; font-size: 11px; padding: 10px;")
+        instructions.setObjectName("hint")
         layout.addWidget(instructions)
         
         # Buttons
         button_layout = QHBoxLayout()
         
         # Reset button
-        reset_btn = QPushButton("🔄 Reset to Defaults")
-        reset_btn.clicked.connect(self.reset_to_defaults)
+        reset_btn = QPushButton("🔄 Reset to Current")
+        reset_btn.clicked.connect(self.reset_path)
         button_layout.addWidget(reset_btn)
         
         button_layout.addStretch()
@@ -1164,164 +1167,187 @@ class SimulationConfigDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
-        apply_btn = QPushButton("✅ Apply Settings")
-        apply_btn.clicked.connect(self.apply_settings)
+        apply_btn = QPushButton("✅ Apply Changes")
+        apply_btn.clicked.connect(self.apply_changes)
         apply_btn.setDefault(True)
         button_layout.addWidget(apply_btn)
         
         layout.addLayout(button_layout)
     
-    def _load_available_profiles(self):
-        """Load available simulation profiles."""
-        if not self.sim_manager:
-            return
-        
-        try:
-            # Get all available profiles (presets + user profiles)
-            presets = self.sim_manager.get_simulation_presets()
-            user_profiles = self.sim_manager.get_user_simulation_profiles()
-            
-            self.profile_combo.clear()
-            
-            # Add presets
-            for name in presets.keys():
-                self.profile_combo.addItem(f"{name} (preset)")
-            
-            # Add user profiles
-            for name in user_profiles.keys():
-                self.profile_combo.addItem(f"{name} (user)")
-            
-            # Set current profile
-            if self.current_profile:
-                # Find and select current profile
-                for i in range(self.profile_combo.count()):
-                    item_text = self.profile_combo.itemText(i)
-                    if self.current_profile in item_text:
-                        self.profile_combo.setCurrentIndex(i)
-                        break
-                        
-        except Exception as e:
-            logging.error(f"Error loading simulation profiles: {e}")
-    
-    def apply_profile(self):
-        """Apply selected profile settings."""
+    @pyqtSlot()
+    def refresh_status(self):
+        """Refresh the GTKWave status display."""
         if not self.sim_manager:
+            self.status_text.setText("❌ SimulationManager not available")
             return
         
         try:
-            selected_text = self.profile_combo.currentText()
-            if not selected_text:
-                return
+            # Get current preference and path
+            preference = self.sim_manager.project_config.get("gtkwave_preference", "UNDEFINED")
+            configured_path = self.sim_manager.project_config.get("gtkwave_tool_path", {}).get("gtkwave", "")
             
-            # Extract profile name (remove " (preset)" or " (user)" suffix)
-            profile_name = selected_text.split(" (")[0]
+            # Check PATH availability
+            try:
+                path_available = _gtkwave_on_path_cached(int(time.monotonic() // 2))
+            except:
+                path_available = False
+            path_state = "✅ Available" if path_available else "❌ Not available"
             
-            # Get profile settings
-            if "(preset)" in selected_text:
-                presets = self.sim_manager.get_simulation_presets()
-                if profile_name in presets:
-                    profile_data = presets[profile_name]
+            # Check direct path
+            if configured_path:
+                if os.path.exists(configured_path):
+                    direct_state = f"✅ Available ({configured_path})"
                 else:
-                    return
+                    direct_state = f"❌ Path not found ({configured_path})"
             else:
-                user_profiles = self.sim_manager.get_user_simulation_profiles()
-                if profile_name in user_profiles:
-                    profile_data = user_profiles[profile_name]
-                else:
-                    return
+                direct_state = "⚠️ Not configured"
             
-            # Update UI with profile settings
-            self.time_input.setValue(profile_data["simulation_time"])
-            self.prefix_combo.setCurrentText(profile_data["time_prefix"])
+            # Overall status; reuses the PATH result above and keeps the stored
+            # preference in sync with what is available
+            if self.sim_manager.check_gtkwave(path_available=path_available):
+                overall = "✅ GTKWave is available and ready to use"
+            else:
+                overall = "❌ GTKWave is not available"
             
-            QMessageBox.information(self, "Profile Applied", f"Applied settings from profile: {profile_name}")
+            status_text = self._STATUS_TMPL.format(
+                pref=preference, path_state=path_state, direct_state=direct_state, overall=overall
+            )
+            self.status_text.setText(status_text)
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error applying profile: {e}")
+            self.status_text.setText(f"❌ Error checking status: {e}")
     
-    def create_profile(self):
-        """Create a new user profile."""
-        if not self.sim_manager:
+    @pyqtSlot()
+    def browse_path(self):
+        """Browse for GTKWave executable path."""
+        if os.name == 'nt':  # Windows
+            file_filter = "Executable Files (*.exe);;All Files (*)"
+            default_name = "gtkwave.exe"
+        else:  # Unix/Linux
+            file_filter = "All Files (*)"
+            default_name = "gtkwave"
+        
+        # open() returns immediately, so the event loop keeps running while the
+        # user picks a file
+        self._file_dialog = QFileDialog(self, f"Select {default_name}", "", file_filter)
+        self._file_dialog.setFileMode(QFileDialog.ExistingFile)
+        self._file_dialog.fileSelected.connect(self.path_input.setText)
+        self._file_dialog.open()
+    
+    @pyqtSlot()
+    def test_path(self):
+        """Test the GTKWave path."""
+        path = self.path_input.text().strip()
+        
+        if not path:
+            QMessageBox.warning(self, "No Path", "Please enter a path to test.")
             return
         
-        profile_name = self.new_profile_input.text().strip()
-        if not profile_name:
-            QMessageBox.warning(self, "Invalid Name", "Please enter a profile name.")
+        if not os.path.exists(path):
+            QMessageBox.critical(self, "Path Not Found", f"The specified path does not exist:\n{path}")
             return
         
-        try:
-            # Get current settings from UI
-            sim_time = self.time_input.value()
-            time_prefix = self.prefix_combo.currentText()
-            
-            # Create the profile
-            success = self.sim_manager.create_user_simulation_profile(
-                profile_name, sim_time, time_prefix, f"User profile - {sim_time}{time_prefix}"
+        # Test the GTKWave executable off the GUI thread, a hung binary would
+        # otherwise freeze the dialog until the timeout
+        self._test_progress = QProgressDialog("Testing GTKWave...", None, 0, 0, self)
+        self._test_progress.setWindowTitle("Test")
+        self._test_progress.setCancelButton(None)
+        self._test_progress.setWindowModality(Qt.WindowModal)
+        self._test_progress.setMinimumDuration(0)
+        self._test_progress.show()
+        
+        self._test_thread = WorkerThread(_run_version, path, "--version")
+        self._test_thread.finished.connect(self._on_test_finished)
+        self._test_thread.start()
+    
+    @pyqtSlot(bool, str)
+    def _on_test_finished(self, success, message):
+        """Report the result of the background GTKWave test."""
+        self._test_progress.close()
+        
+        if success:
+            QMessageBox.information(
+                self, 
+                "Test Successful", 
+                f"✅ GTKWave test successful!\n\nVersion info:\n{message.strip()}"
             )
-            
-            if success:
-                QMessageBox.information(self, "Profile Created", f"Created profile: {profile_name}")
-                self.new_profile_input.clear()
-                self._load_available_profiles()  # Refresh profile list
-            else:
-                QMessageBox.critical(self, "Error", "Failed to create profile.")
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error creating profile: {e}")
+        else:
+            QMessageBox.critical(self, "Test Failed", f"❌ GTKWave {message}")
     
-    def reset_to_defaults(self):
-        """Reset settings to defaults."""
-        self.time_input.setValue(1000)
-        self.prefix_combo.setCurrentText("ns")
+    @pyqtSlot()
+    def reset_path(self):
+        """Reset path to current configuration."""
+        self.path_input.setText(self.current_path)
     
-    def apply_settings(self):
-        """Apply the simulation settings."""
+    @pyqtSlot()
+    def apply_changes(self):
+        """Apply the GTKWave configuration changes."""
         if not self.sim_manager:
             QMessageBox.critical(self, "Error", "SimulationManager not available")
             return
         
+        new_path = self.path_input.text().strip()
+        
         try:
-            sim_time = self.time_input.value()
-            time_prefix = self.prefix_combo.currentText()
-            
-            # Update simulation settings
-            success = self.sim_manager.set_simulation_length(sim_time, time_prefix)
-            
-            if success:
+            if new_path:
+                # Add the new path
+                if self.sim_manager.add_gtkwave_path(new_path):
+                    _invalidate_sim_manager()
+                    QMessageBox.information(
+                        self,
+                        "Success",
+                        f"✅ GTKWave path configured successfully!\n\nPath: {new_path}"
+                    )
+                    self.accept()
+                else:
+                    QMessageBox.critical(
+                        self,
+                        "Failed",
+                        f"❌ Failed to configure GTKWave path.\n\nCheck that the path exists and points to a valid GTKWave executable."
+                    )
+            else:
+                # Clear the path (use PATH only)
+                self.sim_manager.project_config.setdefault("gtkwave_tool_path", {})["gtkwave"] = ""
+                
+                # Save configuration
+                with open(self.sim_manager.config_path, "w") as config_file:
+                    yaml.dump(self.sim_manager.project_config, config_file, Dumper=_SafeDumper, default_flow_style=False)
+                _invalidate_sim_manager()
+                
                 QMessageBox.information(
                     self,
-                    "Settings Applied",
-                    f"✅ Simulation settings updated!\n\nDuration: {sim_time}{time_prefix}"
+                    "Success",
+                    "✅ GTKWave path cleared. Will use PATH environment variable."
                 )
                 self.accept()
-            else:
-                QMessageBox.critical(self, "Error", "Failed to apply simulation settings.")
                 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error applying settings: {e}")
+            # The shared manager may hold a half-applied change
+            _invalidate_sim_manager()
+            QMessageBox.critical(self, "Error", f"❌ Error applying changes:\n{e}")
 
 
 class SimulationRunDialog(QDialog):
     """Dialog for configuring and running simulation with time settings."""
     
-    def __init__(self, parent=None, simulation_type="behavioral"):
+    def __init__(self, parent=None, simulation_type="behavioral", selected_testbench=None):
         super().__init__(parent)
         self.simulation_type = simulation_type
+        self.selected_testbench = selected_testbench or getattr(parent, 'selected_testbench', None)
         self.setWindowTitle(f"Run {simulation_type.title()} Simulation")
         self.setModal(True)
         self.resize(450, 350)
         
         # Initialize SimulationManager to get current settings
         try:
-            from cc_project_manager_pkg.simulation_manager import SimulationManager
-            self.sim_manager = SimulationManager()
+            self.sim_manager = _get_sim_manager()
             self.current_settings = self.sim_manager.get_simulation_length()
             self.supported_prefixes = self.sim_manager.supported_time_prefixes
         except Exception as e:
             self.sim_manager = None
             self.current_settings = (1000, "ns")
             self.supported_prefixes = ["ns", "us", "ms"]
-            logging.error(f"Failed to initialize SimulationManager: {e}")
+            logging.error("Failed to initialize SimulationManager: %s", e)
         
         self.init_ui()
     
@@ -1331,7 +1357,7 @@ class SimulationRunDialog(QDialog):
         
         # Header
         header_label = QLabel(f"🧪 {self.simulation_type.title()} Simulation")
-        header_label.setFont(QFont("Arial", 14, QFont.Bold))
+        header_label.setFont(_FONT_HEADER)
         header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(header_label)
         
@@ -1340,8 +1366,8 @@ class SimulationRunDialog(QDialog):
         info_layout = QVBoxLayout(info_group)
         
         # Show selected testbench if available
-        if hasattr(self.parent(), 'selected_testbench') and self.parent().selected_testbench:
-            testbench_info = f"Selected Testbench: {self.parent().selected_testbench}"
+        if self.selected_testbench:
+            testbench_info = f"Selected Testbench: {self.selected_testbench}"
             testbench_label = QLabel(testbench_info)
             testbench_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
         else:
@@ -1405,7 +1431,7 @@ class SimulationRunDialog(QDialog):
             "• Click 'Run Simulation' to start the simulation process"
         )
         instructions.setWordWrap(True)
-        instructions.setStyleSheet("color: #64b5f6; font-size: 11px; padding: 10px;")
+        instructions.setObjectName("hint")
         layout.addWidget(instructions)
         
         # Buttons
@@ -1422,7 +1448,7 @@ class SimulationRunDialog(QDialog):
         run_btn = QPushButton(f"🚀 Run {self.simulation_type.title()} Simulation")
         run_btn.clicked.connect(self.accept)
         run_btn.setDefault(True)
-        run_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        run_btn.setObjectName("accent-btn")
         button_layout.addWidget(run_btn)
         
         layout.addLayout(button_layout)
@@ -1450,6 +1476,9 @@ class SynthesisConfigDialog(QDialog):
         self.resize(500, 400)
         
         layout = QFormLayout()
+        # Batch the rows below into one relayout when the layout is re-enabled
+        self.setUpdatesEnabled(False)
+        layout.setEnabled(False)
         
         # VHDL Standard
         self.vhdl_standard = QComboBox()
@@ -1501,28 +1530,23 @@ class SynthesisConfigDialog(QDialog):
         
         layout.addRow(button_layout)
         self.setLayout(layout)
+        layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
     
     def load_config(self, config):
         """Load configuration into the dialog."""
+        # The combos aren't editable, so setCurrentText only selects an existing item
         if 'vhdl_standard' in config:
-            index = self.vhdl_standard.findText(config['vhdl_standard'])
-            if index >= 0:
-                self.vhdl_standard.setCurrentIndex(index)
+            self.vhdl_standard.setCurrentText(config['vhdl_standard'])
         
         if 'ieee_library' in config:
-            index = self.ieee_library.findText(config['ieee_library'])
-            if index >= 0:
-                self.ieee_library.setCurrentIndex(index)
+            self.ieee_library.setCurrentText(config['ieee_library'])
         
         if 'default_strategy' in config:
-            index = self.default_strategy.findText(config['default_strategy'])
-            if index >= 0:
-                self.default_strategy.setCurrentIndex(index)
+            self.default_strategy.setCurrentText(config['default_strategy'])
         
         if 'default_target' in config:
-            index = self.default_target.findText(config['default_target'])
-            if index >= 0:
-                self.default_target.setCurrentIndex(index)
+            self.default_target.setCurrentText(config['default_target'])
         
         self.verbose.setChecked(config.get('verbose', False))
         self.keep_hierarchy.setChecked(config.get('keep_hierarchy', False))
@@ -1548,8 +1572,8 @@ class SynthesisConfigDialog(QDialog):
         }
 
 
-class SimulationConfigDialog(QDialog):
-    """Dialog for configuring simulation settings."""
+class SimulationFormatDialog(QDialog):
+    """Dialog for editing the project's GHDL simulation options."""
     
     def __init__(self, parent=None, current_config=None):
         super().__init__(parent)
@@ -1558,6 +1582,9 @@ class SimulationConfigDialog(QDialog):
         self.resize(500, 400)
         
         layout = QFormLayout()
+        # Batch the rows below into one relayout when the layout is re-enabled
+        self.setUpdatesEnabled(False)
+        layout.setEnabled(False)
         
         # VHDL Standard
         self.vhdl_standard = QComboBox()
@@ -1613,26 +1640,23 @@ class SimulationConfigDialog(QDialog):
         
         layout.addRow(button_layout)
         self.setLayout(layout)
+        layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
     
     def load_config(self, config):
         """Load configuration into the dialog."""
+        # The combos aren't editable, so setCurrentText only selects an existing item
         if 'vhdl_standard' in config:
-            index = self.vhdl_standard.findText(config['vhdl_standard'])
-            if index >= 0:
-                self.vhdl_standard.setCurrentIndex(index)
+            self.vhdl_standard.setCurrentText(config['vhdl_standard'])
         
         if 'ieee_library' in config:
-            index = self.ieee_library.findText(config['ieee_library'])
-            if index >= 0:
-                self.ieee_library.setCurrentIndex(index)
+            self.ieee_library.setCurrentText(config['ieee_library'])
         
         if 'simulation_time' in config:
             self.simulation_time.setValue(config['simulation_time'])
         
         if 'time_prefix' in config:
-            index = self.time_prefix.findText(config['time_prefix'])
-            if index >= 0:
-                self.time_prefix.setCurrentIndex(index)
+            self.time_prefix.setCurrentText(config['time_prefix'])
         
         self.verbose.setChecked(config.get('verbose', False))
         self.save_waveforms.setChecked(config.get('save_waveforms', True))
@@ -1658,189 +1682,12 @@ class SimulationConfigDialog(QDialog):
         }
 
 
-class SynthesisRunDialog(QDialog):
-    """Dialog for running synthesis with top entity and GateMate options."""
-    
-    def __init__(self, parent=None, synth_config=None, available_entities=None):
-        super().__init__(parent)
-        self.setWindowTitle("Run Synthesis")
-        self.setModal(True)
-        self.resize(500, 400)
-        
-        self.synth_config = synth_config or {}
-        self.available_entities = available_entities or []
-        
-        self.init_ui()
-    
-    def init_ui(self):
-        """Initialize the dialog UI."""
-        layout = QVBoxLayout(self)
-        
-        # Header
-        header_label = QLabel("⚡ Run Synthesis")
-        header_label.setFont(QFont("Arial", 14, QFont.Bold))
-        header_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(header_label)
-        
-        # Current configuration display
-        config_group = QGroupBox("Current Synthesis Configuration")
-        config_layout = QVBoxLayout(config_group)
-        
-        config_text = QTextEdit()
-        config_text.setReadOnly(True)
-        config_text.setMaximumHeight(100)
-        
-        config_info = f"""Strategy: {self.synth_config.get('strategy', 'balanced')}
-VHDL Standard: {self.synth_config.get('vhdl_standard', 'VHDL-2008')}
-IEEE Library: {self.synth_config.get('ieee_library', 'synopsys')}"""
-        config_text.setPlainText(config_info)
-        config_layout.addWidget(config_text)
-        
-        layout.addWidget(config_group)
-        
-        # Available entities display
-        if self.available_entities:
-            entities_group = QGroupBox("Detected VHDL Entities")
-            entities_layout = QVBoxLayout(entities_group)
-            
-            entities_text = QTextEdit()
-            entities_text.setReadOnly(True)
-            entities_text.setMaximumHeight(120)
-            
-            entities_info = "\n".join(f"{i+1:2}. {entity}" for i, entity in enumerate(self.available_entities))
-            entities_text.setPlainText(entities_info)
-            entities_layout.addWidget(entities_text)
-            
-            layout.addWidget(entities_group)
-        
-        # Input section
-        input_group = QGroupBox("Synthesis Parameters")
-        input_layout = QFormLayout(input_group)
-        
-        # Top entity input
-        self.top_entity_input = QLineEdit()
-        self.top_entity_input.setPlaceholderText("Enter the name of the top-level entity")
-        
-        # If we have available entities, create a combo box with them
-        if self.available_entities:
-            entity_layout = QHBoxLayout()
-            self.entity_combo = QComboBox()
-            self.entity_combo.addItem("-- Select Entity --")
-            self.entity_combo.addItems(list(self.available_entities.keys()))
-            self.entity_combo.currentTextChanged.connect(self._on_entity_selected)
-            
-            entity_layout.addWidget(self.entity_combo)
-            entity_layout.addWidget(QLabel("or"))
-            entity_layout.addWidget(self.top_entity_input)
-            
-            input_layout.addRow("Top Entity:", entity_layout)
-        else:
-            input_layout.addRow("Top Entity:", self.top_entity_input)
-        
-        # Target platform selection
-        self.target_combo = QComboBox()
-        self.target_combo.addItems(['Generic FPGA', 'GateMate FPGA'])
-        
-        # Set default from configuration
-        default_target = self.synth_config.get('default_target', 'GateMate FPGA')
-        if default_target == 'GateMate FPGA':
-            self.target_combo.setCurrentText('GateMate FPGA')
-        else:
-            self.target_combo.setCurrentText('Generic FPGA')
-            
-        self.target_combo.setToolTip("Select target FPGA platform for synthesis")
-        input_layout.addRow("Target Platform:", self.target_combo)
-        
-        layout.addWidget(input_group)
-        
-        # Warning label
-        self.warning_label = QLabel()
-        self.warning_label.setStyleSheet("color: orange; font-weight: bold;")
-        self.warning_label.setWordWrap(True)
-        self.warning_label.hide()
-        layout.addWidget(self.warning_label)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        self.run_button = QPushButton("Run Synthesis")
-        self.run_button.setDefault(True)
-        self.run_button.clicked.connect(self._validate_and_accept)
-        
-        cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(self.reject)
-        
-        button_layout.addStretch()
-        button_layout.addWidget(self.run_button)
-        button_layout.addWidget(cancel_button)
-        
-        layout.addLayout(button_layout)
-        
-        # Connect validation
-        self.top_entity_input.textChanged.connect(self._validate_input)
-        self._validate_input()
-    
-    def _on_entity_selected(self, entity_name):
-        """Handle entity selection from combo box."""
-        if entity_name and entity_name != "-- Select Entity --":
-            self.top_entity_input.setText(entity_name)
-    
-    def _validate_input(self):
-        """Validate the input and update UI accordingly."""
-        top_entity = self.top_entity_input.text().strip()
-        
-        if not top_entity:
-            self.run_button.setEnabled(False)
-            self.warning_label.hide()
-            return
-        
-        # Check if entity exists in available entities
-        if self.available_entities and top_entity not in self.available_entities:
-            self.warning_label.setText(
-                f"⚠️ Warning: '{top_entity}' not found in detected entities.\n"
-                "Make sure the entity name is correct and the VHDL file is added to the project."
-            )
-            self.warning_label.show()
-        else:
-            self.warning_label.hide()
-        
-        self.run_button.setEnabled(True)
-    
-    def _validate_and_accept(self):
-        """Validate input and accept dialog if valid."""
-        top_entity = self.top_entity_input.text().strip()
-        
-        if not top_entity:
-            QMessageBox.warning(self, "Invalid Input", "Top entity name cannot be empty!")
-            return
-        
-        # If entity not found in available entities, ask for confirmation
-        if self.available_entities and top_entity not in self.available_entities:
-            reply = QMessageBox.question(
-                self, "Entity Not Found",
-                f"'{top_entity}' was not found in detected entities.\n\n"
-                "Make sure the entity name is correct and the VHDL file is added to the project.\n\n"
-                "Continue anyway?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply != QMessageBox.Yes:
-                return
-        
-        self.accept()
-    
-    def get_synthesis_params(self):
-        """Get the synthesis parameters from the dialog."""
-        return {
-            'top_entity': self.top_entity_input.text().strip(),
-            'use_gatemate': self.target_combo.currentText() == 'GateMate FPGA'
-        }
-
-
-class SynthesisStrategyDialog(QDialog):
+class SynthesisStrategyDialog(_LazyUIDialog):
     """Dialog for selecting synthesis strategy for a specific entity."""
     
+    # Parsed strategies shared by all instances, keyed by (path, mtime_ns)
+    _STRATEGY_CACHE = {}
+    
     def __init__(self, parent=None, entity_name=None, synth_config=None):
         super().__init__(parent)
         self.entity_name = entity_name
@@ -1848,7 +1695,6 @@ class SynthesisStrategyDialog(QDialog):
         self.setWindowTitle(f"Run Synthesis - {entity_name}")
         self.setModal(True)
         self.setFixedSize(500, 400)
-        self.init_ui()
     
     def init_ui(self):
         """Initialize the dialog UI."""
@@ -1926,12 +1772,12 @@ class SynthesisStrategyDialog(QDialog):
         
         explain_btn = QPushButton("Explain Strategy")
         explain_btn.clicked.connect(self.show_strategy_explanation)
-        explain_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-weight: bold; }")
+        explain_btn.setObjectName("info-btn")
         
         self.run_btn = QPushButton("Run Synthesis")
         self.run_btn.clicked.connect(self.accept)
         self.run_btn.setDefault(True)
-        self.run_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        self.run_btn.setObjectName("accent-btn")
         
         button_layout.addWidget(cancel_btn)
         button_layout.addWidget(explain_btn)
@@ -1953,10 +1799,7 @@ class SynthesisStrategyDialog(QDialog):
             dict: Dictionary of strategy_name -> description
         """
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
-            import yaml
-            
-            tcm = ToolChainManager()
+            tcm = _get_toolchain_manager()
             
             # Get synthesis options file path
             setup_files = tcm.config.get("setup_files_initial", {})
@@ -1970,10 +1813,20 @@ class SynthesisStrategyDialog(QDialog):
                 else:
                     synthesis_options_path = os.path.join(config_dir, "synthesis_options.yml")
             
-            # Load synthesis options
-            if os.path.exists(synthesis_options_path):
+            # Load synthesis options, reusing the last parse if the file is unchanged
+            try:
+                cache_key = (os.path.abspath(synthesis_options_path),
+                             os.stat(synthesis_options_path).st_mtime_ns)
+            except OSError:
+                cache_key = None
+            
+            cached = self._STRATEGY_CACHE.get(cache_key)
+            if cached:
+                return dict(cached)
+            
+            if cache_key is not None:
                 with open(synthesis_options_path, 'r') as f:
-                    synthesis_options = yaml.safe_load(f)
+                    synthesis_options = yaml.load(f, Loader=_SafeLoader)
                 
                 strategies = {}
                 if synthesis_options and 'synthesis_strategies' in synthesis_options:
@@ -1985,10 +1838,11 @@ class SynthesisStrategyDialog(QDialog):
                         strategies[strategy_name] = description
                 
                 if strategies:
-                    return strategies
+                    SynthesisStrategyDialog._STRATEGY_CACHE = {cache_key: strategies}
+                    return dict(strategies)
             
         except Exception as e:
-            logging.error(f"Error loading synthesis strategies: {e}")
+            logging.error("Error loading synthesis strategies: %s", e)
         
         # Fallback to hardcoded strategies if loading fails
         return {
@@ -2003,8 +1857,19 @@ class SynthesisStrategyDialog(QDialog):
     def show_strategy_explanation(self):
         """Show the strategy explanation dialog with flow diagram."""
         current_strategy = self.strategy_combo.currentData()
-        dialog = StrategyExplanationDialog(self, current_strategy)
-        dialog.exec_()
+        # This dialog is recreated for every run, so explanations already
+        # shown are kept on the parent window and reused by later runs
+        owner = self.parent() if self.parent() is not None else self
+        cache = getattr(owner, "_strategy_explanations", None)
+        if cache is None:
+            cache = owner._strategy_explanations = {}
+        dialog = cache.get(current_strategy)
+        if dialog is None:
+            dialog = StrategyExplanationDialog(owner, current_strategy)
+            cache[current_strategy] = dialog
+        # Already application modal, so show() blocks the other windows
+        # without a nested event loop
+        dialog.show()
     
     def get_synthesis_params(self):
         """Get the synthesis parameters from the dialog."""
@@ -2015,7 +1880,150 @@ class SynthesisStrategyDialog(QDialog):
         }
 
 
-class StrategyExplanationDialog(QDialog):
+# Post-synthesis passes shown in the flow diagram of each built-in strategy
+_STRATEGY_FLOW_COMMANDS = {
+    "area": ["abc -lut 4 -dress", "opt_clean", "opt -full", "clean"],
+    "speed": ["abc -fast", "opt", "clean"],
+    "balanced": ["abc", "opt", "clean"],
+    "quality": ["opt -full", "abc", "opt -full", "clean"],
+    "timing": ["abc -lut 4", "opt_clean", "abc -lut 4 -dff -D 0.1", "opt -full", "clean"],
+    "extreme": ["opt -full", "abc -lut 4", "opt -full -fine", "abc -lut 4 -dff -D 0.01", "opt -full -fine", "clean"]
+}
+
+_SYNTH_STRATEGY_DESCRIPTIONS = {
+    "area": """
+        <h3>Area-Optimized Strategy</h3>
+        <p><strong>Goal:</strong> Minimize resource usage (LUTs, logic gates)</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><code>abc -lut 4 -dress</code>: Maps to 4-input LUTs with area optimization</li>
+            <li><code>opt_clean</code>: Removes unused cells and wires</li>
+            <li><code>opt -full</code>: Performs comprehensive optimizations</li>
+        </ul>
+        <p><strong>Best for:</strong> Designs with tight area constraints or large designs that need to fit in smaller FPGAs</p>
+        <p><strong>Trade-offs:</strong> May sacrifice some performance for smaller area</p>
+    """,
+    "speed": """
+        <h3>Speed-Optimized Strategy</h3>
+        <p><strong>Goal:</strong> Maximize performance/frequency</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><code>abc -fast</code>: Fast technology mapping optimized for speed</li>
+            <li><code>opt</code>: Basic optimizations to maintain speed focus</li>
+        </ul>
+        <p><strong>Best for:</strong> High-performance designs where timing is critical</p>
+        <p><strong>Trade-offs:</strong> May use more resources to achieve higher speed</p>
+    """,
+    "balanced": """
+        <h3>Balanced Strategy</h3>
+        <p><strong>Goal:</strong> Balance area and speed optimization</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><code>abc</code>: Standard technology mapping</li>
+            <li><code>opt</code>: Basic optimizations</li>
+        </ul>
+        <p><strong>Best for:</strong> General-purpose designs with no extreme constraints</p>
+        <p><strong>Trade-offs:</strong> Good compromise between area and speed</p>
+    """,
+    "quality": """
+        <h3>Quality-Optimized Strategy</h3>
+        <p><strong>Goal:</strong> Achieve best overall results through thorough optimization</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><code>opt -full</code>: Multiple full optimization passes</li>
+            <li><code>abc</code>: Standard technology mapping between optimizations</li>
+        </ul>
+        <p><strong>Best for:</strong> Production designs where synthesis time is less important than results</p>
+        <p><strong>Trade-offs:</strong> Longer synthesis time for better quality</p>
+    """,
+    "timing": """
+        <h3>Timing-Driven Strategy</h3>
+        <p><strong>Goal:</strong> Advanced timing-driven optimization</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><code>abc -lut 4</code>: 4-input LUT mapping</li>
+            <li><code>abc -lut 4 -dff -D 0.1</code>: Timing-driven mapping with 0.1ns delay target</li>
+            <li><code>opt_clean</code> and <code>opt -full</code>: Comprehensive optimizations</li>
+        </ul>
+        <p><strong>Best for:</strong> Designs with critical timing requirements and complex timing paths</p>
+        <p><strong>Trade-offs:</strong> Longer synthesis time, focus on meeting timing constraints</p>
+    """,
+    "extreme": """
+        <h3>Extreme Performance Strategy</h3>
+        <p><strong>Goal:</strong> Maximum optimization for highest performance</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><code>opt -full</code>: Multiple full optimization passes</li>
+            <li><code>opt -full -fine</code>: Fine-grained optimizations</li>
+            <li><code>abc -lut 4 -dff -D 0.01</code>: Aggressive timing-driven mapping with 0.01ns target</li>
+        </ul>
+        <p><strong>Best for:</strong> Performance-critical designs where synthesis time is not a concern</p>
+        <p><strong>Trade-offs:</strong> Significantly longer synthesis time (3-10x), maximum resource usage for performance</p>
+    """
+}
+
+
+# Flow diagram page; $strategy_name and $commands_html are filled in per strategy
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources",
+                       "strategy_diagram.html.tmpl"), encoding="utf-8") as _tmpl_file:
+    _DIAGRAM_TEMPLATE = Template(_tmpl_file.read())
+
+
+def _format_commands_html(commands):
+    """Format commands as HTML."""
+    return "".join(f'<div class="command">{cmd}</div>' for cmd in commands)
+
+
+def _render_strategy_diagram(strategy_name):
+    """Create HTML representation of the strategy flow diagram."""
+    commands = _STRATEGY_FLOW_COMMANDS.get(strategy_name, ["abc", "opt", "clean"])
+    
+    return _DIAGRAM_TEMPLATE.substitute(
+        strategy_name=strategy_name.title(),
+        commands_html=_format_commands_html(commands),
+    )
+
+
+def _render_strategy_commands(strategy_name):
+    """Get the full command sequence for the strategy."""
+    commands = YosysCommands.SYNTHESIS_STRATEGIES.get(strategy_name)
+    if commands is None:
+        return f"Commands for {strategy_name} strategy not available."
+    
+    full_sequence = [
+        "# VHDL Analysis and Elaboration",
+        "ghdl --std=08 --ieee=synopsys [vhdl_files] -e [entity]",
+        "",
+        "# Synthesis Strategy Commands",
+    ]
+    
+    for i, cmd in enumerate(commands, 1):
+        full_sequence.append(f"{i}. {cmd}")
+    
+    full_sequence.extend([
+        "",
+        "# Output Generation", 
+        "write_verilog -noattr [output].v",
+        "write_json [output].json"
+    ])
+    
+    return "\n".join(full_sequence)
+
+
+_RenderedStrategy = namedtuple("_RenderedStrategy", "diagram description commands")
+
+# Explanation pages of the built-in strategies, rendered once at import
+_STRATEGY_RENDERED = {
+    name: _RenderedStrategy(
+        diagram=_render_strategy_diagram(name),
+        description=_SYNTH_STRATEGY_DESCRIPTIONS[name],
+        commands=_render_strategy_commands(name),
+    )
+    for name in _STRATEGY_FLOW_COMMANDS
+}
+
+
+class StrategyExplanationDialog(_LazyUIDialog):
     """Dialog for explaining synthesis strategies with visual flow diagram."""
     
     def __init__(self, parent=None, strategy_name="balanced"):
@@ -2024,7 +2032,6 @@ class StrategyExplanationDialog(QDialog):
         self.setWindowTitle(f"Strategy Explanation - {strategy_name.title()}")
         self.setModal(True)
         self.resize(800, 600)
-        self.init_ui()
     
     def init_ui(self):
         """Initialize the dialog UI."""
@@ -2032,21 +2039,49 @@ class StrategyExplanationDialog(QDialog):
         
         # Title
         title = QLabel(f"Synthesis Strategy: {self.strategy_name.title()}")
-        title.setFont(QFont("Arial", 16, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         title.setAlignment(Qt.AlignCenter)
         title.setStyleSheet("color: #2196F3; margin: 10px;")
         layout.addWidget(title)
         
-        # Create tab widget for different views
+        # Tabs start empty and are filled on first visit
         tab_widget = QTabWidget()
+        tab_widget.addTab(QWidget(), "Flow Diagram")
+        tab_widget.addTab(QWidget(), "Command Details")
+        self._tab_widget = tab_widget
+        self._tabs_built = [False, False]
+        tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(0)
         
-        # Flow Diagram Tab
-        flow_tab = QWidget()
-        flow_layout = QVBoxLayout(flow_tab)
+        layout.addWidget(tab_widget)
+        
+        # Close button
+        button_layout = QHBoxLayout()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        close_btn.setDefault(True)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+    
+    def _ensure_tab_built(self, index):
+        """Fill the tab at index the first time it is shown."""
+        if index < 0 or self._tabs_built[index]:
+            return
+        self._tabs_built[index] = True
+        tab = self._tab_widget.widget(index)
+        if index == 0:
+            self._build_flow_tab(tab)
+        else:
+            self._build_details_tab(tab)
+    
+    def _build_flow_tab(self, tab):
+        """Populate the Flow Diagram tab."""
+        flow_layout = QVBoxLayout(tab)
         
         # Strategy flow diagram
         diagram_label = QLabel("Synthesis Flow Diagram:")
-        diagram_label.setFont(QFont("Arial", 12, QFont.Bold))
+        diagram_label.setFont(_FONT_SECTION)
         flow_layout.addWidget(diagram_label)
         
         # Create the flow diagram as HTML
@@ -2056,28 +2091,26 @@ class StrategyExplanationDialog(QDialog):
         diagram_view.setReadOnly(True)
         diagram_view.setMinimumHeight(300)
         flow_layout.addWidget(diagram_view)
-        
-        tab_widget.addTab(flow_tab, "Flow Diagram")
-        
-        # Command Details Tab
-        details_tab = QWidget()
-        details_layout = QVBoxLayout(details_tab)
+    
+    def _build_details_tab(self, tab):
+        """Populate the Command Details tab."""
+        details_layout = QVBoxLayout(tab)
         
         # Strategy commands
         commands_label = QLabel("Yosys Commands:")
-        commands_label.setFont(QFont("Arial", 12, QFont.Bold))
+        commands_label.setFont(_FONT_SECTION)
         details_layout.addWidget(commands_label)
         
         commands_text = self._get_strategy_commands()
         commands_view = QTextEdit()
         commands_view.setPlainText(commands_text)
         commands_view.setReadOnly(True)
-        commands_view.setFont(QFont("Courier", 10))
+        commands_view.setFont(_FONT_MONO)
         details_layout.addWidget(commands_view)
         
         # Strategy description
         description_label = QLabel("Description:")
-        description_label.setFont(QFont("Arial", 12, QFont.Bold))
+        description_label.setFont(_FONT_SECTION)
         details_layout.addWidget(description_label)
         
         description_text = self._get_strategy_description()
@@ -2086,223 +2119,36 @@ class StrategyExplanationDialog(QDialog):
         description_view.setReadOnly(True)
         description_view.setMaximumHeight(150)
         details_layout.addWidget(description_view)
-        
-        tab_widget.addTab(details_tab, "Command Details")
-        
-        layout.addWidget(tab_widget)
-        
-        # Close button
-        button_layout = QHBoxLayout()
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        close_btn.setDefault(True)
-        button_layout.addStretch()
-        button_layout.addWidget(close_btn)
-        layout.addLayout(button_layout)
     
     def _create_strategy_diagram(self):
         """Create HTML representation of the strategy flow diagram."""
-        # Define strategy-specific commands
-        strategy_commands = {
-            "area": ["abc -lut 4 -dress", "opt_clean", "opt -full", "clean"],
-            "speed": ["abc -fast", "opt", "clean"],
-            "balanced": ["abc", "opt", "clean"],
-            "quality": ["opt -full", "abc", "opt -full", "clean"],
-            "timing": ["abc -lut 4", "opt_clean", "abc -lut 4 -dff -D 0.1", "opt -full", "clean"],
-            "extreme": ["opt -full", "abc -lut 4", "opt -full -fine", "abc -lut 4 -dff -D 0.01", "opt -full -fine", "clean"]
-        }
-        
-        commands = strategy_commands.get(self.strategy_name, ["abc", "opt", "clean"])
-        
-        html = f"""
-        <html>
-        <head>
-            <style>
-                .flow-container {{
-                    font-family: Arial, sans-serif;
-                    text-align: center;
-                    padding: 20px;
-                    background-color: white;
-                }}
-                .flow-box {{
-                    background-color: #ffffff;
-                    border: 3px solid #2196F3;
-                    border-radius: 8px;
-                    padding: 15px;
-                    margin: 10px auto;
-                    max-width: 300px;
-                    font-weight: bold;
-                    font-size: 14px;
-                    color: #1565C0;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                .strategy-box {{
-                    background-color: #ffffff;
-                    border: 3px solid #4CAF50;
-                    border-radius: 8px;
-                    padding: 15px;
-                    margin: 10px auto;
-                    max-width: 450px;
-                    font-weight: bold;
-                    color: #2E7D32;
-                    font-size: 14px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                .arrow {{
-                    font-size: 28px;
-                    color: #2196F3;
-                    margin: 8px;
-                    font-weight: bold;
-                }}
-                .command {{
-                    background-color: #F8F9FA;
-                    border: 2px solid #FF9800;
-                    border-radius: 6px;
-                    padding: 8px;
-                    margin: 5px;
-                    font-family: 'Courier New', monospace;
-                    font-size: 13px;
-                    font-weight: bold;
-                    color: #E65100;
-                    display: inline-block;
-                    min-width: 120px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="flow-container">
-                <div class="flow-box">VHDL Input Files</div>
-                <div class="arrow">↓</div>
-                <div class="flow-box">synth -top {{entity}} -flatten</div>
-                <div class="arrow">↓</div>
-                <div class="strategy-box">
-                    <strong>{self.strategy_name.title()} Strategy</strong><br/><br/>
-                    {self._format_commands_html(commands)}
-                </div>
-                <div class="arrow">↓</div>
-                <div class="flow-box">Output Generation</div>
-                <div class="arrow">↓</div>
-                <div class="flow-box">write_verilog<br/>write_json</div>
-            </div>
-        </body>
-        </html>
-        """
-        return html
-    
-    def _format_commands_html(self, commands):
-        """Format commands as HTML."""
-        formatted = ""
-        for cmd in commands:
-            formatted += f'<div class="command">{cmd}</div>'
-        return formatted
+        rendered = _STRATEGY_RENDERED.get(self.strategy_name)
+        return rendered.diagram if rendered else _render_strategy_diagram(self.strategy_name)
     
     def _get_strategy_commands(self):
         """Get the full command sequence for the strategy."""
-        # Load strategy commands from YosysCommands
-        try:
-            from cc_project_manager_pkg.yosys_commands import YosysCommands
-            strategies = YosysCommands.SYNTHESIS_STRATEGIES
-            
-            if self.strategy_name in strategies:
-                commands = strategies[self.strategy_name]
-                full_sequence = [
-                    "# VHDL Analysis and Elaboration",
-                    "ghdl --std=08 --ieee=synopsys [vhdl_files] -e [entity]",
-                    "",
-                    "# Synthesis Strategy Commands",
-                ]
-                
-                for i, cmd in enumerate(commands, 1):
-                    full_sequence.append(f"{i}. {cmd}")
-                
-                full_sequence.extend([
-                    "",
-                    "# Output Generation", 
-                    "write_verilog -noattr [output].v",
-                    "write_json [output].json"
-                ])
-                
-                return "\n".join(full_sequence)
-        except Exception:
-            pass
-        
-        return f"Commands for {self.strategy_name} strategy not available."
+        # Custom strategies are registered at runtime, so they are rendered on demand
+        rendered = _STRATEGY_RENDERED.get(self.strategy_name)
+        return rendered.commands if rendered else _render_strategy_commands(self.strategy_name)
     
     def _get_strategy_description(self):
         """Get detailed description of the strategy."""
-        descriptions = {
-            "area": """
-                <h3>Area-Optimized Strategy</h3>
-                <p><strong>Goal:</strong> Minimize resource usage (LUTs, logic gates)</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><code>abc -lut 4 -dress</code>: Maps to 4-input LUTs with area optimization</li>
-                    <li><code>opt_clean</code>: Removes unused cells and wires</li>
-                    <li><code>opt -full</code>: Performs comprehensive optimizations</li>
-                </ul>
-                <p><strong>Best for:</strong> Designs with tight area constraints or large designs that need to fit in smaller FPGAs</p>
-                <p><strong>Trade-offs:</strong> May sacrifice some performance for smaller area</p>
-            """,
-            "speed": """
-                <h3>Speed-Optimized Strategy</h3>
-                <p><strong>Goal:</strong> Maximize performance/frequency</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><code>abc -fast</code>: Fast technology mapping optimized for speed</li>
-                    <li><code>opt</code>: Basic optimizations to maintain speed focus</li>
-                </ul>
-                <p><strong>Best for:</strong> High-performance designs where timing is critical</p>
-                <p><strong>Trade-offs:</strong> May use more resources to achieve higher speed</p>
-            """,
-            "balanced": """
-                <h3>Balanced Strategy</h3>
-                <p><strong>Goal:</strong> Balance area and speed optimization</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><code>abc</code>: Standard technology mapping</li>
-                    <li><code>opt</code>: Basic optimizations</li>
-                </ul>
-                <p><strong>Best for:</strong> General-purpose designs with no extreme constraints</p>
-                <p><strong>Trade-offs:</strong> Good compromise between area and speed</p>
-            """,
-            "quality": """
-                <h3>Quality-Optimized Strategy</h3>
-                <p><strong>Goal:</strong> Achieve best overall results through thorough optimization</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><code>opt -full</code>: Multiple full optimization passes</li>
-                    <li><code>abc</code>: Standard technology mapping between optimizations</li>
-                </ul>
-                <p><strong>Best for:</strong> Production designs where synthesis time is less important than results</p>
-                <p><strong>Trade-offs:</strong> Longer synthesis time for better quality</p>
-            """,
-            "timing": """
-                <h3>Timing-Driven Strategy</h3>
-                <p><strong>Goal:</strong> Advanced timing-driven optimization</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><code>abc -lut 4</code>: 4-input LUT mapping</li>
-                    <li><code>abc -lut 4 -dff -D 0.1</code>: Timing-driven mapping with 0.1ns delay target</li>
-                    <li><code>opt_clean</code> and <code>opt -full</code>: Comprehensive optimizations</li>
-                </ul>
-                <p><strong>Best for:</strong> Designs with critical timing requirements and complex timing paths</p>
-                <p><strong>Trade-offs:</strong> Longer synthesis time, focus on meeting timing constraints</p>
-            """,
-            "extreme": """
-                <h3>Extreme Performance Strategy</h3>
-                <p><strong>Goal:</strong> Maximum optimization for highest performance</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><code>opt -full</code>: Multiple full optimization passes</li>
-                    <li><code>opt -full -fine</code>: Fine-grained optimizations</li>
-                    <li><code>abc -lut 4 -dff -D 0.01</code>: Aggressive timing-driven mapping with 0.01ns target</li>
-                </ul>
-                <p><strong>Best for:</strong> Performance-critical designs where synthesis time is not a concern</p>
-                <p><strong>Trade-offs:</strong> Significantly longer synthesis time (3-10x), maximum resource usage for performance</p>
-            """
-        }
-        
-        return descriptions.get(self.strategy_name, f"<p>Description for {self.strategy_name} strategy not available.</p>")
+        rendered = _STRATEGY_RENDERED.get(self.strategy_name)
+        if rendered:
+            return rendered.description
+        return f"<p>Description for {self.strategy_name} strategy not available.</p>"
+
+
+# Custom strategy names become YAML keys: letters, digits and underscores only
+_STRATEGY_NAME_RE = re.compile(r'\A[a-zA-Z0-9_]+\Z')
+
+_CUSTOM_STRATEGY_EXAMPLES = """Common Yosys synthesis commands:
+• synth -top {top} -flatten : Main synthesis command
+• abc -fast : Fast technology mapping
+• abc -lut 4 : Map to 4-input LUTs
+• opt -full : Full optimization
+• opt_clean : Remove unused cells
+• clean : Clean up design"""
 
 
 class CustomStrategyDialog(QDialog):
@@ -2320,7 +2166,7 @@ class CustomStrategyDialog(QDialog):
         
         # Title and description
         title = QLabel("Create Custom Synthesis Strategy")
-        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setFont(_FONT_SECTION)
         layout.addWidget(title)
         
         description = QLabel("Create a custom synthesis strategy with your own Yosys commands and options. This strategy will be available in the Run Synthesis dialog.")
@@ -2363,8 +2209,7 @@ class CustomStrategyDialog(QDialog):
             "opt",
             "clean"
         ]
-        for cmd in default_commands:
-            self.commands_list.addItem(cmd)
+        self.commands_list.addItems(default_commands)
         
         commands_layout.addWidget(QLabel("Synthesis Commands:"))
         commands_layout.addWidget(self.commands_list)
@@ -2399,6 +2244,8 @@ class CustomStrategyDialog(QDialog):
         
         self.options_list = QListWidget()
         self.options_list.setMaximumHeight(100)
+        # Texts in options_list, kept in step for duplicate checks
+        self._options_set = set()
         
         options_layout.addWidget(QLabel("Command-Line Options:"))
         options_layout.addWidget(self.options_list)
@@ -2425,19 +2272,14 @@ class CustomStrategyDialog(QDialog):
         
         # Examples
         examples_group = QGroupBox("Common Yosys Commands Examples")
-        examples_layout = QVBoxLayout(examples_group)
-        
-        examples_text = QTextEdit()
-        examples_text.setReadOnly(True)
-        examples_text.setMaximumHeight(100)
-        examples_text.setPlainText("""Common Yosys synthesis commands:
-• synth -top {top} -flatten : Main synthesis command
-• abc -fast : Fast technology mapping
-• abc -lut 4 : Map to 4-input LUTs
-• opt -full : Full optimization
-• opt_clean : Remove unused cells
-• clean : Clean up design""")
-        examples_layout.addWidget(examples_text)
+        examples_layout = QVBoxLayout(examples_group)
+        
+        examples_label = QLabel(_CUSTOM_STRATEGY_EXAMPLES)
+        examples_label.setTextFormat(Qt.PlainText)
+        examples_label.setFont(_FONT_CODE)
+        examples_label.setMaximumHeight(100)
+        examples_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        examples_layout.addWidget(examples_label)
         
         layout.addWidget(examples_group)
         
@@ -2474,9 +2316,10 @@ class CustomStrategyDialog(QDialog):
     
     def remove_command(self):
         """Remove the selected command from the list."""
-        current_row = self.commands_list.currentRow()
-        if current_row >= 0:
-            self.commands_list.takeItem(current_row)
+        item = self.commands_list.currentItem()
+        if item is None:
+            return
+        self.commands_list.takeItem(self.commands_list.row(item))
     
     def add_option(self):
         """Add a new option to the list."""
@@ -2488,19 +2331,21 @@ class CustomStrategyDialog(QDialog):
                 return
             
             # Check for duplicates
-            existing_options = [self.options_list.item(i).text() for i in range(self.options_list.count())]
-            if option in existing_options:
+            if option in self._options_set:
                 self.show_warning("Duplicate Option", f"Option '{option}' is already in the list.")
                 return
             
+            self._options_set.add(option)
             self.options_list.addItem(option)
             self.new_option_input.clear()
     
     def remove_option(self):
         """Remove the selected option from the list."""
-        current_row = self.options_list.currentRow()
-        if current_row >= 0:
-            self.options_list.takeItem(current_row)
+        item = self.options_list.currentItem()
+        if item is None:
+            return
+        self._options_set.discard(item.text())
+        self.options_list.takeItem(self.options_list.row(item))
     
     def load_existing_strategy(self):
         """Load an existing custom strategy for editing."""
@@ -2515,8 +2360,7 @@ class CustomStrategyDialog(QDialog):
             return
         
         # Validate strategy name (no spaces, alphanumeric + underscore)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_]+$', strategy_name):
+        if not _STRATEGY_NAME_RE.match(strategy_name):
             self.show_warning("Invalid Name", "Strategy name should only contain letters, numbers, and underscores.")
             return
         
@@ -2557,12 +2401,10 @@ class CustomStrategyDialog(QDialog):
     
     def show_warning(self, title, message):
         """Show a warning message."""
-        from PyQt5.QtWidgets import QMessageBox
         QMessageBox.warning(self, title, message)
     
     def show_info(self, title, message):
         """Show an info message."""
-        from PyQt5.QtWidgets import QMessageBox
         QMessageBox.information(self, title, message)
     
     def get_strategy_data(self):
@@ -2570,6 +2412,97 @@ class CustomStrategyDialog(QDialog):
         return getattr(self, 'strategy_name', None), getattr(self, 'strategy_data', None)
 
 
+# Operation buttons for the main window tabs: (text, MainWindow method name, tooltip)
+_PROJECT_TAB_BUTTONS = (
+    ("Create New Project", "create_new_project",
+     "Create a new FPGA project with directory structure"),
+    ("Load Existing Project", "load_existing_project",
+     "Load and open an existing project from directory"),
+    ("Add VHDL Files", "add_vhdl_file",
+     "Add VHDL source files to the current project (supports multiple selection)"),
+    ("Remove VHDL File", "remove_vhdl_file",
+     "Remove VHDL file from the project"),
+    ("Detect Manual Files", "detect_manual_files",
+     "Sync project with src, testbench, and constraints folders (add new files, remove deleted ones)"),
+    ("View Project Logs", "view_project_logs",
+     "View project manager log files and operations history"),
+)
+
+_SYNTHESIS_TAB_BUTTONS = (
+    ("Run Synthesis", "run_synthesis",
+     "Synthesize VHDL design to netlist"),
+    ("Configure Synthesis", "configure_synthesis",
+     "Configure synthesis settings and options"),
+    ("Custom Strategy", "configure_custom_strategy",
+     "Create and manage custom synthesis strategies"),
+    ("View Synthesis Logs", "view_synthesis_logs",
+     "View synthesis log files and reports"),
+)
+
+_IMPLEMENTATION_TAB_BUTTONS = (
+    ("Place && Route", "run_place_and_route",
+     "Run place and route on synthesized design (automatically generates bitstream)"),
+    ("Add Constraints File", "add_constraints_file",
+     "Add .ccf constraints file to the project (supports multiple selection)"),
+    ("Remove Constraints File", "remove_constraints_file",
+     "Remove selected constraints file from the project (does not delete the source file)"),
+    ("Generate Post-Impl Netlist", "generate_post_impl_netlist",
+     "Generate post-implementation netlist for simulation"),
+    ("View Implementation Logs", "view_implementation_logs",
+     "View raw implementation log files and reports"),
+)
+
+_ANALYSIS_REPORT_BUTTONS = (
+    ("⏱️ View Timing Report", "view_timing_report",
+     "View detailed timing analysis report"),
+    ("📊 View Utilization Report", "view_utilization_report",
+     "View resource utilization report"),
+    ("📍 View Placement Report", "view_placement_report",
+     "View placement and routing details"),
+    ("⚡ View Power Analysis", "view_power_analysis",
+     "View power consumption analysis"),
+)
+
+_SIMULATION_TAB_BUTTONS = (
+    ("Behavioral Simulation", "behavioral_simulation",
+     "Run behavioral simulation with configuration options"),
+    ("Post-Synthesis Simulation", "post_synthesis_simulation",
+     "Run post-synthesis simulation with configuration options"),
+    ("Configure Simulation", "configure_simulation",
+     "Configure simulation settings and VHDL/IEEE standards"),
+    ("Launch Waveform Viewer", "launch_waveform_viewer",
+     "Open GTKWave for waveform analysis"),
+    ("View Simulation Logs", "view_simulation_logs",
+     "View simulation log files and reports"),
+)
+
+_UPLOAD_TAB_BUTTONS = (
+    ("FPGA Board Selection", "open_board_selection_dialog",
+     "Select and configure FPGA board for programming"),
+    ("Add Custom Board", "open_add_custom_board_dialog",
+     "Add a new custom board configuration"),
+    ("Program SRAM", "program_sram",
+     "Program bitstream to FPGA SRAM (volatile)"),
+    ("Program Flash", "program_flash",
+     "Program bitstream to FPGA Flash (non-volatile)"),
+    ("Detect Devices", "detect_fpga_devices",
+     "Detect connected FPGA devices and cables"),
+    ("Verify Bitstream", "verify_bitstream",
+     "Verify programmed bitstream against file"),
+    ("View Upload Logs", "view_upload_logs",
+     "View openFPGALoader log files and programming history"),
+)
+
+_CONFIG_TAB_BUTTONS = (
+    ("Check Toolchain", "check_toolchain_availability",
+     "Check availability of required tools"),
+    ("Edit Toolchain Paths", "edit_toolchain_paths",
+     "Configure paths to synthesis tools"),
+    ("Configure GTKWave", "configure_gtkwave",
+     "Configure GTKWave path for simulation"),
+)
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
@@ -2584,8 +2517,28 @@ class MainWindow(QMainWindow):
         self.setup_logging()
         self.current_project_path = None
         self.worker_thread = None
+        # Background tool check and whether another one was requested meanwhile
+        self._tool_probe_thread = None
+        self._tool_probe_pending = False
+        # Project config whose tool preferences have been checked against the tools
+        self._tool_prefs_settled_for = None
+        # Refresh requests arriving in quick succession run as one refresh
+        self._toolchain_refresh_timer = QTimer(self)
+        self._toolchain_refresh_timer.setSingleShot(True)
+        self._toolchain_refresh_timer.setInterval(50)
+        self._toolchain_refresh_timer.timeout.connect(self._start_tool_probe)
+        self._project_refresh_timer = QTimer(self)
+        self._project_refresh_timer.setSingleShot(True)
+        self._project_refresh_timer.setInterval(50)
+        self._project_refresh_timer.timeout.connect(self._refresh_project_status_now)
+        # Panels on a hidden tab are refreshed when their tab is next shown
+        self._toolchain_refresh_dirty = False
+        self._project_refresh_dirty = False
         self._known_constraint_files = set()
         self._auto_scan_in_progress = False
+        # settings.json path and its last parse as (mtime_ns, settings)
+        self._settings_file = None
+        self._app_settings_cache = None
         self._setup_auto_folder_scan_timer()
         # Initialize constraint file mapping for tracking which constraint file was used for each design
         self.design_constraint_mapping = {}
@@ -2621,27 +2574,59 @@ class MainWindow(QMainWindow):
             self._schedule_initial_folder_scan()
         
     def _load_app_settings(self) -> dict:
-        """Load application settings from the user settings file."""
+        """Load application settings from the user settings file.
+        
+        The parsed file is reused until its modification time changes, so the
+        periodic folder scan doesn't re-read it while hand edits still apply.
+        """
         try:
-            import json
             settings_file = self.get_settings_file_path()
-            if os.path.exists(settings_file):
+            mtime = os.stat(settings_file).st_mtime_ns
+        except OSError:
+            return {}
+        
+        cached = self._app_settings_cache
+        if cached is None or cached[0] != mtime:
+            try:
                 with open(settings_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            logging.debug(f"Could not load app settings: {e}")
-        return {}
+                    cached = (mtime, json.load(f))
+            except Exception as e:
+                logging.debug(f"Could not load app settings: {e}")
+                return {}
+            self._app_settings_cache = cached
+        return dict(cached[1])
 
-    def _save_app_settings(self, settings: dict) -> None:
-        """Persist application settings to the user settings file."""
+    def _save_app_settings(self, settings: dict) -> bool:
+        """Persist application settings to the user settings file.
+        
+        Nothing is written when ``settings`` matches what is already on disk.
+        
+        Returns:
+            bool: True if the file is up to date
+        """
         try:
-            import json
             settings_file = self.get_settings_file_path()
+            cached = self._app_settings_cache
+            if cached is not None:
+                wanted = {k: v for k, v in settings.items() if k != 'last_updated'}
+                on_disk = {k: v for k, v in cached[1].items() if k != 'last_updated'}
+                if wanted == on_disk and os.path.exists(settings_file) \
+                        and os.stat(settings_file).st_mtime_ns == cached[0]:
+                    return True
             settings['last_updated'] = time.time()
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Write a sibling temp file and swap it in so a crash mid-write
+            # never leaves a truncated settings file behind
+            tmp_file = settings_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(settings, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, settings_file)
+            self._app_settings_cache = (os.stat(settings_file).st_mtime_ns, dict(settings))
+            return True
         except Exception as e:
             logging.warning(f"Failed to save app settings: {e}")
+            return False
 
     def _get_auto_scan_interval_seconds(self) -> int:
         settings = self._load_app_settings()
@@ -2842,53 +2827,27 @@ class MainWindow(QMainWindow):
         
     def get_settings_file_path(self):
         """Get the path to the application settings file."""
-        # Store settings in the user's home directory
-        home_dir = os.path.expanduser("~")
-        settings_dir = os.path.join(home_dir, ".cc_project_manager")
-        os.makedirs(settings_dir, exist_ok=True)
-        return os.path.join(settings_dir, "settings.json")
+        if self._settings_file is None:
+            # Store settings in the user's home directory
+            home_dir = os.path.expanduser("~")
+            settings_dir = os.path.join(home_dir, ".cc_project_manager")
+            os.makedirs(settings_dir, exist_ok=True)
+            self._settings_file = os.path.join(settings_dir, "settings.json")
+        return self._settings_file
     
     def save_recent_project_path(self, project_path):
         """Save the most recently opened project path to settings."""
-        try:
-            import json
-            settings_file = self.get_settings_file_path()
-            
-            # Load existing settings or create new ones
-            settings = {}
-            if os.path.exists(settings_file):
-                try:
-                    with open(settings_file, 'r') as f:
-                        settings = json.load(f)
-                except:
-                    settings = {}
-            
-            # Update the recent project path
-            settings['recent_project_path'] = os.path.abspath(project_path)
-            settings['last_updated'] = time.time()
-            
-            # Save settings
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
-                
+        # Existing settings are kept; an unreadable file starts over from scratch
+        settings = self._load_app_settings()
+        settings['recent_project_path'] = os.path.abspath(project_path)
+        
+        if self._save_app_settings(settings):
             logging.info(f"💾 Saved recent project path: {project_path}")
-            
-        except Exception as e:
-            logging.warning(f"Failed to save recent project path: {e}")
     
     def load_recent_project_path(self):
         """Load the most recently opened project path from settings."""
         try:
-            import json
-            settings_file = self.get_settings_file_path()
-            
-            if not os.path.exists(settings_file):
-                return None
-                
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-            
-            recent_path = settings.get('recent_project_path')
+            recent_path = self._load_app_settings().get('recent_project_path')
             if recent_path and os.path.exists(recent_path):
                 logging.info(f"📂 Found recent project path: {recent_path}")
                 return recent_path
@@ -2902,8 +2861,20 @@ class MainWindow(QMainWindow):
             return None
     
     def load_recent_project_on_startup(self):
-        """Load the most recent project on application startup."""
+        """Load the most recent project on application startup.
+        
+        When the application is started from inside a project directory that
+        project is used as-is and the recent project setting is not consulted.
+        """
         try:
+            # Only the directory itself counts; walking below it could scan a
+            # whole home directory and pick up an unrelated nested project
+            project_config_path, project_dir = self.find_project_config(os.getcwd(), search_subdirs=False)
+            if project_config_path:
+                self.current_project_path = project_dir
+                logging.info(f"✅ Using project in current directory: {project_dir}")
+                return True
+            
             recent_path = self.load_recent_project_path()
             
             if recent_path:
@@ -2929,19 +2900,15 @@ class MainWindow(QMainWindow):
     def clear_recent_project(self):
         """Clear the recent project setting."""
         try:
-            import json
             settings_file = self.get_settings_file_path()
             
             if os.path.exists(settings_file):
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
+                settings = self._load_app_settings()
                 
                 if 'recent_project_path' in settings:
                     del settings['recent_project_path']
-                    settings['last_updated'] = time.time()
-                    
-                    with open(settings_file, 'w') as f:
-                        json.dump(settings, f, indent=2)
+                    if not self._save_app_settings(settings):
+                        raise OSError(f"could not write {settings_file}")
                     
                     logging.info("Recent project setting cleared")
                     self.show_message("Recent Project Cleared", 
@@ -2971,6 +2938,9 @@ class MainWindow(QMainWindow):
         # Set application icon (if available)
         # self.setWindowIcon(QIcon('icon.png'))
         
+        # Build the whole widget tree without intermediate repaints
+        self.setUpdatesEnabled(False)
+        
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -3000,49 +2970,96 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
         
-        # Apply stylesheet for better appearance
+        # Apply stylesheet for better appearance, once the widget tree exists
         self.apply_stylesheet()
+        self.setUpdatesEnabled(True)
         
         # Perform initial status checks after UI is fully initialized
-        QTimer.singleShot(100, self.refresh_toolchain_status)
-        QTimer.singleShot(200, self.refresh_project_status)
-        QTimer.singleShot(300, self.refresh_synthesis_status)
-        QTimer.singleShot(400, self.refresh_implementation_status)
-        QTimer.singleShot(500, self.refresh_simulation_status)
+        # (the other tabs refresh when they are first built)
+        QTimer.singleShot(100, self._initial_refresh)
+    
+    def _initial_refresh(self):
+        """Refresh the startup tab's status panel and settle tool preferences."""
+        self.refresh_project_status()
+        # Settles tool preferences even before the Configuration tab is built
+        self._start_tool_probe()
     
     def create_content_area(self):
         """Create the main content area with tabs for different sections."""
         self.tab_widget = QTabWidget()
         
+        # Selections made in tabs that may not be built yet
+        self.selected_design = None
+        self.selected_tree_item = None
+        self.selected_testbench = None
+        self.selected_testbench_item = None
+        self.selected_simulation_item = None
+        self.selected_bitstream = None
+        self.selected_bitstream_item = None
+        
         # Project Management Tab
         project_tab = self.create_project_tab()
         self.tab_widget.addTab(project_tab, "Project Management")
         
-        # Synthesis Tab
-        synthesis_tab = self.create_synthesis_tab()
-        self.tab_widget.addTab(synthesis_tab, "Synthesis")
-        
-        # Implementation Tab
-        implementation_tab = self.create_implementation_tab()
-        self.tab_widget.addTab(implementation_tab, "Implementation")
-        
-        # Simulation Tab
-        simulation_tab = self.create_simulation_tab()
-        self.tab_widget.addTab(simulation_tab, "Simulation")
-        
-        # Upload Tab
-        upload_tab = self.create_upload_tab()
-        self.tab_widget.addTab(upload_tab, "Upload")
-        
-        # Configuration Tab
-        config_tab = self.create_config_tab()
-        self.tab_widget.addTab(config_tab, "Configuration")
+        # Synthesis, Implementation, Simulation and Upload start as empty placeholders
+        # and are built by on_tab_changed the first time they are shown
+        self._tab_builders = {}
+        for title, builder in (("Synthesis", self.create_synthesis_tab),
+                               ("Implementation", self.create_implementation_tab),
+                               ("Simulation", self.create_simulation_tab),
+                               ("Upload", self.create_upload_tab)):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
+        
+        # Configuration Tab (also built on first visit; tool preferences are
+        # settled at startup without it)
+        index = self.tab_widget.addTab(QWidget(), "Configuration")
+        self._tab_builders[index] = self.create_config_tab
         
         # Connect tab change signal for automatic refresh
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         return self.tab_widget
     
+    def _is_on_current_tab(self, widget):
+        """Return whether widget is part of the tab currently shown."""
+        current = self.tab_widget.currentWidget()
+        return current is widget or (current is not None and current.isAncestorOf(widget))
+    
+    def _ensure_tab_built(self, index):
+        """Build the content of a lazily created tab the first time it is shown."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        
+        placeholder = self.tab_widget.widget(index)
+        placeholder.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout(placeholder)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(builder())
+        finally:
+            placeholder.setUpdatesEnabled(True)
+    
+    def _add_tab_buttons(self, layout, specs, min_height=40, object_name=None):
+        """Add the operation buttons described by ``specs`` to a tab layout.
+        
+        Each spec is ``(text, method_name, tooltip)``; the method is looked up on
+        this window. Returns the created buttons keyed by method name.
+        """
+        created = {}
+        for text, method_name, tooltip in specs:
+            btn = QPushButton(text)
+            btn.clicked.connect(getattr(self, method_name))
+            btn.setToolTip(tooltip)
+            btn.setMinimumHeight(min_height)
+            btn.setMaximumWidth(380)  # Limit button width
+            if object_name:
+                btn.setObjectName(object_name)
+            layout.addWidget(btn)
+            created[method_name] = btn
+        return created
+    
     def create_project_tab(self):
         """Create the project management tab."""
         widget = QWidget()
@@ -3054,22 +3071,7 @@ class MainWindow(QMainWindow):
         project_layout = QVBoxLayout(project_group)
         
         # Project buttons
-        buttons = [
-            ("Create New Project", self.create_new_project, "Create a new FPGA project with directory structure"),
-            ("Load Existing Project", self.load_existing_project, "Load and open an existing project from directory"),
-            ("Add VHDL Files", self.add_vhdl_file, "Add VHDL source files to the current project (supports multiple selection)"),
-            ("Remove VHDL File", self.remove_vhdl_file, "Remove VHDL file from the project"),
-            ("Detect Manual Files", self.detect_manual_files, "Sync project with src, testbench, and constraints folders (add new files, remove deleted ones)"),
-            ("View Project Logs", self.view_project_logs, "View project manager log files and operations history")
-        ]
-        
-        for text, callback, tooltip in buttons:
-            btn = QPushButton(text)
-            btn.clicked.connect(callback)
-            btn.setToolTip(tooltip)
-            btn.setMinimumHeight(40)
-            btn.setMaximumWidth(380)  # Limit button width
-            project_layout.addWidget(btn)
+        self._add_tab_buttons(project_layout, _PROJECT_TAB_BUTTONS)
         
         # Add stretch to keep buttons at top with consistent spacing
         project_layout.addStretch()
@@ -3093,20 +3095,7 @@ class MainWindow(QMainWindow):
         synthesis_group.setMaximumWidth(400)  # Limit container width
         synthesis_layout = QVBoxLayout(synthesis_group)
         
-        buttons = [
-            ("Run Synthesis", self.run_synthesis, "Synthesize VHDL design to netlist"),
-            ("Configure Synthesis", self.configure_synthesis, "Configure synthesis settings and options"),
-            ("Custom Strategy", self.configure_custom_strategy, "Create and manage custom synthesis strategies"),
-            ("View Synthesis Logs", self.view_synthesis_logs, "View synthesis log files and reports")
-        ]
-        
-        for text, callback, tooltip in buttons:
-            btn = QPushButton(text)
-            btn.clicked.connect(callback)
-            btn.setToolTip(tooltip)
-            btn.setMinimumHeight(40)
-            btn.setMaximumWidth(380)  # Limit button width
-            synthesis_layout.addWidget(btn)
+        self._add_tab_buttons(synthesis_layout, _SYNTHESIS_TAB_BUTTONS)
         
         # Add stretch to keep buttons at top with consistent spacing
         synthesis_layout.addStretch()
@@ -3118,6 +3107,9 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(synthesis_group)
         main_layout.addWidget(self.synthesis_status_widget, 1)  # Give status panel more space
         
+        # Fill the status panel once the tab is on screen
+        QTimer.singleShot(0, self.refresh_synthesis_status)
+        
         return widget
     
     def create_implementation_tab(self):
@@ -3130,23 +3122,7 @@ class MainWindow(QMainWindow):
         impl_group.setMaximumWidth(400)  # Limit container width
         impl_layout = QVBoxLayout(impl_group)
         
-
-        
-        buttons = [
-            ("Place && Route", self.run_place_and_route, "Run place and route on synthesized design (automatically generates bitstream)"),
-            ("Add Constraints File", self.add_constraints_file, "Add .ccf constraints file to the project (supports multiple selection)"),
-            ("Remove Constraints File", self.remove_constraints_file, "Remove selected constraints file from the project (does not delete the source file)"),
-            ("Generate Post-Impl Netlist", self.generate_post_impl_netlist, "Generate post-implementation netlist for simulation"),
-            ("View Implementation Logs", self.view_implementation_logs, "View raw implementation log files and reports")
-        ]
-        
-        for text, callback, tooltip in buttons:
-            btn = QPushButton(text)
-            btn.clicked.connect(callback)
-            btn.setToolTip(tooltip)
-            btn.setMinimumHeight(40)
-            btn.setMaximumWidth(380)  # Limit button width
-            impl_layout.addWidget(btn)
+        self._add_tab_buttons(impl_layout, _IMPLEMENTATION_TAB_BUTTONS)
         
         # Add separator
         separator = QFrame()
@@ -3156,37 +3132,24 @@ class MainWindow(QMainWindow):
         
         # Analysis section header
         analysis_label = QLabel("📊 Analysis Reports")
-        analysis_label.setFont(QFont("Arial", 10, QFont.Bold))
+        analysis_label.setFont(_FONT_SUBSECTION)
         analysis_label.setStyleSheet("color: #4CAF50; margin: 10px 0px 5px 0px;")
         impl_layout.addWidget(analysis_label)
         
         # Analysis note
         analysis_note = QLabel("Click on an implemented design in the Design/File container to select it for analysis:")
-        analysis_note.setFont(QFont("Arial", 9))
-        analysis_note.setStyleSheet("color: #888888; margin: 10px 0px 10px 0px; font-style: italic;")
+        analysis_note.setFont(_FONT_NOTE)
+        analysis_note.setObjectName("analysis-note")
         analysis_note.setWordWrap(True)
         impl_layout.addWidget(analysis_note)
         
         # Status label for selected design
         self.selected_design_status = QLabel("No design selected")
-        self.selected_design_status.setStyleSheet("color: #888888; font-size: 11px; margin: 5px 0px 10px 0px;")
+        self.selected_design_status.setObjectName("design-status")
         impl_layout.addWidget(self.selected_design_status)
         
-        analysis_buttons = [
-            ("⏱️ View Timing Report", self.view_timing_report, "View detailed timing analysis report"),
-            ("📊 View Utilization Report", self.view_utilization_report, "View resource utilization report"),
-            ("📍 View Placement Report", self.view_placement_report, "View placement and routing details"),
-            ("⚡ View Power Analysis", self.view_power_analysis, "View power consumption analysis")
-        ]
-        
-        for text, callback, tooltip in analysis_buttons:
-            btn = QPushButton(text)
-            btn.clicked.connect(callback)
-            btn.setToolTip(tooltip)
-            btn.setMinimumHeight(35)
-            btn.setMaximumWidth(380)
-            btn.setStyleSheet("QPushButton { background-color: #2E3440; color: #D8DEE9; border: 1px solid #4C566A; }")
-            impl_layout.addWidget(btn)
+        self._add_tab_buttons(impl_layout, _ANALYSIS_REPORT_BUTTONS,
+                              min_height=35, object_name="analysis-btn")
         
         # Add stretch to keep buttons at top with consistent spacing
         impl_layout.addStretch()
@@ -3198,13 +3161,12 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(impl_group)
         main_layout.addWidget(self.implementation_status_widget, 1)  # Give status panel more space
         
-        # Initialize design selection
-        self.selected_design = None
-        self.selected_tree_item = None
-        
         # Initialize highlighting state
         self._clear_item_highlighting()
         
+        # Fill the status panel once the tab is on screen
+        QTimer.singleShot(0, self.refresh_implementation_status)
+        
         return widget
     
     def create_simulation_tab(self):
@@ -3217,21 +3179,7 @@ class MainWindow(QMainWindow):
         sim_group.setMaximumWidth(400)  # Limit container width
         sim_layout = QVBoxLayout(sim_group)
         
-        buttons = [
-            ("Behavioral Simulation", self.behavioral_simulation, "Run behavioral simulation with configuration options"),
-            ("Post-Synthesis Simulation", self.post_synthesis_simulation, "Run post-synthesis simulation with configuration options"),
-            ("Configure Simulation", self.configure_simulation, "Configure simulation settings and VHDL/IEEE standards"),
-            ("Launch Waveform Viewer", self.launch_waveform_viewer, "Open GTKWave for waveform analysis"),
-            ("View Simulation Logs", self.view_simulation_logs, "View simulation log files and reports")
-        ]
-        
-        for text, callback, tooltip in buttons:
-            btn = QPushButton(text)
-            btn.clicked.connect(callback)
-            btn.setToolTip(tooltip)
-            btn.setMinimumHeight(40)
-            btn.setMaximumWidth(380)  # Limit button width
-            sim_layout.addWidget(btn)
+        self._add_tab_buttons(sim_layout, _SIMULATION_TAB_BUTTONS)
         
         # Add stretch to keep buttons at top with consistent spacing
         sim_layout.addStretch()
@@ -3243,6 +3191,9 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(sim_group)
         main_layout.addWidget(self.simulation_status_widget, 1)  # Give status panel more space
         
+        # Fill the status panel once the tab is on screen
+        QTimer.singleShot(0, self.refresh_simulation_status)
+        
         return widget
     
     def create_upload_tab(self):
@@ -3257,37 +3208,15 @@ class MainWindow(QMainWindow):
         
         # Upload operations section
         operations_label = QLabel("📤 Upload Operations")
-        operations_label.setFont(QFont("Arial", 10, QFont.Bold))
+        operations_label.setFont(_FONT_SUBSECTION)
         operations_label.setStyleSheet("color: #4CAF50; margin: 10px 0px 5px 0px;")
         upload_layout.addWidget(operations_label)
         
-        buttons = [
-            ("FPGA Board Selection", self.open_board_selection_dialog, "Select and configure FPGA board for programming"),
-            ("Add Custom Board", self.open_add_custom_board_dialog, "Add a new custom board configuration"),
-            ("Program SRAM", self.program_sram, "Program bitstream to FPGA SRAM (volatile)"),
-            ("Program Flash", self.program_flash, "Program bitstream to FPGA Flash (non-volatile)"),
-            ("Detect Devices", self.detect_fpga_devices, "Detect connected FPGA devices and cables"),
-            ("Verify Bitstream", self.verify_bitstream, "Verify programmed bitstream against file"),
-            ("View Upload Logs", self.view_upload_logs, "View openFPGALoader log files and programming history")
-        ]
+        upload_buttons = self._add_tab_buttons(upload_layout, _UPLOAD_TAB_BUTTONS)
         
         # Store references to programming buttons for dynamic enabling/disabling
-        self.program_sram_btn = None
-        self.program_flash_btn = None
-        
-        for text, callback, tooltip in buttons:
-            btn = QPushButton(text)
-            btn.clicked.connect(callback)
-            btn.setToolTip(tooltip)
-            btn.setMinimumHeight(40)
-            btn.setMaximumWidth(380)  # Limit button width
-            upload_layout.addWidget(btn)
-            
-            # Store references to programming buttons
-            if text == "Program SRAM":
-                self.program_sram_btn = btn
-            elif text == "Program Flash":
-                self.program_flash_btn = btn
+        self.program_sram_btn = upload_buttons["program_sram"]
+        self.program_flash_btn = upload_buttons["program_flash"]
         
         # Add stretch to keep buttons at top with consistent spacing
         upload_layout.addStretch()
@@ -3321,19 +3250,7 @@ class MainWindow(QMainWindow):
         toolchain_group.setMaximumWidth(400)  # Limit container width
         toolchain_layout = QVBoxLayout(toolchain_group)
         
-        buttons = [
-            ("Check Toolchain", self.check_toolchain_availability, "Check availability of required tools"),
-            ("Edit Toolchain Paths", self.edit_toolchain_paths, "Configure paths to synthesis tools"),
-            ("Configure GTKWave", self.configure_gtkwave, "Configure GTKWave path for simulation")
-        ]
-        
-        for text, callback, tooltip in buttons:
-            btn = QPushButton(text)
-            btn.clicked.connect(callback)
-            btn.setToolTip(tooltip)
-            btn.setMinimumHeight(40)
-            btn.setMaximumWidth(380)  # Limit button width
-            toolchain_layout.addWidget(btn)
+        self._add_tab_buttons(toolchain_layout, _CONFIG_TAB_BUTTONS)
         
         left_layout.addWidget(toolchain_group)
         left_layout.addStretch()
@@ -3347,6 +3264,9 @@ class MainWindow(QMainWindow):
         main_layout.setStretch(0, 0)  # Don't stretch left side
         main_layout.setStretch(1, 1)  # Allow right side to expand
         
+        # Fill the status panel once the tab is on screen
+        QTimer.singleShot(0, self.refresh_toolchain_status)
+        
         return widget
     
     def create_toolchain_status_widget(self):
@@ -3362,11 +3282,11 @@ class MainWindow(QMainWindow):
         tools_layout = QVBoxLayout(tools_frame)
         
         tools_title = QLabel("Individual Tool Status:")
-        tools_title.setFont(QFont("Arial", 10, QFont.Bold))
+        tools_title.setFont(_FONT_SUBSECTION)
         tools_layout.addWidget(tools_title)
         
-        # Create status labels and preference dropdowns for each tool
-        self.tool_status_labels = {}
+        # Create status cards and preference dropdowns for each tool
+        self.tool_status_cards = {}
         tools = ["GHDL", "Yosys", "P&R", "openFPGALoader", "GTKWave"]
         
         for tool in tools:
@@ -3377,7 +3297,7 @@ class MainWindow(QMainWindow):
             # Tool title and preference in header
             tool_header_layout = QHBoxLayout()
             tool_title = QLabel(f"{tool}:")
-            tool_title.setFont(QFont("Arial", 9, QFont.Bold))
+            tool_title.setFont(_FONT_CAPTION)
             tool_header_layout.addWidget(tool_title)
             
             # Add preference dropdown for all tools
@@ -3385,37 +3305,17 @@ class MainWindow(QMainWindow):
                 tool_header_layout.addStretch()
                 
                 pref_label = QLabel("Preference:")
-                pref_label.setFont(QFont("Arial", 8))
+                pref_label.setFont(_FONT_SMALL)
                 tool_header_layout.addWidget(pref_label)
                 
                 pref_dropdown = QComboBox()
                 pref_dropdown.addItems(["PATH", "DIRECT"])
                 pref_dropdown.setMaximumWidth(80)
-                pref_dropdown.setFont(QFont("Arial", 8))
-                # Dark theme styling for dropdown
-                pref_dropdown.setStyleSheet("""
-                    QComboBox {
-                        border: 1px solid #555;
-                        border-radius: 3px;
-                        padding: 1px 4px 1px 3px;
-                        background-color: #3a3a3a;
-                        color: #ffffff;
-                        selection-background-color: #4a4a4a;
-                    }
-                    QComboBox::drop-down {
-                        width: 15px;
-                        border: none;
-                    }
-                    QComboBox::down-arrow {
-                        width: 10px;
-                        height: 10px;
-                    }
-                    QComboBox:hover {
-                        background-color: #4a4a4a;
-                    }
-                """)
+                pref_dropdown.setFont(_FONT_SMALL)
+                # Dark theme styling for dropdown comes from the shared stylesheet
+                pref_dropdown.setObjectName("pref-dropdown")
                 pref_dropdown.currentTextChanged.connect(
-                    lambda value, t=tool: self.on_tool_preference_changed(t, value)
+                    partial(self.on_tool_preference_changed, tool)
                 )
                 tool_header_layout.addWidget(pref_dropdown)
                 
@@ -3423,19 +3323,9 @@ class MainWindow(QMainWindow):
             
             tool_layout.addLayout(tool_header_layout)
             
-            path_label = QLabel("PATH: Checking...")
-            direct_label = QLabel("DIRECT: Checking...")
-            status_label = QLabel("STATUS: Checking...")
-            
-            tool_layout.addWidget(path_label)
-            tool_layout.addWidget(direct_label)
-            tool_layout.addWidget(status_label)
-            
-            self.tool_status_labels[tool] = {
-                'path': path_label,
-                'direct': direct_label,
-                'status': status_label
-            }
+            status_card = ToolStatusCard()
+            tool_layout.addWidget(status_card)
+            self.tool_status_cards[tool] = status_card
             
             tools_layout.addWidget(tool_frame)
         
@@ -3447,7 +3337,7 @@ class MainWindow(QMainWindow):
         advanced_layout = QVBoxLayout(advanced_frame)
         
         advanced_title = QLabel("Advanced Checks:")
-        advanced_title.setFont(QFont("Arial", 10, QFont.Bold))
+        advanced_title.setFont(_FONT_SUBSECTION)
         advanced_layout.addWidget(advanced_title)
         
         self.ghdl_yosys_label = QLabel("GHDL-Yosys Plugin: Checking...")
@@ -3466,15 +3356,14 @@ class MainWindow(QMainWindow):
         
         return status_group
     
+    @pyqtSlot(str, str)
     def on_tool_preference_changed(self, tool_name, preference):
         """Handle tool preference dropdown changes."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
-            tcm = ToolChainManager()
+            tcm = _get_toolchain_manager()
             
             # Map display names to internal tool names
-            tool_map = {"GHDL": "ghdl", "Yosys": "yosys", "P&R": "p_r", "openFPGALoader": "openfpgaloader", "GTKWave": "gtkwave"}
-            internal_tool_name = tool_map.get(tool_name)
+            internal_tool_name = _TOOL_KEYS.get(tool_name)
             
             if internal_tool_name:
                 success = tcm.set_tool_preference(internal_tool_name, preference)
@@ -3490,251 +3379,219 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logging.error(f"Error changing tool preference: {e}")
     
+    def _settle_tool_preference(self, current_pref, path_available, direct_available):
+        """Return the preference a tool should use: its current one unless that is invalid or doesn't work."""
+        # Only apply smart default if current preference is invalid or doesn't work
+        needs_smart_default = False
+        if current_pref not in ["PATH", "DIRECT"] or current_pref == "UNDEFINED":
+            needs_smart_default = True
+        elif current_pref == "PATH" and not path_available:
+            needs_smart_default = True
+        elif current_pref == "DIRECT" and not direct_available:
+            needs_smart_default = True
+        
+        if needs_smart_default:
+            # Prefer PATH if available, then DIRECT, then fallback to PATH
+            if path_available:
+                smart_default = "PATH"
+            elif direct_available:
+                smart_default = "DIRECT"
+            else:
+                smart_default = "PATH"  # Fallback
+            return smart_default
+        
+        return current_pref
+    
+    def _settle_tool_preferences(self, tcm, availability):
+        """Make sure every tool preference points at a working binary where possible.
+        
+        Replaced preferences are written to the project config in a single save.
+        
+        Args:
+            tcm: ToolChainManager holding the preferences
+            availability: Result of _probe_tool_availability
+        """
+        changes = {}
+        for tool_name, (path_available, direct_available) in availability.items():
+            tool_key = _TOOL_KEYS[tool_name]
+            current_pref = tcm.get_tool_preference(tool_key)
+            pref = self._settle_tool_preference(current_pref, path_available, direct_available)
+            if pref != current_pref:
+                logging.info(f"Updated {tool_name} preference from {current_pref} to {pref} (current preference not working)")
+                changes[tool_key] = pref
+        
+        if changes:
+            tcm.set_tool_preferences(changes)
+    
+    @pyqtSlot()
     def refresh_toolchain_status(self):
-        """Refresh the toolchain status display."""
+        """Refresh the toolchain status display.
+        
+        The checks start every tool, so they run on a ToolProbeThread and the
+        display is filled in by _on_tools_probed. Requests within 50 ms of each
+        other are coalesced.
+        """
         # Check if status widgets exist (Configuration tab might not be created yet)
-        if not hasattr(self, 'tool_status_labels'):
+        if not hasattr(self, 'tool_status_cards'):
             return
-            
-        def update_status():
-            try:
-                from cc_project_manager_pkg.toolchain_manager import ToolChainManager
-                tcm = ToolChainManager()
-                
-                # Initialize individual preferences if they don't exist
+        if not self._is_on_current_tab(self.status_widget):
+            self._toolchain_refresh_dirty = True
+            return
+        self._toolchain_refresh_timer.start()
+    
+    def _start_tool_probe(self):
+        """Start the background tool check, or queue one if a check is running."""
+        if self._tool_probe_thread is not None:
+            # Paths may have changed since it started, so check again afterwards
+            self._tool_probe_pending = True
+            return
+        self._tool_probe_pending = False
+        
+        try:
+            tcm = _get_toolchain_manager()
+        except Exception as e:
+            logging.error(f"Error checking tool preferences: {e}")
+            return
+        try:
+            sim_manager = _get_sim_manager()
+        except Exception as e:
+            logging.warning(f"Error checking GTKWave availability: {e}")
+            sim_manager = None
+        
+        thread = ToolProbeThread(tcm, sim_manager, check_plugin=hasattr(self, 'ghdl_yosys_label'))
+        thread.probed.connect(self._on_tools_probed)
+        thread.finished.connect(self._on_tool_probe_finished)
+        thread.finished.connect(thread.deleteLater)
+        self._tool_probe_thread = thread
+        thread.start()
+    
+    @pyqtSlot(dict, object)
+    def _on_tools_probed(self, availability, plugin_ok):
+        """Settle tool preferences from a finished tool check and show the results."""
+        plugin_checked = self._tool_probe_thread.check_plugin
+        
+        try:
+            tcm = _get_toolchain_manager()
+            if self._tool_prefs_settled_for != tcm.config_path:
+                # Repair preferences once per project; refreshes only read them, so
+                # they don't write the config and a user's choice isn't overridden
                 tcm.initialize_individual_tool_preferences()
-                
-                # Update dropdown values with smart defaults and current preferences
-                if hasattr(self, 'tool_preference_dropdowns'):
-                    tool_map = {"GHDL": "ghdl", "Yosys": "yosys", "P&R": "p_r", "openFPGALoader": "openfpgaloader", "GTKWave": "gtkwave"}
-                    for tool_name, dropdown in self.tool_preference_dropdowns.items():
-                        internal_name = tool_map.get(tool_name)
-                        if internal_name and tool_name != "GTKWave":  # Handle GTKWave separately below
-                            # Check availability to set smart defaults
-                            path_available = tcm.check_tool_version_path(internal_name)
-                            direct_available = tcm.check_tool_version_direct(internal_name)
-                            
-                            # Get current preference
-                            current_pref = tcm.get_tool_preference(internal_name)
-                            
-                            # Only apply smart default if current preference is invalid or doesn't work
-                            needs_smart_default = False
-                            if current_pref not in ["PATH", "DIRECT"] or current_pref == "UNDEFINED":
-                                needs_smart_default = True
-                            elif current_pref == "PATH" and not path_available:
-                                needs_smart_default = True
-                            elif current_pref == "DIRECT" and not direct_available:
-                                needs_smart_default = True
-                            
-                            if needs_smart_default:
-                                # Set smart default based on availability
-                                # Prefer PATH if available, then DIRECT, then fallback to PATH
-                                if path_available:
-                                    smart_default = "PATH"
-                                elif direct_available:
-                                    smart_default = "DIRECT"
-                                else:
-                                    smart_default = "PATH"  # Fallback
-                                
-                                tcm.set_tool_preference(internal_name, smart_default)
-                                logging.info(f"Updated {tool_name} preference from {current_pref} to {smart_default} (current preference not working)")
-                                current_pref = smart_default
-                            
-                            # Update dropdown to reflect current preference
-                            dropdown.blockSignals(True)
-                            dropdown.setCurrentText(current_pref)
-                            dropdown.blockSignals(False)
-                
-                # Handle GTKWave separately (uses different config system)
-                if "GTKWave" in self.tool_preference_dropdowns:
-                    try:
-                        from cc_project_manager_pkg.simulation_manager import SimulationManager
-                        sim_manager = SimulationManager()
-                        
-                        # Check availability
-                        path_available = sim_manager.check_gtkwave_path()
-                        direct_available = sim_manager.check_gtkwave_direct()
-                        
-                        # Get current GTKWave preference
-                        gtkwave_pref = tcm.get_tool_preference("gtkwave")
-                        
-                        # Only apply smart default if current preference is invalid or doesn't work
-                        needs_smart_default = False
-                        if gtkwave_pref not in ["PATH", "DIRECT"] or gtkwave_pref == "UNDEFINED":
-                            needs_smart_default = True
-                        elif gtkwave_pref == "PATH" and not path_available:
-                            needs_smart_default = True
-                        elif gtkwave_pref == "DIRECT" and not direct_available:
-                            needs_smart_default = True
-                        
-                        if needs_smart_default:
-                            # Set smart default for GTKWave based on availability
-                            if path_available:
-                                smart_default = "PATH"
-                            elif direct_available:
-                                smart_default = "DIRECT"
-                            else:
-                                smart_default = "PATH"  # Fallback
-                            
-                            tcm.set_tool_preference("gtkwave", smart_default)
-                            logging.info(f"Updated GTKWave preference from {gtkwave_pref} to {smart_default} (current preference not working)")
-                            gtkwave_pref = smart_default
-                        
-                        # Update GTKWave dropdown
-                        gtkwave_dropdown = self.tool_preference_dropdowns["GTKWave"]
-                        gtkwave_dropdown.blockSignals(True)
-                        gtkwave_dropdown.setCurrentText(gtkwave_pref)
-                        gtkwave_dropdown.blockSignals(False)
-                        
-                    except Exception as e:
-                        logging.warning(f"Error handling GTKWave preferences: {e}")
-                
-                # Get legacy preference for display (backward compatibility)
-                legacy_preference = tcm.config.get("cologne_chip_gatemate_toolchain_preference", "MIXED")
-                
-                # Check individual tools status
-                tools_map = {"GHDL": "ghdl", "Yosys": "yosys", "P&R": "p_r", "openFPGALoader": "openfpgaloader"}
-                
-                for tool_name, tool_key in tools_map.items():
-                    labels = self.tool_status_labels[tool_name]
-                    
-                    # Check PATH availability
-                    path_available = tcm.check_tool_version_path(tool_key)
-                    if path_available:
-                        labels['path'].setText("PATH: ✅ Available")
-                        labels['path'].setStyleSheet("color: #4CAF50;")
-                    else:
-                        labels['path'].setText("PATH: ❌ Not available")
-                        labels['path'].setStyleSheet("color: #F44336;")
-                    
-                    # Check direct path availability
-                    direct_available = tcm.check_tool_version_direct(tool_key)
-                    direct_path = tcm.config.get("cologne_chip_gatemate_toolchain_paths", {}).get(tool_key, "")
-                    if direct_available:
-                        labels['direct'].setText("DIRECT: ✅ Available")
-                        labels['direct'].setStyleSheet("color: #4CAF50;")
-                        labels['direct'].setToolTip(direct_path)
-                    elif direct_path:
-                        labels['direct'].setText("DIRECT: ❌ Path not found")
-                        labels['direct'].setStyleSheet("color: #F44336;")
-                        labels['direct'].setToolTip(direct_path)
-                    else:
-                        labels['direct'].setText("DIRECT: ⚠️ Not configured")
-                        labels['direct'].setStyleSheet("color: #FF9800;")
-                        labels['direct'].setToolTip("")
-                    
-                    # Overall tool status based on current preference
-                    current_pref = tcm.get_tool_preference(tool_key)
-                    if current_pref == "PATH" and path_available:
-                        labels['status'].setText("STATUS: ✅ READY (using PATH)")
-                        labels['status'].setStyleSheet("color: #4CAF50;")
-                    elif current_pref == "DIRECT" and direct_available:
-                        labels['status'].setText("STATUS: ✅ READY (using DIRECT)")
-                        labels['status'].setStyleSheet("color: #4CAF50;")
-                    elif current_pref == "PATH" and not path_available and direct_available:
-                        labels['status'].setText("STATUS: ⚠️ PATH not available, DIRECT ready")
-                        labels['status'].setStyleSheet("color: #FF9800;")
-                    elif current_pref == "DIRECT" and not direct_available and path_available:
-                        labels['status'].setText("STATUS: ⚠️ DIRECT not configured, PATH available")
-                        labels['status'].setStyleSheet("color: #FF9800;")
-                    elif current_pref == "PATH" and not path_available:
-                        labels['status'].setText("STATUS: ❌ PATH not available")
-                        labels['status'].setStyleSheet("color: #F44336;")
-                    elif current_pref == "DIRECT" and not direct_available:
-                        labels['status'].setText("STATUS: ❌ DIRECT path not configured")
-                        labels['status'].setStyleSheet("color: #F44336;")
-                    else:
-                        labels['status'].setText("STATUS: ❌ NOT AVAILABLE")
-                        labels['status'].setStyleSheet("color: #F44336;")
-                
-                # Check GTKWave separately using SimulationManager
-                try:
-                    from cc_project_manager_pkg.simulation_manager import SimulationManager
-                    sim_manager = SimulationManager()
-                    gtkwave_labels = self.tool_status_labels["GTKWave"]
-                    
-                    # Check PATH availability
-                    path_available = sim_manager.check_gtkwave_path()
-                    if path_available:
-                        gtkwave_labels['path'].setText("PATH: ✅ Available")
-                        gtkwave_labels['path'].setStyleSheet("color: #4CAF50;")
-                    else:
-                        gtkwave_labels['path'].setText("PATH: ❌ Not available")
-                        gtkwave_labels['path'].setStyleSheet("color: #F44336;")
-                    
-                    # Check direct path availability
-                    direct_available = sim_manager.check_gtkwave_direct()
-                    if direct_available:
-                        direct_path = sim_manager.project_config.get("gtkwave_tool_path", {}).get("gtkwave", "")
-                        gtkwave_labels['direct'].setText("DIRECT: ✅ Available")
-                        gtkwave_labels['direct'].setStyleSheet("color: #4CAF50;")
-                        gtkwave_labels['direct'].setToolTip(direct_path)
-                    else:
-                        gtkwave_labels['direct'].setText("DIRECT: ⚠️ Not configured")
-                        gtkwave_labels['direct'].setStyleSheet("color: #FF9800;")
-                        gtkwave_labels['direct'].setToolTip("")
-                    
-                    # Overall GTKWave status based on current preference
-                    gtkwave_pref = tcm.get_tool_preference("gtkwave")
-                    logging.debug(f"GTKWave preference: '{gtkwave_pref}', PATH available: {path_available}, DIRECT available: {direct_available}")
-                    
-                    if gtkwave_pref == "PATH" and path_available:
-                        gtkwave_labels['status'].setText("STATUS: ✅ READY (using PATH)")
-                        gtkwave_labels['status'].setStyleSheet("color: #4CAF50;")
-                    elif gtkwave_pref == "DIRECT" and direct_available:
-                        gtkwave_labels['status'].setText("STATUS: ✅ READY (using DIRECT)")
-                        gtkwave_labels['status'].setStyleSheet("color: #4CAF50;")
-                    elif gtkwave_pref == "PATH" and not path_available and direct_available:
-                        gtkwave_labels['status'].setText("STATUS: ⚠️ PATH not available, DIRECT ready")
-                        gtkwave_labels['status'].setStyleSheet("color: #FF9800;")
-                    elif gtkwave_pref == "DIRECT" and not direct_available and path_available:
-                        gtkwave_labels['status'].setText("STATUS: ⚠️ DIRECT not configured, PATH available")
-                        gtkwave_labels['status'].setStyleSheet("color: #FF9800;")
-                    elif gtkwave_pref == "PATH" and not path_available:
-                        gtkwave_labels['status'].setText("STATUS: ❌ PATH not available")
-                        gtkwave_labels['status'].setStyleSheet("color: #F44336;")
-                    elif gtkwave_pref == "DIRECT" and not direct_available:
-                        gtkwave_labels['status'].setText("STATUS: ❌ DIRECT path not configured")
-                        gtkwave_labels['status'].setStyleSheet("color: #F44336;")
-                    else:
-                        gtkwave_labels['status'].setText("STATUS: ❌ NOT AVAILABLE")
-                        gtkwave_labels['status'].setStyleSheet("color: #F44336;")
-                        logging.debug(f"GTKWave fell through to NOT AVAILABLE case - pref: '{gtkwave_pref}', PATH: {path_available}, DIRECT: {direct_available}")
-                        
-                except Exception as e:
-                    # Handle case where SimulationManager fails to initialize
-                    gtkwave_labels = self.tool_status_labels["GTKWave"]
-                    gtkwave_labels['path'].setText("PATH: ❌ Check failed")
-                    gtkwave_labels['path'].setStyleSheet("color: #F44336;")
-                    gtkwave_labels['direct'].setText("DIRECT: ❌ Check failed")
-                    gtkwave_labels['direct'].setStyleSheet("color: #F44336;")
-                    gtkwave_labels['status'].setText("STATUS: ❌ ERROR")
-                    gtkwave_labels['status'].setStyleSheet("color: #F44336;")
-                    logging.warning(f"Failed to check GTKWave status: {e}")
-                
-                # Check GHDL-Yosys plugin
-                try:
-                    ghdl_yosys_ok = tcm.check_ghdl_yosys_link()
-                    if ghdl_yosys_ok:
-                        self.ghdl_yosys_label.setText("GHDL-Yosys Plugin: ✅ Available")
-                        self.ghdl_yosys_label.setStyleSheet("color: #4CAF50;")
-                    else:
-                        self.ghdl_yosys_label.setText("GHDL-Yosys Plugin: ⚠️ Not working properly")
-                        self.ghdl_yosys_label.setStyleSheet("color: #FF9800;")
-                except Exception:
-                    self.ghdl_yosys_label.setText("GHDL-Yosys Plugin: ❌ Check failed")
-                    self.ghdl_yosys_label.setStyleSheet("color: #F44336;")
-                
-
-                    
+                self._settle_tool_preferences(tcm, availability)
+                self._tool_prefs_settled_for = tcm.config_path
+            prefs = {tool_name: tcm.get_tool_preference(_TOOL_KEYS[tool_name])
+                     for tool_name in availability}
+        except Exception as e:
+            logging.error(f"Error checking tool preferences: {e}")
+            prefs = None
+        
+        if prefs is not None and hasattr(self, 'tool_status_cards'):
+            # Repaint the panel once at the end rather than after every label change
+            self.status_widget.setUpdatesEnabled(False)
+            try:
+                self._show_toolchain_status(tcm, availability, prefs, plugin_checked, plugin_ok)
             except Exception as e:
                 logging.error(f"Error updating toolchain status: {e}")
+            finally:
+                self.status_widget.setUpdatesEnabled(True)
+    
+    @pyqtSlot()
+    def _on_tool_probe_finished(self):
+        """Release the finished tool check and run a queued one."""
+        # Results arrive while run() is still returning, so the thread is only
+        # released once it has actually stopped
+        self._tool_probe_thread = None
+        if self._tool_probe_pending:
+            self._start_tool_probe()
+    
+    def _show_toolchain_status(self, tcm, availability, prefs, plugin_checked, plugin_ok):
+        """Fill the Configuration tab's status panel from a tool check."""
+        # Show the settled preferences in the dropdowns; unchanged ones are left
+        # alone, and changed ones must not report back as a user choice
+        for tool_name, dropdown in self.tool_preference_dropdowns.items():
+            pref = prefs.get(tool_name)
+            if pref is not None and dropdown.currentText() != pref:
+                with QSignalBlocker(dropdown):
+                    dropdown.setCurrentText(pref)
+        
+        # Get legacy preference for display (backward compatibility)
+        legacy_preference = tcm.config.get("cologne_chip_gatemate_toolchain_preference", "MIXED")
+        
+        # Check individual tools status
+        for tool_name, tool_key in _TOOL_KEYS.items():
+            if tool_name == "GTKWave":
+                continue
+            card = self.tool_status_cards[tool_name]
+            path_available, direct_available = availability[tool_name]
+            
+            # Show PATH availability
+            if path_available:
+                card.setLine('path', "PATH: ✅ Available", "ok")
+            else:
+                card.setLine('path', "PATH: ❌ Not available", "error")
+            
+            # Show direct path availability
+            direct_path = tcm.config.get("cologne_chip_gatemate_toolchain_paths", {}).get(tool_key, "")
+            if direct_available:
+                card.setLine('direct', "DIRECT: ✅ Available", "ok", direct_path)
+            elif direct_path:
+                card.setLine('direct', "DIRECT: ❌ Path not found", "error", direct_path)
+            else:
+                card.setLine('direct', "DIRECT: ⚠️ Not configured", "warning")
+            
+            # Overall tool status based on current preference
+            current_pref = tcm.get_tool_preference(tool_key)
+            text, state = _TOOL_STATUS.get((current_pref, path_available, direct_available),
+                                           _TOOL_STATUS_UNAVAILABLE)
+            card.setLine('status', text, state)
         
-        # Run status update directly (no need for thread since it's just UI updates)
+        # Check GTKWave separately using SimulationManager
         try:
-            update_status()
+            sim_manager = _get_sim_manager()
+            gtkwave_card = self.tool_status_cards["GTKWave"]
+            path_available, direct_available = availability["GTKWave"]
+            
+            # Show PATH availability
+            if path_available:
+                gtkwave_card.setLine('path', "PATH: ✅ Available", "ok")
+            else:
+                gtkwave_card.setLine('path', "PATH: ❌ Not available", "error")
+            
+            # Show direct path availability
+            if direct_available:
+                direct_path = sim_manager.project_config.get("gtkwave_tool_path", {}).get("gtkwave", "")
+                gtkwave_card.setLine('direct', "DIRECT: ✅ Available", "ok", direct_path)
+            else:
+                gtkwave_card.setLine('direct', "DIRECT: ⚠️ Not configured", "warning")
+            
+            # Overall GTKWave status based on current preference
+            gtkwave_pref = tcm.get_tool_preference("gtkwave")
+            logging.debug(f"GTKWave preference: '{gtkwave_pref}', PATH available: {path_available}, DIRECT available: {direct_available}")
+            
+            status = _TOOL_STATUS.get((gtkwave_pref, path_available, direct_available))
+            if status is None:
+                status = _TOOL_STATUS_UNAVAILABLE
+                logging.debug(f"GTKWave fell through to NOT AVAILABLE case - pref: '{gtkwave_pref}', PATH: {path_available}, DIRECT: {direct_available}")
+            gtkwave_card.setLine('status', *status)
+                
         except Exception as e:
-            logging.error(f"Error updating toolchain status: {e}")
+            # Handle case where SimulationManager fails to initialize
+            gtkwave_card = self.tool_status_cards["GTKWave"]
+            gtkwave_card.setLine('path', "PATH: ❌ Check failed", "error")
+            gtkwave_card.setLine('direct', "DIRECT: ❌ Check failed", "error")
+            gtkwave_card.setLine('status', "STATUS: ❌ ERROR", "error")
+            logging.warning(f"Failed to check GTKWave status: {e}")
+        
+        # Show the GHDL-Yosys plugin check, if this probe ran it
+        if plugin_checked:
+            if plugin_ok is None:
+                self.ghdl_yosys_label.setText("GHDL-Yosys Plugin: ❌ Check failed")
+                _set_label_state(self.ghdl_yosys_label, "error")
+            elif plugin_ok:
+                self.ghdl_yosys_label.setText("GHDL-Yosys Plugin: ✅ Available")
+                _set_label_state(self.ghdl_yosys_label, "ok")
+            else:
+                self.ghdl_yosys_label.setText("GHDL-Yosys Plugin: ⚠️ Not working properly")
+                _set_label_state(self.ghdl_yosys_label, "warning")
     
     def create_project_status_widget(self):
         """Create the project status display widget."""
@@ -3747,7 +3604,7 @@ class MainWindow(QMainWindow):
         info_layout = QVBoxLayout(info_frame)
         
         self.project_name_label = QLabel("Project: Not loaded")
-        self.project_name_label.setFont(QFont("Arial", 10, QFont.Bold))
+        self.project_name_label.setFont(_FONT_SUBSECTION)
         info_layout.addWidget(self.project_name_label)
         
         self.project_path_label = QLabel("Path: Unknown")
@@ -3764,7 +3621,7 @@ class MainWindow(QMainWindow):
         files_layout = QVBoxLayout(files_frame)
         
         files_title = QLabel("Project Files")
-        files_title.setFont(QFont("Arial", 9, QFont.Bold))
+        files_title.setFont(_FONT_CAPTION)
         files_layout.addWidget(files_title)
         
         self.files_tree = QTreeWidget()
@@ -3822,7 +3679,7 @@ class MainWindow(QMainWindow):
         stats_layout = QVBoxLayout(stats_frame)
         
         stats_title = QLabel("Statistics")
-        stats_title.setFont(QFont("Arial", 9, QFont.Bold))
+        stats_title.setFont(_FONT_CAPTION)
         stats_layout.addWidget(stats_title)
         
         self.stats_labels = {
@@ -3856,8 +3713,25 @@ class MainWindow(QMainWindow):
         
         return status_group
     
+    @pyqtSlot()
     def refresh_project_status(self):
-        """Refresh the project status display."""
+        """Refresh the project status display; requests within 50 ms are coalesced."""
+        if not self._is_on_current_tab(self.project_status_widget):
+            self._project_refresh_dirty = True
+            return
+        self._project_refresh_timer.start()
+    
+    def _refresh_project_status_now(self):
+        """Refresh the project status display immediately."""
+        # Repaint the panel once at the end rather than after every tree and label change
+        self.project_status_widget.setUpdatesEnabled(False)
+        try:
+            self._update_project_status()
+        finally:
+            self.project_status_widget.setUpdatesEnabled(True)
+    
+    def _update_project_status(self):
+        """Fill the project status panel from the project configuration."""
         try:
             logging.info("🔄 Refreshing project status...")
             from cc_project_manager_pkg.hierarchy_manager import HierarchyManager
@@ -3869,7 +3743,7 @@ class MainWindow(QMainWindow):
                 # No project found
                 logging.warning("❌ No project configuration found")
                 self.project_name_label.setText("Project: Error loading")
-                self.project_name_label.setStyleSheet("color: #F44336;")
+                _set_label_state(self.project_name_label, "error")
                 self.project_path_label.setText("Path: Check project configuration")
                 self.files_tree.clear()
                 
@@ -3879,7 +3753,9 @@ class MainWindow(QMainWindow):
                 self.stats_labels['testbenches'].setText("Testbenches: 0")
                 self.stats_labels['missing'].setText("Missing: 0")
                 self.stats_labels['implemented'].setText("Implemented: 0")
+                _set_label_state(self.stats_labels['implemented'], "muted")
                 self.stats_labels['bitstreams'].setText("Bitstreams: 0")
+                _set_label_state(self.stats_labels['bitstreams'], "muted")
                 logging.info("📊 Project status display reset to default values")
                 return
             
@@ -3899,18 +3775,20 @@ class MainWindow(QMainWindow):
                     logging.info(f"✅ Successfully loaded project: {project_name}")
                     logging.info(f"📍 Project path: {project_path}")
                     self.project_name_label.setText(f"Project: {project_name}")
-                    self.project_name_label.setStyleSheet("color: #4CAF50;")
+                    _set_label_state(self.project_name_label, "ok")
                     self.project_path_label.setText(f"Path: {project_path}")
                 else:
                     logging.error("❌ Failed to load project configuration from HierarchyManager")
                     self.project_name_label.setText("Project: Error loading")
-                    self.project_name_label.setStyleSheet("color: #F44336;")
+                    _set_label_state(self.project_name_label, "error")
                     self.project_path_label.setText("Path: Check project configuration")
                 
                 # Update files tree
                 logging.info("🗂️ Updating project files tree...")
                 self.files_tree.clear()
                 files_info = hierarchy.get_source_files_info()
+                # Category items are built detached and inserted in one batch
+                category_items = []
                 
                 # Add source files
                 if files_info.get("src"):
@@ -3936,8 +3814,7 @@ class MainWindow(QMainWindow):
                         file_item.setForeground(0, QColor("#ffffff"))
                         file_item.setForeground(1, QColor("#4CAF50" if file_exists else "#F44336"))
                         src_item.addChild(file_item)
-                    self.files_tree.addTopLevelItem(src_item)
-                    src_item.setExpanded(True)
+                    category_items.append(src_item)
                 
                 # Add testbench files
                 if files_info.get("testbench"):
@@ -3963,8 +3840,7 @@ class MainWindow(QMainWindow):
                         file_item.setForeground(0, QColor("#ffffff"))
                         file_item.setForeground(1, QColor("#4CAF50" if file_exists else "#F44336"))
                         tb_item.addChild(file_item)
-                    self.files_tree.addTopLevelItem(tb_item)
-                    tb_item.setExpanded(True)
+                    category_items.append(tb_item)
                 
                 # Add top-level files
                 if files_info.get("top"):
@@ -3984,8 +3860,7 @@ class MainWindow(QMainWindow):
                         file_item.setForeground(0, QColor("#ffffff"))
                         file_item.setForeground(1, QColor("#4CAF50" if os.path.exists(file_path) else "#F44336"))
                         top_item.addChild(file_item)
-                    self.files_tree.addTopLevelItem(top_item)
-                    top_item.setExpanded(True)
+                    category_items.append(top_item)
                 
                 # Add implementation outputs
                 implementation_outputs = self._find_implementation_outputs()
@@ -4047,8 +3922,11 @@ class MainWindow(QMainWindow):
                         
                         impl_item.addChild(design_item)
                     
-                    self.files_tree.addTopLevelItem(impl_item)
-                    impl_item.setExpanded(True)
+                    category_items.append(impl_item)
+                
+                self.files_tree.addTopLevelItems(category_items)
+                for category_item in category_items:
+                    category_item.setExpanded(True)
                 
                 # Ensure proper column sizing after adding files
                 self.files_tree.resizeColumnToContents(0)  # Auto-resize file name column
@@ -4082,18 +3960,18 @@ class MainWindow(QMainWindow):
                 missing_count = stats['missing_files']
                 self.stats_labels['missing'].setText(f"Missing: {missing_count}")
                 if missing_count > 0:
-                    self.stats_labels['missing'].setStyleSheet("color: #F44336;")
+                    _set_label_state(self.stats_labels['missing'], "error")
                     logging.warning(f"⚠️ {missing_count} files are missing!")
                 else:
-                    self.stats_labels['missing'].setStyleSheet("color: #4CAF50;")
+                    _set_label_state(self.stats_labels['missing'], "ok")
                     logging.info("✅ All project files are present")
                 
                 # Update implementation statistics
                 self.stats_labels['implemented'].setText(f"Implemented: {impl_count}")
-                self.stats_labels['implemented'].setStyleSheet("color: #4CAF50;" if impl_count > 0 else "color: #888888;")
+                _set_label_state(self.stats_labels['implemented'], "ok" if impl_count > 0 else "muted")
                 
                 self.stats_labels['bitstreams'].setText(f"Bitstreams: {bitstream_count}")
-                self.stats_labels['bitstreams'].setStyleSheet("color: #4CAF50;" if bitstream_count > 0 else "color: #888888;")
+                _set_label_state(self.stats_labels['bitstreams'], "ok" if bitstream_count > 0 else "muted")
                 
                 logging.info("✅ Project status refresh completed successfully")
                     
@@ -4108,7 +3986,7 @@ class MainWindow(QMainWindow):
             logging.error(f"Error refreshing project status: {e}")
             logging.error(f"Full traceback: {error_details}")
             self.project_name_label.setText("Project: Error loading")
-            self.project_name_label.setStyleSheet("color: #F44336;")
+            _set_label_state(self.project_name_label, "error")
             self.project_path_label.setText("Path: Check project configuration")
     
     def create_synthesis_status_widget(self):
@@ -4314,10 +4192,6 @@ class MainWindow(QMainWindow):
         self.simulation_status_timer = QTimer()
         self.simulation_status_timer.timeout.connect(self.refresh_simulation_status)
         
-        # Initialize selected testbench and simulation
-        self.selected_testbench = None
-        self.selected_testbench_item = None
-        self.selected_simulation_item = None
         # self.simulation_status_timer.start(30000)  # Auto-refresh disabled - use manual refresh button instead
         
         return status_group
@@ -4444,10 +4318,6 @@ class MainWindow(QMainWindow):
         self.upload_status_timer = QTimer()
         self.upload_status_timer.timeout.connect(self.refresh_upload_status)
         
-        # Initialize selected bitstream
-        self.selected_bitstream = None
-        self.selected_bitstream_item = None
-        
         # Initialize upload activity indicator
         self.upload_activity_timer = QTimer()
         self.upload_activity_timer.timeout.connect(self._blink_upload_activity)
@@ -4460,6 +4330,10 @@ class MainWindow(QMainWindow):
     
     def refresh_simulation_status(self):
         """Refresh the simulation status display."""
+        # The Simulation tab is built on first visit and refreshes itself then
+        if not hasattr(self, 'simulation_tree'):
+            return
+        
         try:
             logging.info("🔄 Refreshing simulation status...")
             
@@ -4965,6 +4839,10 @@ class MainWindow(QMainWindow):
     
     def refresh_synthesis_status(self):
         """Refresh the synthesis status display."""
+        # The Synthesis tab is built on first visit and refreshes itself then
+        if not hasattr(self, 'synthesis_tree'):
+            return
+        
         try:
             logging.info("🔄 Refreshing synthesis status...")
             
@@ -5698,7 +5576,7 @@ class MainWindow(QMainWindow):
             background-color: #555555;
         }
         """
-        self.setStyleSheet(style)
+        self.setStyleSheet(style + _SHARED_QSS)
     
     def setup_logging(self):
         """Setup logging to redirect to the GUI output window."""
@@ -6340,9 +6218,8 @@ class MainWindow(QMainWindow):
                 return
             
             # Load project configuration to find log directory
-            import yaml
             with open(hierarchy.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_SafeLoader)
             
             # Look for project manager log file
             project_log_path = None
@@ -6460,7 +6337,7 @@ class MainWindow(QMainWindow):
         # Log content area
         log_text_widget = QTextEdit()
         log_text_widget.setReadOnly(True)
-        log_text_widget.setFont(QFont("Consolas", 9))
+        log_text_widget.setFont(_FONT_CODE)
         log_text_widget.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -6617,7 +6494,6 @@ class MainWindow(QMainWindow):
         """Clear the project log file and refresh the display."""
         try:
             # Ask for confirmation before clearing
-            from PyQt5.QtWidgets import QMessageBox
             reply = QMessageBox.question(
                 text_widget.parent(),
                 "Clear Project Log",
@@ -6643,7 +6519,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logging.error(f"❌ Error clearing project log: {e}")
             # Show error message
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(
                 text_widget.parent(),
                 "Error Clearing Log",
@@ -6655,11 +6530,13 @@ class MainWindow(QMainWindow):
         logging.info("Refreshing project status display...")
         self.refresh_project_status()
     
-    def find_project_config(self, search_dir=None):
+    def find_project_config(self, search_dir=None, search_subdirs=True):
         """Find project configuration file in the given directory or current working directory.
         
         Args:
             search_dir: Directory to search in (default: current working directory)
+            search_subdirs: Walk all subdirectories if the directory and its config
+                subdirectory hold no project configuration
             
         Returns:
             tuple: (project_config_path, project_dir) or (None, None) if not found
@@ -6688,6 +6565,9 @@ class MainWindow(QMainWindow):
             except OSError:
                 pass
         
+        if not search_subdirs:
+            return None, None
+        
         # Walk subdirectories as last resort
         try:
             for root, dirs, files in os.walk(search_dir):
@@ -6912,7 +6792,6 @@ class MainWindow(QMainWindow):
                     logging.info("-" * 80)
                     logging.info("🛠️  INITIALIZING YOSYS SYNTHESIZER...")
                     
-                    from cc_project_manager_pkg.yosys_commands import YosysCommands
                     yosys = YosysCommands(
                         strategy=synthesis_params['strategy'],
                         vhdl_std=vhdl_standard,
@@ -7035,7 +6914,6 @@ class MainWindow(QMainWindow):
         """Store synthesis result information for display in the tree."""
         try:
             # Get or create synthesis results file
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             config_dir = tcm.config["project_structure"]["config"][0] if isinstance(tcm.config["project_structure"]["config"], list) else tcm.config["project_structure"]["config"]
             
@@ -7044,9 +6922,8 @@ class MainWindow(QMainWindow):
             # Load existing results or create new
             synthesis_results = {}
             if os.path.exists(synthesis_results_path):
-                import yaml
                 with open(synthesis_results_path, 'r') as f:
-                    synthesis_results = yaml.safe_load(f) or {}
+                    synthesis_results = yaml.load(f, Loader=_SafeLoader) or {}
             
             # Store the result
             synthesis_results[entity_name] = {
@@ -7056,7 +6933,6 @@ class MainWindow(QMainWindow):
             }
             
             # Save results
-            import yaml
             with open(synthesis_results_path, 'w') as f:
                 yaml.dump(synthesis_results, f, default_flow_style=False)
                 
@@ -7068,16 +6944,14 @@ class MainWindow(QMainWindow):
     def _load_synthesis_results(self):
         """Load synthesis results from the results file."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             config_dir = tcm.config["project_structure"]["config"][0] if isinstance(tcm.config["project_structure"]["config"], list) else tcm.config["project_structure"]["config"]
             
             synthesis_results_path = os.path.join(config_dir, "synthesis_results.yml")
             
             if os.path.exists(synthesis_results_path):
-                import yaml
                 with open(synthesis_results_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                    return yaml.load(f, Loader=_SafeLoader) or {}
             
             return {}
             
@@ -7139,9 +7013,6 @@ class MainWindow(QMainWindow):
             bool: True if saved successfully, False otherwise
         """
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
-            import yaml
-            
             tcm = ToolChainManager()
             
             # Get synthesis options file path
@@ -7159,7 +7030,7 @@ class MainWindow(QMainWindow):
             # Load existing synthesis options
             if os.path.exists(synthesis_options_path):
                 with open(synthesis_options_path, 'r') as f:
-                    synthesis_options = yaml.safe_load(f)
+                    synthesis_options = yaml.load(f, Loader=_SafeLoader)
             else:
                 # Create basic structure if file doesn't exist
                 synthesis_options = {
@@ -7178,7 +7049,6 @@ class MainWindow(QMainWindow):
             # Check if strategy already exists
             if strategy_name in synthesis_options['synthesis_strategies']:
                 # Ask user if they want to overwrite
-                from PyQt5.QtWidgets import QMessageBox
                 reply = QMessageBox.question(
                     self, 
                     "Strategy Exists", 
@@ -7201,7 +7071,7 @@ class MainWindow(QMainWindow):
                 f.write("# These settings will be used as fallback values when no custom configuration is set\n\n")
                 
                 # Write YAML content
-                yaml.safe_dump(synthesis_options, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(synthesis_options, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
             
             logging.info(f"✅ Custom strategy '{strategy_name}' saved to {synthesis_options_path}")
             return True
@@ -7220,9 +7090,6 @@ class MainWindow(QMainWindow):
             list: List of custom command-line options for the strategy, or empty list
         """
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
-            import yaml
-            
             tcm = ToolChainManager()
             
             # Get synthesis options file path
@@ -7240,7 +7107,7 @@ class MainWindow(QMainWindow):
             # Load synthesis options
             if os.path.exists(synthesis_options_path):
                 with open(synthesis_options_path, 'r') as f:
-                    synthesis_options = yaml.safe_load(f)
+                    synthesis_options = yaml.load(f, Loader=_SafeLoader)
                 
                 if (synthesis_options and 
                     'synthesis_strategies' in synthesis_options and 
@@ -7269,9 +7136,8 @@ class MainWindow(QMainWindow):
                 return
             
             # Load project configuration
-            import yaml
             with open(hierarchy.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_SafeLoader)
             
             # Get yosys log file path
             yosys_log_path = None
@@ -7367,7 +7233,7 @@ class MainWindow(QMainWindow):
         # Log content area
         log_text_widget = QTextEdit()
         log_text_widget.setReadOnly(True)
-        log_text_widget.setFont(QFont("Consolas", 9))
+        log_text_widget.setFont(_FONT_CODE)
         log_text_widget.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -7520,7 +7386,6 @@ class MainWindow(QMainWindow):
         """Clear the synthesis log file and refresh the display."""
         try:
             # Ask for confirmation before clearing
-            from PyQt5.QtWidgets import QMessageBox
             reply = QMessageBox.question(
                 text_widget.parent(),
                 "Clear Synthesis Log",
@@ -7546,7 +7411,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logging.error(f"❌ Error clearing synthesis log: {e}")
             # Show error message
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(
                 text_widget.parent(),
                 "Error Clearing Log",
@@ -8107,9 +7971,8 @@ class MainWindow(QMainWindow):
                 return
             
             # Load project configuration
-            import yaml
             with open(hierarchy.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_SafeLoader)
             
             # Get pnr log file path
             pnr_log_path = None
@@ -8207,7 +8070,7 @@ class MainWindow(QMainWindow):
         # Log content area
         log_text_widget = QTextEdit()
         log_text_widget.setReadOnly(True)
-        log_text_widget.setFont(QFont("Consolas", 9))
+        log_text_widget.setFont(_FONT_CODE)
         log_text_widget.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -8394,7 +8257,6 @@ class MainWindow(QMainWindow):
         """Clear the implementation log file and refresh the display."""
         try:
             # Ask for confirmation before clearing
-            from PyQt5.QtWidgets import QMessageBox
             reply = QMessageBox.question(
                 text_widget.parent(),
                 "Clear Implementation Log",
@@ -8420,7 +8282,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logging.error(f"❌ Error clearing implementation log: {e}")
             # Show error message
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(
                 text_widget.parent(),
                 "Error Clearing Log",
@@ -8432,8 +8293,7 @@ class MainWindow(QMainWindow):
         """View detailed timing analysis report for the selected design."""
         if not self.selected_design:
             logging.warning("⚠️ No design selected for timing analysis")
-            self.selected_design_status.setText("Please click on an implemented design in the Design/File container above")
-            self.selected_design_status.setStyleSheet("color: #FF9800; font-size: 11px; margin-top: 5px;")
+            self._set_design_status("Please click on an implemented design in the Design/File container above", "warning")
             return
             
         try:
@@ -8491,8 +8351,7 @@ class MainWindow(QMainWindow):
         """View resource utilization report for the selected design."""
         if not self.selected_design:
             logging.warning("⚠️ No design selected for utilization analysis")
-            self.selected_design_status.setText("Please click on an implemented design in the Design/File container above")
-            self.selected_design_status.setStyleSheet("color: #FF9800; font-size: 11px; margin-top: 5px;")
+            self._set_design_status("Please click on an implemented design in the Design/File container above", "warning")
             return
             
         try:
@@ -8544,8 +8403,7 @@ class MainWindow(QMainWindow):
         """View placement and routing details for the selected design."""
         if not self.selected_design:
             logging.warning("⚠️ No design selected for placement analysis")
-            self.selected_design_status.setText("Please click on an implemented design in the Design/File container above")
-            self.selected_design_status.setStyleSheet("color: #FF9800; font-size: 11px; margin-top: 5px;")
+            self._set_design_status("Please click on an implemented design in the Design/File container above", "warning")
             return
             
         try:
@@ -8602,7 +8460,7 @@ class MainWindow(QMainWindow):
         logging.info("🧪 Opening behavioral simulation configuration...")
         
         # Show simulation configuration dialog
-        dialog = SimulationRunDialog(self, simulation_type="behavioral")
+        dialog = SimulationRunDialog(self, simulation_type="behavioral", selected_testbench=self.selected_testbench)
         if dialog.exec_() != QDialog.Accepted:
             logging.info("Behavioral simulation cancelled by user")
             return
@@ -8682,7 +8540,7 @@ class MainWindow(QMainWindow):
         logging.info("🔬 Opening post-synthesis simulation configuration...")
         
         # Show simulation configuration dialog
-        dialog = SimulationRunDialog(self, simulation_type="post-synthesis")
+        dialog = SimulationRunDialog(self, simulation_type="post-synthesis", selected_testbench=self.selected_testbench)
         if dialog.exec_() != QDialog.Accepted:
             logging.info("Post-synthesis simulation cancelled by user")
             return
@@ -8803,7 +8661,7 @@ class MainWindow(QMainWindow):
                 "save_waveforms": True
             }
         
-        dialog = SimulationConfigDialog(self, current_config)
+        dialog = SimulationFormatDialog(self, current_config)
         if dialog.exec_() == QDialog.Accepted:
             config = dialog.get_config()
             # Save the configuration
@@ -8889,7 +8747,7 @@ class MainWindow(QMainWindow):
         ghdl_layout.addWidget(ghdl_header)
         
         # GHDL log content
-        ghdl_text = LogTextWidget()
+        ghdl_text = LogTextWidget(max_lines=0)
         ghdl_layout.addWidget(ghdl_text)
         
         # GHDL log controls
@@ -9205,6 +9063,17 @@ Simulation Options:
     def on_tab_changed(self, index):
         """Handle tab change events to automatically refresh tab content."""
         try:
+            self._ensure_tab_built(index)
+            
+            # Catch up on status refreshes requested while the panel was hidden
+            if self._project_refresh_dirty and self._is_on_current_tab(self.project_status_widget):
+                self._project_refresh_dirty = False
+                self.refresh_project_status()
+            if (self._toolchain_refresh_dirty and hasattr(self, 'status_widget')
+                    and self._is_on_current_tab(self.status_widget)):
+                self._toolchain_refresh_dirty = False
+                self.refresh_toolchain_status()
+            
             # Get the tab text to identify which tab was selected
             tab_text = self.tab_widget.tabText(index)
             
@@ -9220,6 +9089,10 @@ Simulation Options:
     # Upload Methods
     def refresh_upload_status(self):
         """Refresh the upload status display."""
+        # The Upload tab is built on first visit and refreshes itself then
+        if not hasattr(self, 'bitstream_tree'):
+            return
+        
         try:
             logging.info("🔄 Refreshing upload status...")
             
@@ -9323,6 +9196,10 @@ Simulation Options:
     
     def refresh_upload_status_without_device_check(self):
         """Refresh upload status without running device detection (device status already updated)."""
+        # The Upload tab is built on first visit and refreshes itself then
+        if not hasattr(self, 'bitstream_tree'):
+            return
+        
         try:
             logging.info("🔄 Refreshing upload status (skipping device check)...")
             
@@ -9421,7 +9298,6 @@ Simulation Options:
             
             # Load statistics from file
             if os.path.exists(stats_file_path):
-                import json
                 with open(stats_file_path, 'r') as f:
                     stats_data = json.load(f)
                 
@@ -9436,7 +9312,6 @@ Simulation Options:
                 logging.info(f"📊 Loaded upload statistics: SRAM={stats_data.get('sram_uploads', 0)}, Flash={stats_data.get('flash_uploads', 0)}, Last={stats_data.get('last_upload', 'Never')}")
             else:
                 # Create empty stats file if it doesn't exist
-                import json
                 os.makedirs(os.path.dirname(stats_file_path), exist_ok=True)
                 default_stats = {
                     "sram_uploads": 0,
@@ -9485,7 +9360,6 @@ Simulation Options:
                 stats_file_path = os.path.join(os.getcwd(), 'logs', 'upload_stats.json')
             
             # Load existing statistics
-            import json
             if os.path.exists(stats_file_path):
                 with open(stats_file_path, 'r') as f:
                     stats_data = json.load(f)
@@ -9815,7 +9689,6 @@ Simulation Options:
                         )
                     return
 
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             if tcm.check_tool_version("openfpgaloader"):
                 self.openfpgaloader_status_label.setText("openFPGALoader: ✅ Available")
@@ -10102,8 +9975,8 @@ Simulation Options:
         layout.addLayout(search_layout)
         
         # Log content area
-        upload_text = LogTextWidget()
-        upload_text.setFont(QFont("Consolas", 10))
+        upload_text = LogTextWidget(max_lines=0)
+        upload_text.setFont(_FONT_CODE_LARGE)
         layout.addWidget(upload_text)
         
         # Button layout
@@ -10285,7 +10158,6 @@ Simulation Options:
         """Check toolchain availability."""
         def check_tools():
             logging.info("Checking toolchain availability...")
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             overall_status = tcm.check_toolchain()
             
@@ -10406,6 +10278,10 @@ Simulation Options:
             
             self.worker_thread.terminate()
         
+        # Tool checks are short; give a running one the chance to finish
+        if self._tool_probe_thread is not None and not self._tool_probe_thread.wait(3000):
+            self._tool_probe_thread.terminate()
+        
         self._stop_auto_folder_scan()
         event.accept()
     
@@ -10413,7 +10289,6 @@ Simulation Options:
     def _get_synthesis_configuration(self):
         """Get the current synthesis configuration from project config."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             config = tcm.config
             
@@ -10450,7 +10325,6 @@ Simulation Options:
     def _load_synthesis_defaults(self):
         """Load synthesis defaults from synthesis_options.yml or return hardcoded defaults."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             
             # Check if synthesis_options_file is defined in project config
@@ -10467,9 +10341,8 @@ Simulation Options:
             
             # Try to load from synthesis_options.yml
             if os.path.exists(synthesis_options_path):
-                import yaml
                 with open(synthesis_options_path, 'r') as f:
-                    synthesis_options = yaml.safe_load(f)
+                    synthesis_options = yaml.load(f, Loader=_SafeLoader)
                     
                 if synthesis_options and "synthesis_defaults" in synthesis_options:
                     defaults = synthesis_options["synthesis_defaults"]
@@ -10481,15 +10354,13 @@ Simulation Options:
             else:
                 # If synthesis_options.yml doesn't exist, try to create it by instantiating YosysCommands
                 try:
-                    from cc_project_manager_pkg.yosys_commands import YosysCommands
                     # This will create the synthesis_options.yml file
                     yosys_temp = YosysCommands()
                     
                     # Try loading again after creation
                     if os.path.exists(synthesis_options_path):
-                        import yaml
                         with open(synthesis_options_path, 'r') as f:
-                            synthesis_options = yaml.safe_load(f)
+                            synthesis_options = yaml.load(f, Loader=_SafeLoader)
                             
                         if synthesis_options and "synthesis_defaults" in synthesis_options:
                             defaults = synthesis_options["synthesis_defaults"]
@@ -10518,16 +10389,14 @@ Simulation Options:
     def _save_synthesis_configuration(self, config_dict):
         """Save synthesis configuration to project config."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             
             # Update the synthesis configuration section
             tcm.config["synthesis_configuration"] = config_dict
             
             # Write back to config file
-            import yaml
             with open(tcm.config_path, "w") as config_file:
-                yaml.safe_dump(tcm.config, config_file)
+                yaml.dump(tcm.config, config_file, Dumper=_SafeDumper)
                 
             return True
             
@@ -10538,7 +10407,6 @@ Simulation Options:
     def _get_simulation_configuration(self):
         """Get the current simulation configuration from project config."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             config = tcm.config
             
@@ -10575,7 +10443,6 @@ Simulation Options:
     def _load_simulation_defaults(self):
         """Load simulation defaults or return hardcoded defaults."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             
             # Check if simulation_config.yml exists
@@ -10586,9 +10453,8 @@ Simulation Options:
                 simulation_config_path = os.path.join(config_dir, "simulation_config.yml")
             
             if os.path.exists(simulation_config_path):
-                import yaml
                 with open(simulation_config_path, 'r') as f:
-                    sim_config_file = yaml.safe_load(f)
+                    sim_config_file = yaml.load(f, Loader=_SafeLoader)
                 
                 if sim_config_file and "default_simulation_settings" in sim_config_file:
                     defaults = sim_config_file["default_simulation_settings"]
@@ -10617,7 +10483,6 @@ Simulation Options:
     def _save_simulation_configuration(self, config_dict):
         """Save simulation configuration to project config."""
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             
             # Update the simulation configuration section
@@ -10630,9 +10495,8 @@ Simulation Options:
             }
             
             # Write back to config file
-            import yaml
             with open(tcm.config_path, "w") as config_file:
-                yaml.safe_dump(tcm.config, config_file)
+                yaml.dump(tcm.config, config_file, Dumper=_SafeDumper)
                 
             return True
             
@@ -10803,7 +10667,6 @@ Simulation Options:
         """Check for synthesis output files."""
         output_files = []
         try:
-            from cc_project_manager_pkg.toolchain_manager import ToolChainManager
             tcm = ToolChainManager()
             synth_dir = tcm.config["project_structure"]["synth"][0] if isinstance(tcm.config["project_structure"]["synth"], list) else tcm.config["project_structure"]["synth"]
             
@@ -10951,6 +10814,10 @@ Simulation Options:
     
     def refresh_implementation_status(self):
         """Refresh the implementation status display."""
+        # The Implementation tab is built on first visit and refreshes itself then
+        if not hasattr(self, 'implementation_tree'):
+            return
+        
         try:
             logging.info("🔄 Refreshing implementation status...")
             
@@ -11437,7 +11304,7 @@ Simulation Options:
         # Content area
         content_widget = QTextEdit()
         content_widget.setReadOnly(True)
-        content_widget.setFont(QFont("Consolas", 9))
+        content_widget.setFont(_FONT_CODE)
         content_widget.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -12237,6 +12104,15 @@ For more accurate power analysis:
         except Exception as e:
             logging.error(f"Error clearing item highlighting: {e}")
     
+    def _set_design_status(self, text, state=""):
+        """Show text in the selected design status label.
+        
+        ``state`` ("ok", "warning" or "" for neutral) picks the label color
+        from the shared stylesheet.
+        """
+        self.selected_design_status.setText(text)
+        _set_label_state(self.selected_design_status, state)
+    
     def _on_design_selection_changed(self, design_name):
         """Handle design selection change from Design/File container."""
         if design_name:
@@ -12287,11 +12163,9 @@ For more accurate power analysis:
                 status_parts.append("Bitstream")
             
             if status_parts:
-                self.selected_design_status.setText(f"Status: {' + '.join(status_parts)}")
-                self.selected_design_status.setStyleSheet("color: #4CAF50; font-size: 11px; margin-top: 5px;")
+                self._set_design_status(f"Status: {' + '.join(status_parts)}", "ok")
             else:
-                self.selected_design_status.setText("Status: Not implemented")
-                self.selected_design_status.setStyleSheet("color: #888888; font-size: 11px; margin-top: 5px;")
+                self._set_design_status("Status: Not implemented")
                 
         except Exception as e:
             logging.error(f"Error updating design status: {e}")
@@ -12331,7 +12205,7 @@ class FPGABoardSelectionDialog(QDialog):
         
         # Title and description
         title = QLabel("FPGA Board Selection")
-        title.setFont(QFont("Arial", 14, QFont.Bold))
+        title.setFont(_FONT_HEADER)
         title.setStyleSheet("color: #4CAF50; margin-bottom: 10px;")
         main_layout.addWidget(title)
         
@@ -12414,7 +12288,7 @@ class FPGABoardSelectionDialog(QDialog):
         self.results_text.setMinimumHeight(150)  # Reduced height for left panel
         self.results_text.setMaximumHeight(200)  # Constrain to fit with board details
         self.results_text.setReadOnly(True)
-        self.results_text.setFont(QFont("Consolas", 9))
+        self.results_text.setFont(_FONT_CODE)
         self.results_text.setStyleSheet("""
             QTextEdit {
                 background-color: #1e1e1e;
@@ -12442,7 +12316,7 @@ class FPGABoardSelectionDialog(QDialog):
         # Board details display
         self.board_details_text = QTextEdit()
         self.board_details_text.setReadOnly(True)
-        self.board_details_text.setFont(QFont("Consolas", 9))
+        self.board_details_text.setFont(_FONT_CODE)
         self.board_details_text.setStyleSheet("""
             QTextEdit {
                 background-color: #2b2b2b;
@@ -12556,7 +12430,6 @@ class FPGABoardSelectionDialog(QDialog):
             return False, f"❌ Serial connection failed: {error}\n"
 
         from cc_project_manager_pkg.openfpgaloader_manager import OpenFPGALoaderManager
-        import subprocess
 
         upload_manager = OpenFPGALoaderManager(board_identifier=board_identifier)
         detect_cmd = [upload_manager.loader_access, "--detect", "-b", board_identifier]
@@ -12600,7 +12473,7 @@ class FPGABoardSelectionDialog(QDialog):
                     
             except Exception as e:
                 import logging
-                logging.error(f"Error populating board combo: {e}")
+                logging.error("Error populating board combo: %s", e)
                 # Fallback to default board
                 self.board_combo.addItem("Olimex GateMate EVB", "olimex_gatemateevb")
         else:
@@ -12725,12 +12598,11 @@ class FPGABoardSelectionDialog(QDialog):
             
         except Exception as e:
             import logging
-            logging.error(f"Error updating board details: {e}")
+            logging.error("Error updating board details: %s", e)
             self.board_details_text.setText(f"Error displaying board details: {str(e)}")
 
     def test_board_connection(self):
         """Test connection to the selected board."""
-        import subprocess
         import logging
 
         try:
@@ -12741,18 +12613,18 @@ class FPGABoardSelectionDialog(QDialog):
             self.test_connection_btn.setEnabled(False)
             self.results_text.clear()
             
-            logging.info(f"🔍 Testing board connection for {board_name}")
+            logging.info("🔍 Testing board connection for %s", board_name)
             success, output_text = self._run_connection_test()
             self.results_text.append(output_text)
 
             if success:
                 self.connection_status_label.setText("Connection: ✅ Connected")
                 self.connection_status_label.setStyleSheet("font-weight: bold; color: #4CAF50; margin: 5px 0px;")
-                logging.info(f"✅ Board connection test successful for {board_name}")
+                logging.info("✅ Board connection test successful for %s", board_name)
             else:
                 self.connection_status_label.setText("Connection: ❌ Failed")
                 self.connection_status_label.setStyleSheet("font-weight: bold; color: #F44336; margin: 5px 0px;")
-                logging.error(f"❌ Board connection test failed for {board_name}")
+                logging.error("❌ Board connection test failed for %s", board_name)
                 
         except subprocess.TimeoutExpired:
             self.connection_status_label.setText("Connection: ❌ Timeout")
@@ -12771,7 +12643,7 @@ class FPGABoardSelectionDialog(QDialog):
             self.connection_status_label.setText("Connection: ❌ Error")
             self.connection_status_label.setStyleSheet("font-weight: bold; color: #F44336; margin: 5px 0px;")
             self.results_text.append(f"❌ Error during connection test: {str(e)}")
-            logging.error(f"❌ Error in board connection test: {e}")
+            logging.error("❌ Error in board connection test: %s", e)
         
         finally:
             self.test_connection_btn.setEnabled(True)
@@ -12789,10 +12661,9 @@ class FPGABoardSelectionDialog(QDialog):
             # Build the scan command
             scan_cmd = [upload_manager.loader_access, "--scan-usb"]
             
-            import subprocess
             import logging
             
-            logging.info(f"🔍 Scanning USB devices: {' '.join(scan_cmd)}")
+            logging.info("🔍 Scanning USB devices: %s", ' '.join(scan_cmd))
             self.results_text.append(f"\nRunning: {' '.join(scan_cmd)}\n")
             
             try:
@@ -12808,7 +12679,7 @@ class FPGABoardSelectionDialog(QDialog):
                     output_text += f"Stderr:\n{result.stderr}\n"
                 
                 self.results_text.append(output_text)
-                logging.info(f"✅ USB scan completed - found {device_count} devices")
+                logging.info("✅ USB scan completed - found %s devices", device_count)
                 
             except subprocess.TimeoutExpired:
                 self.results_text.append("❌ USB scan timed out (30 seconds)")
@@ -12822,11 +12693,11 @@ class FPGABoardSelectionDialog(QDialog):
                     error_text += f"Error:\n{e.stderr}\n"
                 
                 self.results_text.append(error_text)
-                logging.error(f"❌ USB scan failed: {e}")
+                logging.error("❌ USB scan failed: %s", e)
                 
         except Exception as e:
             self.results_text.append(f"❌ Error during USB scan: {str(e)}")
-            logging.error(f"❌ Error in USB scan: {e}")
+            logging.error("❌ Error in USB scan: %s", e)
         
         finally:
             self.scan_usb_btn.setEnabled(True)
@@ -12834,7 +12705,6 @@ class FPGABoardSelectionDialog(QDialog):
     
     def apply_selection(self):
         """Apply the board selection and test connection automatically."""
-        import subprocess
         import logging
 
         try:
@@ -12846,7 +12716,7 @@ class FPGABoardSelectionDialog(QDialog):
             self.connection_status_label.setText("Connection: Testing...")
             self.connection_status_label.setStyleSheet("font-weight: bold; color: #FFA726; margin: 5px 0px;")
             
-            logging.info(f"🔍 Auto-testing board connection during apply for {board_name}")
+            logging.info("🔍 Auto-testing board connection during apply for %s", board_name)
             success, output_text = self._run_connection_test()
             self.results_text.append(output_text)
 
@@ -12947,7 +12817,7 @@ class CustomBoardDialog(QDialog):
         
         # Title
         title_label = QLabel("🔧 Add Custom Board Configuration")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label.setFont(_FONT_HEADER)
         title_label.setStyleSheet("color: #4CAF50; margin-bottom: 10px;")
         layout.addWidget(title_label)
         
@@ -13062,7 +12932,7 @@ class CustomBoardDialog(QDialog):
         manual_layout = QFormLayout(manual_frame)
         
         manual_title = QLabel("Manual Override:")
-        manual_title.setFont(QFont("Arial", 9, QFont.Bold))
+        manual_title.setFont(_FONT_CAPTION)
         manual_layout.addRow(manual_title)
         
         # USB device selection fields
@@ -13167,7 +13037,7 @@ class CustomBoardDialog(QDialog):
         self.add_btn = QPushButton("Add Board")
         self.add_btn.clicked.connect(self.validate_and_accept)
         self.add_btn.setDefault(True)
-        self.add_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        self.add_btn.setObjectName("accent-btn")
         
         button_layout.addWidget(cancel_btn)
         button_layout.addStretch()
@@ -13305,7 +13175,6 @@ class CustomBoardDialog(QDialog):
     
     def _scan_usb_devices_direct(self):
         """Direct USB scanning when OpenFPGALoaderManager can't be instantiated."""
-        import subprocess
         devices = []
         
         try:
@@ -13689,12 +13558,12 @@ class ImplementationStrategyDialog(QDialog):
         
         explain_btn = QPushButton("Explain Strategy")
         explain_btn.clicked.connect(self.show_strategy_explanation)
-        explain_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-weight: bold; }")
+        explain_btn.setObjectName("info-btn")
         
         self.run_btn = QPushButton("Run Implementation")
         self.run_btn.clicked.connect(self.accept)
         self.run_btn.setDefault(True)
-        self.run_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        self.run_btn.setObjectName("accent-btn")
         
         button_layout.addWidget(cancel_btn)
         button_layout.addWidget(explain_btn)
@@ -13727,7 +13596,7 @@ class ImplementationStrategyDialog(QDialog):
                 if idx >= 0:
                     self.constraints_combo.setCurrentIndex(idx)
         except Exception as e:
-            logging.debug(f"Could not pre-select recommended constraint file: {e}")
+            logging.debug("Could not pre-select recommended constraint file: %s", e)
 
     def _load_available_constraints(self):
         """Load available constraint files from the project.
@@ -13741,7 +13610,7 @@ class ImplementationStrategyDialog(QDialog):
             constraint_files = pnr.list_available_constraint_files()
             return constraint_files
         except Exception as e:
-            logging.error(f"Error loading constraint files: {e}")
+            logging.error("Error loading constraint files: %s", e)
             return []
 
     def _get_auto_detect_preview(self):
@@ -13771,7 +13640,7 @@ class ImplementationStrategyDialog(QDialog):
             return "No constraint files found"
             
         except Exception as e:
-            logging.debug(f"Error getting auto-detect preview: {e}")
+            logging.debug("Error getting auto-detect preview: %s", e)
             return "Error detecting constraint files"
     
     def _load_implementation_strategies(self):
@@ -13806,7 +13675,7 @@ class ImplementationStrategyDialog(QDialog):
             return strategies
             
         except Exception as e:
-            logging.error(f"Error loading implementation strategies: {e}")
+            logging.error("Error loading implementation strategies: %s", e)
             # Fallback to hardcoded strategies
             return {
                 "speed": "Optimize for maximum clock frequency and performance",
@@ -13821,7 +13690,8 @@ class ImplementationStrategyDialog(QDialog):
         """Show the strategy explanation dialog."""
         current_strategy = self.strategy_combo.currentData()
         dialog = ImplementationStrategyExplanationDialog(self, current_strategy)
-        dialog.exec_()
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.open()
     
     def get_implementation_params(self):
         """Get the implementation parameters from the dialog."""
@@ -13835,6 +13705,131 @@ class ImplementationStrategyDialog(QDialog):
         }
 
 
+# Detailed explanation of each implementation strategy
+_IMPL_STRATEGY_DESCRIPTIONS = {
+    "speed": """
+        <h3>Speed-Optimized Strategy</h3>
+        <p><strong>Goal:</strong> Maximize clock frequency and performance</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><strong>High effort levels:</strong> Uses maximum placement and routing effort</li>
+            <li><strong>Timing-driven:</strong> Prioritizes meeting timing constraints</li>
+            <li><strong>Performance focus:</strong> May use more resources for better speed</li>
+        </ul>
+        <p><strong>P&R Settings:</strong></p>
+        <ul>
+            <li>Effort: High</li>
+            <li>Place effort: High</li>
+            <li>Route effort: High</li>
+            <li>Timing-driven: Enabled</li>
+            <li>Congestion-driven: Disabled</li>
+        </ul>
+        <p><strong>Best for:</strong> High-performance designs where timing is critical</p>
+        <p><strong>Trade-offs:</strong> Longer implementation time, higher resource usage</p>
+    """,
+    "area": """
+        <h3>Area-Optimized Strategy</h3>
+        <p><strong>Goal:</strong> Minimize resource usage and area</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><strong>Resource efficiency:</strong> Focuses on using minimal LUTs and logic</li>
+            <li><strong>Congestion-aware:</strong> Helps with routing in dense designs</li>
+            <li><strong>Compact placement:</strong> Tries to place logic close together</li>
+        </ul>
+        <p><strong>P&R Settings:</strong></p>
+        <ul>
+            <li>Effort: Medium</li>
+            <li>Place effort: Medium</li>
+            <li>Route effort: Medium</li>
+            <li>Timing-driven: Disabled</li>
+            <li>Congestion-driven: Enabled</li>
+        </ul>
+        <p><strong>Best for:</strong> Designs with tight area constraints or fitting in smaller FPGAs</p>
+        <p><strong>Trade-offs:</strong> May sacrifice performance for area savings</p>
+    """,
+    "balanced": """
+        <h3>Balanced Strategy (Default)</h3>
+        <p><strong>Goal:</strong> Balance area and speed optimization</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><strong>Compromise approach:</strong> Good balance between area and performance</li>
+            <li><strong>Moderate effort:</strong> Reasonable implementation time</li>
+            <li><strong>Both optimizations:</strong> Considers timing and congestion</li>
+        </ul>
+        <p><strong>P&R Settings:</strong></p>
+        <ul>
+            <li>Effort: Medium</li>
+            <li>Place effort: Medium</li>
+            <li>Route effort: Medium</li>
+            <li>Timing-driven: Enabled</li>
+            <li>Congestion-driven: Enabled</li>
+        </ul>
+        <p><strong>Best for:</strong> General-purpose designs with no extreme constraints</p>
+        <p><strong>Trade-offs:</strong> Good compromise between area and speed</p>
+    """,
+    "power": """
+        <h3>Power-Optimized Strategy</h3>
+        <p><strong>Goal:</strong> Minimize power consumption</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><strong>Low-power placement:</strong> Reduces switching activity</li>
+            <li><strong>Conservative routing:</strong> Minimizes dynamic power</li>
+            <li><strong>Clock optimization:</strong> Reduces clock tree power</li>
+        </ul>
+        <p><strong>P&R Settings:</strong></p>
+        <ul>
+            <li>Effort: Medium</li>
+            <li>Place effort: Low</li>
+            <li>Route effort: Medium</li>
+            <li>Timing-driven: Disabled</li>
+            <li>Congestion-driven: Disabled</li>
+        </ul>
+        <p><strong>Best for:</strong> Battery-powered or low-power applications</p>
+        <p><strong>Trade-offs:</strong> May sacrifice performance for power savings</p>
+    """,
+    "congestion": """
+        <h3>Congestion-Optimized Strategy</h3>
+        <p><strong>Goal:</strong> Optimize for routing congestion relief</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><strong>Congestion analysis:</strong> Identifies and resolves routing bottlenecks</li>
+            <li><strong>Spread placement:</strong> Distributes logic to reduce congestion</li>
+            <li><strong>High effort routing:</strong> Tries harder to complete routing</li>
+        </ul>
+        <p><strong>P&R Settings:</strong></p>
+        <ul>
+            <li>Effort: High</li>
+            <li>Place effort: High</li>
+            <li>Route effort: High</li>
+            <li>Timing-driven: Disabled</li>
+            <li>Congestion-driven: Enabled</li>
+        </ul>
+        <p><strong>Best for:</strong> Dense designs with routing challenges</p>
+        <p><strong>Trade-offs:</strong> Longer implementation time, may impact timing</p>
+    """,
+    "custom": """
+        <h3>Custom Strategy</h3>
+        <p><strong>Goal:</strong> User-defined strategy with custom parameters</p>
+        <p><strong>Key Features:</strong></p>
+        <ul>
+            <li><strong>Flexible configuration:</strong> Allows custom P&R settings</li>
+            <li><strong>Advanced control:</strong> Fine-tune implementation parameters</li>
+            <li><strong>Expert mode:</strong> For experienced users</li>
+        </ul>
+        <p><strong>P&R Settings:</strong></p>
+        <ul>
+            <li>Effort: Medium (default)</li>
+            <li>Place effort: Medium (default)</li>
+            <li>Route effort: Medium (default)</li>
+            <li>Timing-driven: Enabled (default)</li>
+            <li>Congestion-driven: Enabled (default)</li>
+        </ul>
+        <p><strong>Best for:</strong> Advanced users who need precise control over implementation</p>
+        <p><strong>Trade-offs:</strong> Requires knowledge of P&R tool parameters</p>
+    """
+}
+
+
 class ImplementationStrategyExplanationDialog(QDialog):
     """Dialog for explaining implementation strategies."""
     
@@ -13852,7 +13847,7 @@ class ImplementationStrategyExplanationDialog(QDialog):
         
         # Title
         title = QLabel(f"Implementation Strategy: {self.strategy_name.title()}")
-        title.setFont(QFont("Arial", 16, QFont.Bold))
+        title.setFont(_FONT_TITLE)
         title.setAlignment(Qt.AlignCenter)
         title.setStyleSheet("color: #2196F3; margin: 10px;")
         layout.addWidget(title)
@@ -13877,130 +13872,8 @@ class ImplementationStrategyExplanationDialog(QDialog):
     
     def _get_strategy_description(self):
         """Get detailed description for the strategy."""
-        descriptions = {
-            "speed": """
-                <h3>Speed-Optimized Strategy</h3>
-                <p><strong>Goal:</strong> Maximize clock frequency and performance</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><strong>High effort levels:</strong> Uses maximum placement and routing effort</li>
-                    <li><strong>Timing-driven:</strong> Prioritizes meeting timing constraints</li>
-                    <li><strong>Performance focus:</strong> May use more resources for better speed</li>
-                </ul>
-                <p><strong>P&R Settings:</strong></p>
-                <ul>
-                    <li>Effort: High</li>
-                    <li>Place effort: High</li>
-                    <li>Route effort: High</li>
-                    <li>Timing-driven: Enabled</li>
-                    <li>Congestion-driven: Disabled</li>
-                </ul>
-                <p><strong>Best for:</strong> High-performance designs where timing is critical</p>
-                <p><strong>Trade-offs:</strong> Longer implementation time, higher resource usage</p>
-            """,
-            "area": """
-                <h3>Area-Optimized Strategy</h3>
-                <p><strong>Goal:</strong> Minimize resource usage and area</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><strong>Resource efficiency:</strong> Focuses on using minimal LUTs and logic</li>
-                    <li><strong>Congestion-aware:</strong> Helps with routing in dense designs</li>
-                    <li><strong>Compact placement:</strong> Tries to place logic close together</li>
-                </ul>
-                <p><strong>P&R Settings:</strong></p>
-                <ul>
-                    <li>Effort: Medium</li>
-                    <li>Place effort: Medium</li>
-                    <li>Route effort: Medium</li>
-                    <li>Timing-driven: Disabled</li>
-                    <li>Congestion-driven: Enabled</li>
-                </ul>
-                <p><strong>Best for:</strong> Designs with tight area constraints or fitting in smaller FPGAs</p>
-                <p><strong>Trade-offs:</strong> May sacrifice performance for area savings</p>
-            """,
-            "balanced": """
-                <h3>Balanced Strategy (Default)</h3>
-                <p><strong>Goal:</strong> Balance area and speed optimization</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><strong>Compromise approach:</strong> Good balance between area and performance</li>
-                    <li><strong>Moderate effort:</strong> Reasonable implementation time</li>
-                    <li><strong>Both optimizations:</strong> Considers timing and congestion</li>
-                </ul>
-                <p><strong>P&R Settings:</strong></p>
-                <ul>
-                    <li>Effort: Medium</li>
-                    <li>Place effort: Medium</li>
-                    <li>Route effort: Medium</li>
-                    <li>Timing-driven: Enabled</li>
-                    <li>Congestion-driven: Enabled</li>
-                </ul>
-                <p><strong>Best for:</strong> General-purpose designs with no extreme constraints</p>
-                <p><strong>Trade-offs:</strong> Good compromise between area and speed</p>
-            """,
-            "power": """
-                <h3>Power-Optimized Strategy</h3>
-                <p><strong>Goal:</strong> Minimize power consumption</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><strong>Low-power placement:</strong> Reduces switching activity</li>
-                    <li><strong>Conservative routing:</strong> Minimizes dynamic power</li>
-                    <li><strong>Clock optimization:</strong> Reduces clock tree power</li>
-                </ul>
-                <p><strong>P&R Settings:</strong></p>
-                <ul>
-                    <li>Effort: Medium</li>
-                    <li>Place effort: Low</li>
-                    <li>Route effort: Medium</li>
-                    <li>Timing-driven: Disabled</li>
-                    <li>Congestion-driven: Disabled</li>
-                </ul>
-                <p><strong>Best for:</strong> Battery-powered or low-power applications</p>
-                <p><strong>Trade-offs:</strong> May sacrifice performance for power savings</p>
-            """,
-            "congestion": """
-                <h3>Congestion-Optimized Strategy</h3>
-                <p><strong>Goal:</strong> Optimize for routing congestion relief</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><strong>Congestion analysis:</strong> Identifies and resolves routing bottlenecks</li>
-                    <li><strong>Spread placement:</strong> Distributes logic to reduce congestion</li>
-                    <li><strong>High effort routing:</strong> Tries harder to complete routing</li>
-                </ul>
-                <p><strong>P&R Settings:</strong></p>
-                <ul>
-                    <li>Effort: High</li>
-                    <li>Place effort: High</li>
-                    <li>Route effort: High</li>
-                    <li>Timing-driven: Disabled</li>
-                    <li>Congestion-driven: Enabled</li>
-                </ul>
-                <p><strong>Best for:</strong> Dense designs with routing challenges</p>
-                <p><strong>Trade-offs:</strong> Longer implementation time, may impact timing</p>
-            """,
-            "custom": """
-                <h3>Custom Strategy</h3>
-                <p><strong>Goal:</strong> User-defined strategy with custom parameters</p>
-                <p><strong>Key Features:</strong></p>
-                <ul>
-                    <li><strong>Flexible configuration:</strong> Allows custom P&R settings</li>
-                    <li><strong>Advanced control:</strong> Fine-tune implementation parameters</li>
-                    <li><strong>Expert mode:</strong> For experienced users</li>
-                </ul>
-                <p><strong>P&R Settings:</strong></p>
-                <ul>
-                    <li>Effort: Medium (default)</li>
-                    <li>Place effort: Medium (default)</li>
-                    <li>Route effort: Medium (default)</li>
-                    <li>Timing-driven: Enabled (default)</li>
-                    <li>Congestion-driven: Enabled (default)</li>
-                </ul>
-                <p><strong>Best for:</strong> Advanced users who need precise control over implementation</p>
-                <p><strong>Trade-offs:</strong> Requires knowledge of P&R tool parameters</p>
-            """
-        }
-        
-        return descriptions.get(self.strategy_name, f"<p>Description for {self.strategy_name} strategy not available.</p>")
+        return _IMPL_STRATEGY_DESCRIPTIONS.get(
+            self.strategy_name, f"<p>Description for {self.strategy_name} strategy not available.</p>")
 
 
 def main():
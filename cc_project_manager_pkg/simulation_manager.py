@@ -987,11 +987,15 @@ class SimulationManager(GHDLCommands):
         else:
             logging.info("GTKWave tool path structure already exists in project configuration")
     
-    def check_gtkwave(self) -> bool:
+    def check_gtkwave(self, path_available: Optional[bool] = None) -> bool:
         """
         Check if GTKWave is available through PATH or direct binary paths.
         Similar to ToolChainManager.check_toolchain()
         
+        Args:
+            path_available (Optional[bool]): Result of an earlier check_gtkwave_path()
+                to reuse instead of running GTKWave through PATH again
+        
         Returns:
             bool: True if GTKWave is available, False otherwise
         """
@@ -1000,7 +1004,9 @@ class SimulationManager(GHDLCommands):
         tool_status = {}
         
         # Check via PATH
-        if self.check_gtkwave_path():
+        if path_available is None:
+            path_available = self.check_gtkwave_path()
+        if path_available:
             tool_status["PATH"] = STATUS_OK
         else:
             logging.warning("GTKWave is unavailable through system PATH")
@@ -1019,21 +1025,26 @@ class SimulationManager(GHDLCommands):
         
         if path_status == STATUS_FAIL and binary_status == STATUS_FAIL:
             logging.error("GTKWave is not reachable through PATH or direct path. Configure GTKWave path.")
-            self.set_gtkwave_preference("undefined")
+            self._sync_gtkwave_preference("undefined")
             return False
         
         if path_status == STATUS_OK and binary_status == STATUS_OK:
             logging.info("GTKWave is available through both PATH and direct path")
-            self.set_gtkwave_preference("path")
+            self._sync_gtkwave_preference("path")
         elif path_status == STATUS_OK:
             logging.info("GTKWave is available through PATH")
-            self.set_gtkwave_preference("path")
+            self._sync_gtkwave_preference("path")
         elif binary_status == STATUS_OK:
             logging.info("GTKWave is available through direct path")
-            self.set_gtkwave_preference("direct")
+            self._sync_gtkwave_preference("direct")
         
         return True
     
+    def _sync_gtkwave_preference(self, preference: str) -> None:
+        """Store the preference found by check_gtkwave, without rewriting the config if it is unchanged."""
+        if self.project_config.get("gtkwave_preference") != preference.upper():
+            self.set_gtkwave_preference(preference)
+    
     def check_gtkwave_path(self) -> bool:
         """
         Check if GTKWave is available through the PATH environment variable
@@ -118,20 +118,17 @@ class ToolChainManager(HierarchyManager):
 
     def initialize_individual_tool_preferences(self):
         """Initialize individual tool preferences if they don't exist."""
-        if "cologne_chip_gatemate_tool_preferences" not in self.config:
-            self.config["cologne_chip_gatemate_tool_preferences"] = {}
-        
-        # Ensure all tools have a preference entry
-        for tool_name in self.__tool_chain:
-            if tool_name not in self.config["cologne_chip_gatemate_tool_preferences"]:
-                self.config["cologne_chip_gatemate_tool_preferences"][tool_name] = "PATH"
+        tool_prefs = self.config.setdefault("cologne_chip_gatemate_tool_preferences", {})
         
-        # Also initialize GTKWave preference
-        if "gtkwave" not in self.config["cologne_chip_gatemate_tool_preferences"]:
-            self.config["cologne_chip_gatemate_tool_preferences"]["gtkwave"] = "PATH"
+        # Ensure all tools (and GTKWave) have a preference entry
+        missing = [tool_name for tool_name in (*self.__tool_chain, "gtkwave")
+                   if tool_name not in tool_prefs]
+        for tool_name in missing:
+            tool_prefs[tool_name] = "PATH"
         
-        # Save configuration
-        self.update_config()
+        # Save configuration only if an entry was added
+        if missing:
+            self.update_config()
 
     def get_tool_preference(self, tool_name: str) -> str:
         """
@@ -199,6 +196,33 @@ class ToolChainManager(HierarchyManager):
         # Save configuration
         return self.update_config()
 
+    def set_tool_preferences(self, preferences: dict) -> bool:
+        """
+        Set the access preference for several tools and save the configuration once.
+        
+        Args:
+            preferences (dict): Tool name -> preference, as for set_tool_preference
+            
+        Returns:
+            bool: True if all preferences were valid and the configuration was saved
+        """
+        supported_preferences = ("PATH", "DIRECT", "UNDEFINED")
+        for tool_name, preference in preferences.items():
+            if preference.upper() not in supported_preferences:
+                logging.error(f"Invalid preference {preference} for {tool_name}. Must be one of: {supported_preferences}")
+                return False
+            if tool_name != "gtkwave" and tool_name not in self.__tool_chain:
+                logging.error(f"Unknown tool: {tool_name}")
+                return False
+        
+        tool_prefs = self.config.setdefault("cologne_chip_gatemate_tool_preferences", {})
+        for tool_name, preference in preferences.items():
+            tool_prefs[tool_name] = preference.upper()
+            logging.info(f"Set {tool_name} preference to {preference.upper()}")
+        
+        # Save configuration
+        return self.update_config()
+
     def check_tool_version_path(self, tool_name: str) -> bool:
         """Check if a specific tool is available through PATH."""
         if tool_name not in self.__tool_chain:
@@ -58,7 +58,7 @@ setup(
     },
     include_package_data=True,
     package_data={
-        "cc_project_manager_pkg": ["*.yml", "*.yaml"],
+        "cc_project_manager_pkg": ["*.yml", "*.yaml", "resources/*.tmpl"],
     },
     keywords="fpga vhdl synthesis simulation gatemate ghdl yosys gui pyqt5 jocrix",
     project_urls={